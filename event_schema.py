@@ -17,7 +17,9 @@ fail-fast with a clear error rather than render a half-built page.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields
+import pickle
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from typing import Any
 
 
@@ -379,5 +381,69 @@ def validate(ev: dict[str, Any]) -> EventModel:
     return m
 
 
+# ── Validation cache ─────────────────────────────────────────────────
+
+class _SharedEventModel(EventModel):
+    """EventModel handed out by validate_cached — shared between callers, so its
+    attributes are read-only (the class is swapped in after validate() built it,
+    which keeps validate() itself free of a per-assignment guard)."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}: "
+                                  "EventModel from validate_cached() is shared")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+_CACHE_SIZE = 256             # keys are the pickled events (~1–15 KB each)
+_validated: "OrderedDict[bytes, EventModel]" = OrderedDict()
+
+
+def _content_key(ev: dict[str, Any]) -> "bytes | None":
+    # The pickled dict IS the key: dict lookup hashes the bytes and compares them exactly
+    # on a match, so there is no digest to compute and no collision to trust. Pickle, not
+    # sorted JSON: for the same YAML file the key order is the file's order, and a
+    # canonical JSON dump costs MORE than validate() itself on the largest event. A
+    # different key order is only a miss, never a wrong hit.
+    try:
+        return pickle.dumps(ev, protocol=5)
+    except Exception:
+        return None
+
+
+def validate_cached(ev: dict[str, Any]) -> EventModel:
+    """validate(ev), memoised on a content hash of the raw dict.
+
+    Equal content — the same dict again, or data.yaml re-read by the preview on every
+    request — returns the model already built. Any change to the raw dict (in place or
+    not) changes the key, so the cache is bypassed, never stale. The model is built
+    from a private copy of the raw dict (unpickled from the key), so it shares no
+    nested object with any caller's dict: editing that dict later does not reach the
+    cached model. The returned model is shared and read-only (FrozenInstanceError on
+    assignment); nested lists/dicts must not be mutated. Invalid events are not
+    cached: each call raises again."""
+    key = _content_key(ev) if isinstance(ev, dict) else None
+    if key is None:
+        return validate(ev)
+    m = _validated.get(key)
+    if m is not None:
+        _validated.move_to_end(key)
+        return m
+    # validate() keeps the raw nested objects (pricing, cohort, extra) by reference;
+    # a model built from the caller's dict would follow its later in-place edits.
+    m = validate(pickle.loads(key))
+    m.__class__ = _SharedEventModel
+    _validated[key] = m
+    if len(_validated) > _CACHE_SIZE:
+        _validated.popitem(last=False)
+    return m
+
+
+def clear_validate_cache() -> None:
+    _validated.clear()
+
+
 __all__ = ["EventModel", "Section", "SectionPair", "OpenQuestion", "Signup",
-           "Contact", "AboutOrganizer", "InvalidEvent", "validate"]
+           "Contact", "AboutOrganizer", "InvalidEvent", "validate",
+           "validate_cached", "clear_validate_cache"]
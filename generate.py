@@ -28,7 +28,7 @@ import functools as _functools
 import html as _html
 import yaml
 from pathlib import Path, PurePosixPath
-from typing import Any, Callable, Iterable, NamedTuple
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple
 
 # Координата страницы — ОДИН дом на Систему (site_page). Генератор есть ПИШУЩИЙ, и
 # определением раскладки служит именно он: функция рядом с записями была бы второй копией.
@@ -39,7 +39,7 @@ _validate_event: Any
 InvalidEvent: Any
 EventModel: Any
 try:
-    from event_schema import validate as _validate_event, InvalidEvent, EventModel
+    from event_schema import validate_cached as _validate_event, InvalidEvent, EventModel
 except ImportError:
     # When generate.py is copied into a deployed repo (broadcast.update_site),
     # event_schema lives alongside via copy step — but if missing, fall back
@@ -52,6 +52,7 @@ except ImportError:
 import re as _re
 from dataclasses import dataclass, field as _dc_field
 from functools import lru_cache as _lru_cache
+from contextlib import contextmanager
 
 # ── HTML escape + RU-typography helpers (Inv-TYPO + XSS hygiene) ─────
 #
@@ -95,23 +96,25 @@ def _spec_fm(name: str) -> dict:
         return {}
 
 
+def _typo_rules_path(lang: str = "ru") -> "Path | None":
+    """Locate knowledge/system/typography/<lang>.yaml — search up from this file
+    (scripts/ → repo root → knowledge/). None when absent (deployed repo, offline)."""
+    here = Path(__file__).resolve()
+    for parent in (here.parent, *here.parents):
+        cand = parent / "knowledge" / "system" / "typography" / f"{lang}.yaml"
+        if cand.is_file():
+            return cand
+    return None
+
+
 def _load_typo_rules(lang: str = "ru") -> dict[str, Any]:
-    """Load typography rules from System knowledge.
+    """Typography rules from System knowledge — через TypographyEngine (один
+    разбор YAML на язык; повторный — только при смене mtime файла).
 
     Falls back to empty rules (no-op _typo) if the YAML is missing —
     allows offline / minimal-deploy scenarios to render without erroring.
     """
-    try:
-        import yaml as _yaml
-        # Search up from this file: scripts/ → repo root → knowledge/system/typography/
-        here = Path(__file__).resolve()
-        for parent in (here.parent, *here.parents):
-            cand = parent / "knowledge" / "system" / "typography" / f"{lang}.yaml"
-            if cand.is_file():
-                return _yaml.safe_load(cand.read_text(encoding="utf-8")) or {}
-    except Exception:
-        pass
-    return {}
+    return _TYPO_ENGINE.rules(lang)
 
 
 def _compile_typo_regexes(rules: dict[str, Any]) -> tuple[Any, ...]:
@@ -176,16 +179,317 @@ def _compile_typo_regexes(rules: dict[str, Any]) -> tuple[Any, ...]:
     return unit_re, prep_re, before_re, around_re, tuple(replacements), quote_re
 
 
-@_lru_cache(maxsize=16)
+def _compile_glue_re(rules: dict[str, Any]) -> "_re.Pattern[str] | None":
+    """Fused nbsp_before + nbsp_around pass: ONE scan replaces both `before_re` and
+    `around_re` with the single template `\\g<a>` + NBSP (unmatched group → "").
+
+    Exact (≡ before_re.sub then around_re.sub) while every nbsp_around token is ONE
+    non-space char: both passes only turn a literal space into NBSP, the lookahead
+    is never consumed, and a consumed «c␣» pair converts the same space the other
+    alternative would. Multi-char / whitespace tokens → None (two-pass fallback)."""
+    glue_before = [str(c) for c in (rules.get("nbsp_before") or [])]
+    glue_around = [str(c) for c in (rules.get("nbsp_around") or [])]
+    if not glue_around or any(len(c) != 1 or c.isspace() for c in glue_around):
+        return None
+    alt = "|".join(_re.escape(c) for c in [*glue_before, *glue_around])
+    alt2 = "|".join(_re.escape(c) for c in glue_around)
+    return _re.compile(rf" (?=(?:{alt}))|(?P<a>(?:{alt2})) ")
+
+
+# ── Build caches: one root for every derived file, outside the site repo ──
+#
+# generate.py is copied into deployed repos (broadcast.update_site commits and pushes the
+# tree), where no `/.cache/` ignore rule exists: a cache beside this file would be
+# published, and grows there with every generator edit. Derived files therefore live
+# under the user cache directory; $GENERATE_CACHE_DIR overrides it (CI, a scratch build).
+
+_CACHE_ENV = "GENERATE_CACHE_DIR"
+
+
+def _cache_root() -> Path:
+    """$GENERATE_CACHE_DIR, else $XDG_CACHE_HOME/site_generator, else ~/.cache/site_generator."""
+    import os as _os
+    override = _os.environ.get(_CACHE_ENV)
+    if override:
+        return Path(override).expanduser()
+    base = _os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser() / "site_generator"
+
+
+def _prune_lru(files: "Iterable[Path]", keep: int) -> int:
+    """Удалить всё, кроме `keep` самых свежих по mtime (попадание «трогает» файл, так что
+    mtime = последнее использование). Гонка с соседним процессом безвредна. → удалено."""
+    aged: list[tuple[float, Path]] = []
+    for f in files:
+        try:
+            aged.append((f.stat().st_mtime, f))
+        except OSError:
+            pass
+    if len(aged) <= keep:
+        return 0
+    aged.sort(reverse=True)
+    n = 0
+    for _mtime, f in aged[keep:]:
+        try:
+            f.unlink()
+            n += 1
+        except OSError:
+            pass
+    return n
+
+
+def _touch(path: Path) -> None:
+    """Отметить использование записи кэша (mtime → сейчас) для `_prune_lru`."""
+    import os as _os
+    try:
+        _os.utime(path)
+    except OSError:
+        pass
+
+
+# ── Rule pack: resolved typography data + regex sources, one file per language ──
+#
+# Startup used to parse <lang>.yaml, import spec_data and parse typography.md's
+# frontmatter (math_symbols, no_terminal_period_block, vulgar fractions) before the
+# first string could be typeset. The pack `<cache root>/rulepacks/<lang>.json` holds the
+# resolved data + compiled-regex sources; it is valid iff its `source_hash` equals the
+# sha256 over the source bytes (YAML ‖ Spec) and the generator's own source (the regex
+# sources are produced by `_compile_typo_regexes` / `_compile_glue_re`) — checking costs
+# three reads + a hash, no parse, no spec_data import. The pack is a local derivation,
+# never shipped: without a knowledge tree (deployed repo) the rules are empty, as they
+# were before the pack existed. A Spec that exists but cannot be read is not degraded
+# over — `_math_symbols_cfg` / `_no_terminal_period_cfg` raise, as they always did.
+
+_RULEPACK_FORMAT = 2
+_RULEPACK_STATUS: dict[str, str] = {}     # lang → "pack" | "built" | "empty"
+_RULEPACK_SPEC_ERRORS: dict[str, Exception] = {}   # lang → why its Spec was unreadable
+
+
+def _rulepack_dir() -> Path:
+    return _cache_root() / "rulepacks"
+
+
+def _typography_spec_path() -> "Path | None":
+    """knowledge/system/specifications/text/typography.md, searched up from this file."""
+    here = Path(__file__).resolve()
+    for parent in here.parents:
+        spec = parent / "knowledge" / "system" / "specifications" / "text" / "typography.md"
+        if spec.is_file():
+            return spec
+    return None
+
+
+def _typography_spec_enforcement(spec: Path) -> dict[str, Any]:
+    """typography.md::enforcement_data. Raises when the Spec cannot be read."""
+    from spec_data import split_frontmatter   # canonical line-boundary split
+    parts = split_frontmatter(spec.read_text(encoding="utf-8"))
+    if parts is None:
+        return {}
+    return (yaml.safe_load(parts[1]) or {}).get("enforcement_data") or {}
+
+
+def _rulepack_sources_hash(yaml_path: "Path | None", spec_path: "Path | None") -> str:
+    import hashlib as _hashlib
+    h = _hashlib.sha256(f"rulepack/{_RULEPACK_FORMAT}/{_generator_digest()}".encode())
+    for p in (yaml_path, spec_path):
+        h.update(b"\0")
+        h.update(p.read_bytes() if p is not None else b"\xe2\x88\x85")
+    return h.hexdigest()
+
+
+def _build_rulepack(lang: str, yaml_path: "Path | None", spec_path: "Path | None",
+                    source_hash: str) -> "tuple[dict[str, Any], bool]":
+    """Resolve a pack from sources → (pack, clean). `clean=False` (a source failed to
+    parse) ⇒ the degraded pack is used but never persisted. An unreadable YAML degrades
+    to no-op `_typo` (logged); an unreadable Spec is recorded in `_RULEPACK_SPEC_ERRORS`
+    and raised by the Spec readers (`_rulepack_spec`)."""
+    clean = True
+    rules: dict[str, Any] = {}
+    if yaml_path is not None:
+        try:
+            rules = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        except Exception as e:
+            _LOG.warning("typography rules %s unread (%s) — degrading to no-op _typo",
+                         yaml_path, type(e).__name__)
+            clean = False
+    spec: dict[str, Any] = {}
+    _RULEPACK_SPEC_ERRORS.pop(lang, None)
+    if spec_path is not None:
+        try:
+            spec = _typography_spec_enforcement(spec_path)
+        except Exception as e:
+            _RULEPACK_SPEC_ERRORS[lang] = e
+            clean = False
+    unit_re, prep_re, before_re, around_re, _pairs, quote_re = _compile_typo_regexes(rules)
+    def _src(p: "_re.Pattern[str] | None") -> "list[Any] | None":
+        return None if p is None else [p.pattern, p.flags]
+    pack = {
+        "format": _RULEPACK_FORMAT, "lang": lang,
+        "source_hash": source_hash, "version": source_hash[:16],
+        "typo_rules": rules,
+        "math_symbols": spec.get("math_symbols") or {},
+        "no_terminal_period_block": spec.get("no_terminal_period_block") or {},
+        "regex": {"unit": _src(unit_re), "prep": _src(prep_re),
+                  "before": _src(before_re), "around": _src(around_re),
+                  "quote": _src(quote_re[0]) if quote_re is not None else None,
+                  "glue": _src(_compile_glue_re(rules))},
+    }
+    return pack, clean
+
+
+def _rulepack(lang: str = "ru") -> dict[str, Any]:
+    """The validated rule pack for `lang` — from `<cache root>/rulepacks/<lang>.json` when
+    its source hash matches, else rebuilt from the knowledge tree and re-persisted."""
+    import json as _json
+    yaml_path, spec_path = _typo_rules_path(lang), _typography_spec_path()
+    if yaml_path is None and spec_path is None:
+        _RULEPACK_STATUS[lang] = "empty"
+        return _build_rulepack(lang, None, None, "0" * 64)[0] | {"version": "0"}
+    pack_path = _rulepack_dir() / f"{lang}.json"
+    cached = None
+    if pack_path.is_file():
+        try:
+            cached = _json.loads(pack_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            _LOG.warning("rule pack %s unreadable (%s) — rebuilding", pack_path, type(e).__name__)
+    source_hash = _rulepack_sources_hash(yaml_path, spec_path)
+    if (cached is not None and cached.get("format") == _RULEPACK_FORMAT
+            and cached.get("source_hash") == source_hash):
+        _RULEPACK_STATUS[lang] = "pack"
+        return cached
+    pack, clean = _build_rulepack(lang, yaml_path, spec_path, source_hash)
+    _RULEPACK_STATUS[lang] = "built"
+    if clean:
+        try:
+            _write(pack_path, _json.dumps(pack, ensure_ascii=False, indent=1, default=str))
+        except Exception as e:
+            _LOG.warning("rule pack %s not persisted (%s)", pack_path, type(e).__name__)
+    return pack
+
+
+def _rulepack_spec(key: str, lang: str = "ru") -> dict[str, Any]:
+    """typography.md::enforcement_data.<key>, read through the rule pack. A Spec that
+    exists but could not be read raises here — Spec-owned data has no silent fallback."""
+    pack = _rulepack(lang)
+    err = _RULEPACK_SPEC_ERRORS.get(lang)
+    if err is not None:
+        raise err
+    return pack.get(key) or {}
+
+
+def _rulepack_compiled(pack: dict[str, Any]) -> "tuple[tuple[Any, ...], _re.Pattern[str] | None]":
+    """Pack regex sources → (the `_compile_typo_regexes` tuple, fused glue regex)."""
+    rx = pack.get("regex") or {}
+    def _c(key: str) -> "_re.Pattern[str] | None":
+        src = rx.get(key)
+        return None if not src else _re.compile(src[0], src[1])
+    rules = pack.get("typo_rules") or {}
+    replacements = tuple((str(a), str(b)) for a, b in (rules.get("typo_replacements") or []))
+    outer = (rules.get("quotes") or {}).get("outer")
+    quote = _c("quote")
+    quote_re = (quote, outer[0], outer[1]) if quote is not None and outer and len(outer) == 2 else None
+    return (_c("unit"), _c("prep"), _c("before"), _c("around"), replacements, quote_re), _c("glue")
+
+
+class _TypoPack(NamedTuple):
+    """One language's typography rules as loaded: source coordinate + parsed data +
+    compiled regexes. `version` = rule-pack version, a content hash of the sources
+    (YAML ‖ typography Spec; stable across processes; "0" for the empty pack) —
+    downstream caches key on it."""
+    path: "Path | None"
+    mtime_ns: int
+    version: str
+    rules: dict[str, Any]
+    compiled: tuple[Any, ...]
+    outer_quotes: "tuple[str, str] | None"
+    glue_re: "_re.Pattern[str] | None"
+
+
+class TypographyEngine:
+    """Process-wide holder of per-language typography rules (Inv-TYPO).
+
+    Before: `_typo` called `_load_typo_rules(lang)` on EVERY string only to read the
+    guillemet pair — a parent-directory walk + full YAML parse per text field, on every
+    field of every landing; `_meta_join` the same. Now the rule file is located once,
+    parsed + compiled once, and re-read only when its mtime changes (a long-running
+    preview process picks up a rule edit without a restart; a batch build parses each
+    language exactly once). A missing file is remembered as the empty pack — `reload()`
+    re-runs the search.
+
+    Single instance `_TYPO_ENGINE`; `_typo`, `_t`, `_inline`, `_h`, `_meta_join`,
+    `_cookie_banner` all read through it.
+    """
+
+    def __init__(self) -> None:
+        self._packs: dict[str, _TypoPack] = {}
+
+    @staticmethod
+    def _build(lang: str, path: "Path | None") -> _TypoPack:
+        mtime_ns = 0
+        if path is not None:
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = -1
+        rp = _rulepack(lang)
+        rules = rp.get("typo_rules") or {}
+        compiled, glue_re = _rulepack_compiled(rp)
+        quotes = (rules.get("quotes") or {}).get("outer") or []
+        outer = (str(quotes[0]), str(quotes[1])) if len(quotes) == 2 else None
+        return _TypoPack(path, mtime_ns, str(rp.get("version") or "0"), rules,
+                         compiled, outer, glue_re)
+
+    def pack(self, lang: str = "ru") -> _TypoPack:
+        """The current pack for `lang`; one stat() per call, re-parse on mtime change."""
+        p = self._packs.get(lang)
+        if p is None:
+            p = self._packs[lang] = self._build(lang, _typo_rules_path(lang))
+            return p
+        if p.path is not None:
+            try:
+                mtime_ns = p.path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = -1
+            if mtime_ns != p.mtime_ns:
+                p = self._packs[lang] = self._build(lang, _typo_rules_path(lang))
+        return p
+
+    def rules(self, lang: str = "ru") -> dict[str, Any]:
+        return self.pack(lang).rules
+
+    def compiled(self, lang: str = "ru") -> tuple[Any, ...]:
+        return self.pack(lang).compiled
+
+    def outer_quotes(self, lang: str = "ru") -> "tuple[str, str] | None":
+        return self.pack(lang).outer_quotes
+
+    def meta_join(self, lang: str = "ru") -> dict[str, Any]:
+        return self.pack(lang).rules.get("meta_join") or {}
+
+    def version(self, lang: str = "ru") -> str:
+        return self.pack(lang).version
+
+    def reload(self, lang: "str | None" = None) -> None:
+        """Drop cached pack(s): next access re-locates + re-parses (e.g. a rule file
+        that did not exist at first access has since appeared)."""
+        if lang is None:
+            self._packs.clear()
+        else:
+            self._packs.pop(lang, None)
+
+
+_TYPO_ENGINE = TypographyEngine()
+
+
 def _typo_compiled(lang: str) -> tuple[Any, ...]:
-    """Per-language compiled NBSP regexes. Cached — first call per lang
-    loads YAML + compiles; subsequent calls reuse. Adding new language =
-    drop knowledge/system/typography/<lang>.yaml; no code change.
+    """Per-language compiled NBSP regexes — via TypographyEngine (first call per lang
+    loads YAML + compiles; subsequent calls reuse until the YAML's mtime changes).
+    Adding new language = drop knowledge/system/typography/<lang>.yaml; no code change.
 
     Spec: knowledge/system/specifications/text/typography.md
           (Inv-TYPO-no-hanging-words, Inv-TYPO-thin-space-numbers).
     """
-    return _compile_typo_regexes(_load_typo_rules(lang))
+    return _TYPO_ENGINE.compiled(lang)
 
 
 @_lru_cache(maxsize=1)
@@ -216,6 +520,11 @@ def _vulgar_fractions_apply(s: str) -> str:
     return _VULGAR_FRAC_RE.sub(repl, s)
 
 
+_DIGIT_RE = _re.compile(r"\d")
+_APOSTROPHE_RE = _re.compile(r"(\w)'(\w)")
+_EM_DASH_COMPOUND_RE = _re.compile(r"(?<=\w)—(?=\w)")
+
+
 def _typo(s: str, lang: str = "ru") -> str:
     """Apply typographic NBSP-glue per System rules (knowledge/system/typography).
 
@@ -227,55 +536,171 @@ def _typo(s: str, lang: str = "ru") -> str:
     Effect-supersystem: every text-bearing field across every projection
     typographically correct without per-page intervention. Rules — data
     (YAML, single SoT per lang); per `feedback_no_hardcode_through_abstractions`.
+
+    Compiled plan over the SAME passes in the SAME order as the pass-by-pass chain
+    it replaced (byte-identical; scripts/bench_typography.py proves it over every
+    data.yaml string). Each pass is gated by an exact necessary condition (its trigger char
+    absent ⇒ the pass is identity ⇒ skipped, no scan, no copy); before/around glue
+    fused into one scan (`_compile_glue_re`); quote pair-walk is a split/join, not
+    a per-char loop. Full single-regex fusion is NOT equivalent: passes feed each
+    other (unit glue emits the NBSP the preposition pass reads; the apostrophe
+    pass must see «2'» before the fraction pass eats the digit).
     """
     if not s:
         return s
-    unit_re, prep_re, before_re, around_re, replacements, quote_re = _typo_compiled(lang)
+    pack = _TYPO_ENGINE.pack(lang)
+    unit_re, prep_re, before_re, around_re, replacements, quote_re = pack.compiled
     out = s
-    if quote_re is not None:
+    if quote_re is not None and '"' in out:
         out = quote_re[0].sub(r"\1" + quote_re[1] + r"\2" + quote_re[2], out)
     for _a, _b in replacements:
-        out = out.replace(_a, _b)
-    if unit_re is not None:
+        if _a in out:
+            out = out.replace(_a, _b)
+    if unit_re is not None and _DIGIT_RE.search(out):
         out = unit_re.sub(r"\1" + _NBSP + r"\2", out)
     if prep_re is not None:
         out = prep_re.sub(r"\1" + _NBSP, out)
-    if before_re is not None:
-        out = before_re.sub(_NBSP, out)
-    if around_re is not None:
-        out = around_re.sub(r"\1" + _NBSP, out)
-    # Inv-TYPO-apostrophe-curly: straight ' → curly ’ (U+2019).
-    # Conservative: only between alphanumeric boundaries (don't touch code/quotes).
-    out = _re.sub(r"(\w)'(\w)", r"\1’\2", out, flags=_re.UNICODE)
-    # Inv-TYPO-typographic-quotes: ASCII " → locale's outer guillemets via pair-walk.
-    # Governing locale = text's overall locale (admin 2026-05-11). Pair-walk depth:
-    # 0 = next " is OPEN, 1 = next " is CLOSE. Idempotent (no ASCII " → no-op).
-    rules = _load_typo_rules(lang)
-    quotes = (rules.get("quotes") or {}).get("outer") or []
-    if quotes and len(quotes) == 2 and '"' in out:
-        q_open, q_close = quotes
-        buf, depth = [], 0
-        for ch in out:
-            if ch == '"':
-                buf.append(q_open if depth == 0 else q_close)
-                depth ^= 1
-            else:
-                buf.append(ch)
+    if " " in out:
+        if pack.glue_re is not None:
+            out = pack.glue_re.sub(r"\g<a>" + _NBSP, out)
+        else:
+            if before_re is not None:
+                out = before_re.sub(_NBSP, out)
+            if around_re is not None:
+                out = around_re.sub(r"\1" + _NBSP, out)
+    # Inv-TYPO-apostrophe-curly: straight ' → curly ’ (U+2019), between word chars only.
+    if "'" in out:
+        out = _APOSTROPHE_RE.sub(r"\1’\2", out)
+    # Inv-TYPO-typographic-quotes: pair-walk — even-indexed " opens, odd closes.
+    if pack.outer_quotes is not None and '"' in out:
+        q_open, q_close = pack.outer_quotes
+        parts = out.split('"')
+        buf = [parts[0]]
+        for i, part in enumerate(parts[1:]):
+            buf.append(q_close if i & 1 else q_open)
+            buf.append(part)
         out = "".join(buf)
-    # Inv-TYPO-em-dash-not-hyphen (compound case): «\w+—\w+» tight em-dash between
-    # word-chars (no surrounding spaces) = compound word with WRONG em-dash; fix к hyphen.
-    # Spaces around em-dash preserved (parenthetical/dialogue context).
-    out = _re.sub(r"(?<=\w)—(?=\w)", "-", out, flags=_re.UNICODE)
-    # Inv-TYPO-vulgar-fraction-glyph: «1/2» → «½», «3/4» → «¾», etc.
-    # Non-standard pairs (5/9, 7/13, …) → fraction-slash form `N⁄M`.
-    out = _vulgar_fractions_apply(out)
+    # Inv-TYPO-em-dash-not-hyphen (compound case) — «\w—\w» → hyphen.
+    if "—" in out:
+        out = _EM_DASH_COMPOUND_RE.sub("-", out)
+    # Inv-TYPO-vulgar-fraction-glyph: «1/2» → «½».
+    if "/" in out:
+        out = _vulgar_fractions_apply(out)
     # Inv-TYPO-en-dash-vs-em — Spec proof is `deferred` (Phase 3: text-scan + admin
     # discipline). The earlier eager `(\d)-(\d)→\1–\2` substitution mangled ISO dates
     # «2026-05-13»→«2026–05–13» and phone numbers system-wide; removed to match the Spec.
     return out
 
 
-def _t(s: Any) -> str:
+class _TypoMemo:
+    """Bounded LRU memo over the pure text renders `_t` / `_inline` / `_h`.
+
+    The same strings are typeset on every page — bio.title, «Программа», «Входит:»,
+    «Записаться», legal footer labels, organizer names. Rules are deterministic data,
+    so (kind, text, lang, rule-pack version) → html is safe to reuse; the version leg
+    (TypographyEngine content hash) retires stale entries after a rule edit.
+
+    `enabled=False` (or `typo_memo_disabled()`) → every call renders afresh — for tests
+    that patch typography rules. Counters read via `build_stats()["typo_memo"]`.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        from collections import OrderedDict
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[tuple[str, str, str, str], str]" = OrderedDict()
+        self.seeded = 0
+
+    def lookup(self, kind: str, text: str, lang: str,
+               render: "Callable[[str, str], str]") -> str:
+        if not self.enabled:
+            return render(text, lang)
+        key = (kind, text, lang, _TYPO_ENGINE.pack(lang).version)
+        hit = self._data.get(key)
+        if hit is not None:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return hit
+        self.misses += 1
+        out = self._data[key] = render(text, lang)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return out
+
+    def seed(self, kind: str, text: str, lang: str, rendered: str, version: str) -> None:
+        """Insert an already computed render (warm-up, see `typeset_warm`): an ordinary
+        LRU entry, evicted like any other; hit/miss counters untouched."""
+        if not self.enabled:
+            return
+        key = (kind, text, lang, version)
+        if key in self._data:
+            return
+        self._data[key] = rendered
+        self.seeded += 1
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def retire(self, lang: str, version: str) -> int:
+        """Drop `lang` entries of every other rule-pack version — after a rule edit they can
+        never hit again. → number dropped."""
+        stale = [k for k in self._data if k[2] == lang and k[3] != version]
+        for k in stale:
+            del self._data[k]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.seeded = 0
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {"enabled": self.enabled, "size": len(self._data), "maxsize": self.maxsize,
+                "seeded": self.seeded,
+                "hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0}
+
+
+_TYPO_MEMO = _TypoMemo()
+
+
+@contextmanager
+def typo_memo_disabled() -> "Iterator[None]":
+    """Render with the `_t`/`_inline`/`_h` memo bypassed (restores the prior state)."""
+    prev, _TYPO_MEMO.enabled = _TYPO_MEMO.enabled, False
+    try:
+        yield
+    finally:
+        _TYPO_MEMO.enabled = prev
+
+
+# Build-time cache/counter registry: name → zero-arg stats callable. One read seam
+# for every in-process cache of the generator (`build_stats()`).
+_BUILD_STATS: "dict[str, Callable[[], dict[str, Any]]]" = {
+    "typo_memo": _TYPO_MEMO.stats,
+    "rulepack": lambda: dict(_RULEPACK_STATUS),
+}
+
+
+def build_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of every registered build cache: size, hits/misses, hit rate."""
+    return {name: fn() for name, fn in _BUILD_STATS.items()}
+
+
+def _t_render(text: str, lang: str) -> str:
+    return _html.escape(_typo(text, lang), quote=True)
+
+
+def _h_render(text: str, lang: str) -> str:
+    return _typo(text, lang)
+
+
+def _inline_render(text: str, lang: str) -> str:
+    return _md_handwriting(_wrap_math_rel(_html.escape(_typo(text, lang), quote=True)))
+
+
+def _t(s: Any, lang: str = "ru") -> str:
     """Typography-fix + escape arbitrary text для safe HTML inclusion.
 
     Formal law: HTML := AttributeLanguage ⊔ BodyLanguage (disjoint grammars).
@@ -293,14 +718,14 @@ def _t(s: Any) -> str:
     enforced as formal law."""
     if s is None:
         return ""
-    return _html.escape(_typo(str(s)), quote=True)
+    return _TYPO_MEMO.lookup("t", str(s), lang, _t_render)
 
 
-def _h(s: Any) -> str:
+def _h(s: Any, lang: str = "ru") -> str:
     """Typography-fix + pass-through for fields with curated markup
     (admin-authored, schema-marked as carrying <strong>/<em>). Still
     scrubs None → ''."""
-    return "" if s is None else _typo(str(s))
+    return "" if s is None else _TYPO_MEMO.lookup("h", str(s), lang, _h_render)
 
 
 _HTML_TAG_RE = _re.compile(r"(<[^>]+>)")
@@ -358,11 +783,14 @@ def _prose_entity_links(s: str, d: dict[str, Any]) -> str:
         doc, frag = m.group(1).strip(), (m.group(2) or "").strip()
         caption = (m.group(3) or doc).strip()
         href = entity_address(d, doc)
+        if href and frag and fragment_known(href + frag) is False:
+            # Битый подтекст виден ПРИ СБОРКЕ, а не в мире; ссылка остаётся (на документ).
+            _LOG.warning("wikilink [[%s%s]]: якоря нет в индексе заголовков %s", doc, frag, href)
         return f'<a href="{_u(href + frag)}">{caption}</a>' if href else caption
     return link.WIKILINK.sub(_repl, s)
 
 
-def _inline(s: Any) -> str:
+def _inline(s: Any, lang: str = "ru") -> str:
     """Render text → BODY-safe HTML: html-escape + typographic normalisation (_typo) +
     math-rel wrap (Inv-TYPO-math-rel-aligned).
 
@@ -377,7 +805,7 @@ def _inline(s: Any) -> str:
 
     Earlier proper-noun marker (`*name*` → em.loc + graph-augment) retired 2026-05-12 —
     foreign-name highlighting decommissioned."""
-    return "" if not s else _md_handwriting(_wrap_math_rel(_html.escape(_typo(str(s)), quote=True)))
+    return "" if not s else _TYPO_MEMO.lookup("inline", str(s), lang, _inline_render)
 
 
 def _paras(text: Any) -> list[str]:
@@ -419,20 +847,11 @@ def _resolve_placeholders(text: str, ph: "dict[str, str]") -> str:
 def _no_terminal_period_cfg() -> "tuple[_re.Pattern[str], _re.Pattern[str] | None]":
     """Inv-TYPO-no-terminal-period-block — config from the Spec, NOT hardcoded here:
     knowledge/system/specifications/text/typography.md::enforcement_data.no_terminal_period_block
-    → (strip_re, keep_abbrev_re). Sole SoT for the char / abbreviation lists.
+    → (strip_re, keep_abbrev_re), read through the rule pack (`_rulepack`). Sole SoT
+    for the char / abbreviation lists.
     The block-size gate retired 2026-05-12 (admin «Развлечение» symptom) — rule fires
     on any non-empty paragraph chain's last element, including single-string fragments."""
-    here = Path(__file__).resolve()
-    cfg: dict[str, Any] = {}
-    for parent in here.parents:
-        spec = parent / "knowledge" / "system" / "specifications" / "text" / "typography.md"
-        if spec.is_file():
-            from spec_data import split_frontmatter   # canonical line-boundary split
-            parts = split_frontmatter(spec.read_text(encoding="utf-8"))
-            if parts is not None:
-                fm = yaml.safe_load(parts[1]) or {}
-                cfg = (fm.get("enforcement_data") or {}).get("no_terminal_period_block") or {}
-            break
+    cfg: dict[str, Any] = _rulepack_spec("no_terminal_period_block")
     strip_char = str(cfg.get("strip") or ".")
     abbrevs = list(cfg.get("keep_if_abbrev") or ["г", "гг", "руб", "р", "км", "м"])
     esc_strip = _re.escape(strip_char)            # «.» → «\.» — already a literal-match atom
@@ -464,19 +883,9 @@ def _math_symbols_cfg() -> dict[str, Any]:
     """Inv-TYPO-math-rel-aligned + Inv-TYPO-comparator-symbolic config from Spec:
     knowledge/system/specifications/text/typography.md::enforcement_data.math_symbols.
     Returns dict with relation_codepoints (list), comparator_glyphs (dict),
-    comparator_prose (dict[locale][comp]), css_class (str). Sole SoT — no hardcode."""
-    here = Path(__file__).resolve()
-    cfg: dict[str, Any] = {}
-    for parent in here.parents:
-        spec = parent / "knowledge" / "system" / "specifications" / "text" / "typography.md"
-        if spec.is_file():
-            from spec_data import split_frontmatter   # canonical line-boundary split
-            parts = split_frontmatter(spec.read_text(encoding="utf-8"))
-            if parts is not None:
-                fm = yaml.safe_load(parts[1]) or {}
-                cfg = (fm.get("enforcement_data") or {}).get("math_symbols") or {}
-            break
-    return cfg
+    comparator_prose (dict[locale][comp]), css_class (str). Sole SoT — no hardcode;
+    read through the rule pack (`_rulepack_spec`)."""
+    return _rulepack_spec("math_symbols")
 
 
 @_lru_cache(maxsize=1)
@@ -719,12 +1128,159 @@ _LANG_LABELS = {
 _ASSET_ROOT_KEY = "_asset_root"       # provenance, not content — see _owner_ships
 
 
-def load() -> dict[str, Any]:
-    data: dict[str, Any] = yaml.safe_load(DATA.read_text(encoding="utf-8"))
+# C-загрузчик libyaml, когда PyYAML собран с ним: та же safe-семантика, разбор в разы быстрее.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _DataSnapshotCache:
+    """Снимок разобранного data.yaml на диске: `<dir>/<sha256(байты ⊕ версия загрузчика)>.pickle`.
+
+    Попадание — `pickle.loads` вместо YAML-разбора целиком (каждый запуск, каждый GET превью,
+    каждая нога деплоя). Ключ — СОДЕРЖИМОЕ файла и версия загрузчика (PyYAML, C/Python,
+    протокол pickle), не mtime: копия data.yaml в tmp деплоя попадает в тот же снимок.
+    Каждый `load` отдаёт СВОЙ объект (unpickle) — производные индексы, которые рендер кладёт
+    в `d`, не протекают между загрузками. `enabled=False` — всегда разбор (тесты, бенч).
+    Каталог — в пользовательском кэше (`_cache_root`, 0700), не в дереве сайта: pickle
+    грузится только из места, куда пишет лишь сам пользователь."""
+
+    keep = 8                        # снимков на диске: давно не использованные вытесняются при записи
+
+    def __init__(self, root: "Path | None") -> None:
+        self.root = root
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def loader_version() -> str:
+        import pickle as _pickle
+        return f"pyyaml-{yaml.__version__}:{_YAML_LOADER.__name__}:pickle-{_pickle.HIGHEST_PROTOCOL}"
+
+    def load(self, path: Path) -> Any:
+        raw = path.read_bytes()
+        if not self.enabled or self.root is None:
+            return yaml.load(raw.decode("utf-8"), Loader=_YAML_LOADER)
+        import hashlib as _hashlib
+        import pickle as _pickle
+        snap = self.root / (_hashlib.sha256(raw + b"\0" + self.loader_version().encode())
+                            .hexdigest() + ".pickle")
+        try:
+            data = _pickle.loads(snap.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _LOG.warning("data snapshot %s unreadable (%s) — reparsing", snap.name, type(e).__name__)
+        else:
+            self.hits += 1
+            _touch(snap)                    # вытеснение — по последнему использованию
+            return data
+        self.misses += 1
+        data = yaml.load(raw.decode("utf-8"), Loader=_YAML_LOADER)
+        try:
+            self._store(snap, _pickle.dumps(data, protocol=_pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            _LOG.warning("data snapshot %s not written (%s)", snap.name, type(e).__name__)
+        return data
+
+    def _store(self, snap: Path, blob: bytes) -> None:
+        snap.parent.mkdir(mode=0o700, parents=True, exist_ok=True)   # снимки грузятся pickle'ом
+        _write(snap, blob)
+        _prune_lru(snap.parent.glob("*.pickle"), self.keep)
+
+    def stats(self) -> dict[str, Any]:
+        return {"enabled": self.enabled, "root": str(self.root) if self.root else None,
+                "loader": self.loader_version(), "hits": self.hits, "misses": self.misses}
+
+
+_DATA_SNAPSHOTS = _DataSnapshotCache(_cache_root() / "data-snapshots")
+_BUILD_STATS["data_snapshot"] = _DATA_SNAPSHOTS.stats
+
+
+def load(typeset: bool = False) -> dict[str, Any]:
+    """data.yaml → D. `typeset=True` also warms the `_t`/`_inline`/`_h` memo with the
+    prose of D (`typeset_warm`) — one batched typography pass at load.
+    Parsing goes through `_DATA_SNAPSHOTS` (C loader; pickled snapshot on a content hit)."""
+    data: dict[str, Any] = _DATA_SNAPSHOTS.load(DATA)
     data[_ASSET_ROOT_KEY] = str(DATA.parent)     # provenance: whence this record came
+    if typeset:
+        typeset_warm(data, (data.get("languages") or {}).get("host") or "ru")
     return data
 
 
+# Ключи, чьи строки — не проза страницы, а адреса, идентификаторы, перечисления, метки
+# времени и рабочие заметки данных: прогрев их не набирает (рендер их так не зовёт).
+_TYPESET_SKIP_KEYS = frozenset({
+    "id", "ids", "slug", "url", "link", "href", "src", "path", "image", "cover", "portrait",
+    "email", "mailto", "canonical", "redirect_from", "status", "stage", "kind", "type",
+    "role", "channel", "broadcast", "broadcasts", "surfaces", "format", "mode", "modes",
+    "currency", "country", "host", "language", "provider", "platform", "t_key", "t_end",
+    "date", "planned_date", "confirmed", "until", "owner", "owners", "organizers",
+    "partners", "collaborators", "locations", "location", "place", "waypoints", "venue",
+    "target_event", "parent_id", "skoro_state", "materials", "instagram", "username",
+    "note", "rationale", "evidence", "intent", "cause", "success_criteria", "utility_synopsis",
+})
+_TYPESET_SKIP_SUFFIXES = ("_id", "_ids", "_url", "_ref", "_at", "_ts", "_path", "_kind",
+                          "_state", "_type")
+
+
+def _is_prose(key: Any, text: str) -> bool:
+    """Строка D, которую рендер набирает: не служебный ключ и не адрес/идентификатор
+    (без пробела и без кириллицы — `paris-2026-09`, `2026-06-16`, `pending`)."""
+    if isinstance(key, str) and (key in _TYPESET_SKIP_KEYS
+                                 or key.endswith(_TYPESET_SKIP_SUFFIXES)):
+        return False
+    if "://" in text or text.startswith(("/", "#", "mailto:")):
+        return False
+    return any(c.isspace() or ord(c) > 0x7F for c in text)
+
+
+def typeset_warm(data: Any, lang: str = "ru") -> int:
+    """Warm the `_t`/`_inline`/`_h` memo with the prose leaves of D (and each blank-line
+    paragraph — the unit `_paras` hands to renderers) in ONE batched pass, so p_site,
+    p_event_landing and the rest find an event title typeset once instead of per page.
+
+    Bounded: entries are ordinary LRU entries (`_TypoMemo.seed`), and the pass stops at
+    half the memo so the warm-up never evicts itself. Entries of an older rule-pack
+    version are retired first. Ids, URLs, slugs, enums and timestamps are skipped
+    (`_is_prose`). Output is unchanged: a seeded form IS what the function would
+    compute (same rule-pack version in the key). → number of texts warmed."""
+    if not _TYPO_MEMO.enabled:
+        return 0
+    version = _TYPO_ENGINE.pack(lang).version
+    _TYPO_MEMO.retire(lang, version)
+    budget = _TYPO_MEMO.maxsize // 2 // 3          # три формы на текст
+    seen: set[str] = set()
+
+    def _forms(text: str) -> None:
+        # One _typo per text; the escape / wrap legs compose exactly as in
+        # _t_render / _inline_render.
+        if text in seen or len(seen) >= budget:
+            return
+        seen.add(text)
+        typo = _typo(text, lang)
+        html = _html.escape(typo, quote=True)
+        _TYPO_MEMO.seed("h", text, lang, typo, version)
+        _TYPO_MEMO.seed("t", text, lang, html, version)
+        _TYPO_MEMO.seed("inline", text, lang, _md_handwriting(_wrap_math_rel(html)), version)
+
+    def _walk(node: Any, key: Any = None) -> None:
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if not (isinstance(k, str) and k.startswith("_")):
+                    _walk(v, k)
+        elif isinstance(node, list):
+            for v in node:
+                _walk(v, key)
+        elif isinstance(node, str) and node and _is_prose(key, node):
+            for para in _paras(node):
+                if para != node:
+                    _forms(para)
+            _forms(node)
+
+    _walk(data)
+    return len(seen)
+
+
 def _owner_ships(d: dict[str, Any], filename: str) -> "bool | None":
     """Does this owner actually ship `filename` alongside their record?  None (⊥) = unknown.
 
@@ -1426,12 +1982,78 @@ observer.observe(footer);
 </script>"""
 
 
-def _layout(d: dict[str, Any], *, title: str, description: str, body: str,
-            nav: bool = False, canonical: str | None = None,
-            extra_head: str = "", footer: bool = True, structured: str | None = None,
-            surface: str = "", cookie_banner_enabled: bool = False, doc_menu: str = "",
-            banner: str = "", slug: str = "") -> str:
-    """`banner` — ШАПКА СТРАНИЦЫ, И ОНА НЕ ЕСТЬ СОДЕРЖАНИЕ.
+# Хвост каждой страницы — постоянный: окно видимости блоков и pageview-пинг.
+_LAYOUT_SCRIPTS = """<script>
+/* Display-window indicator 1[from ≤ now < until) per viewer clock
+   (Inv-STF-window-derived, surface-temporal-fixpoint.md). The reveal
+   (`data-visible-from`) is the exact dual of the original auto-hide
+   (`data-visible-until`, admin 2026-05-13: «пусть блок исчезнет после 20:30
+   по Москве») — one indicator covers both: a block appears at its window
+   start and disappears at its window end, so a page deployed before a
+   boundary still transitions at the precise moment without a redeploy.
+   Runs at page-load and every 30s thereafter — covers tabs left open across
+   a boundary. An unparseable/absent bound fails open on that side (a parse
+   error must never hide content). */
+(function(){
+  function _applyWindows(){
+    var nodes = document.querySelectorAll('[data-visible-until],[data-visible-from]');
+    var now = Date.now();
+    for (var i = 0; i < nodes.length; i++) {
+      var from = Date.parse(nodes[i].getAttribute('data-visible-from') || '');
+      var until = Date.parse(nodes[i].getAttribute('data-visible-until') || '');
+      var vis = (isNaN(from) || now >= from) && (isNaN(until) || now < until);
+      nodes[i].style.display = vis ? '' : 'none';
+    }
+  }
+  _applyWindows();
+  setInterval(_applyWindows, 30000);
+})();
+
+/* Pageview pingback — entity-statistics G-Set event (admin 2026-05-13 «считает
+   статистику»). One event per page-load → CF Worker /pv → DELA_STATS KV.
+   No cookies, no client-id; idempotency via cf-ray (CF generates per request).
+   No-op gracefully if Worker unreachable (sendBeacon + fallback fetch). */
+(function(){
+  var slug = (document.querySelector('meta[name="dela:slug"]') || {}).content;
+  if (!slug) return;
+  var payload = JSON.stringify({
+    p: slug,
+    r: (window.crypto && crypto.randomUUID) ? crypto.randomUUID() :
+       (Date.now() + '-' + Math.random().toString(36).slice(2)),
+    ref: document.referrer || ''
+  });
+  var url = 'https://dela-edge.azaryarozet.workers.dev/pv';
+  try {
+    var blob = new Blob([payload], { type: 'application/json' });
+    if (!navigator.sendBeacon || !navigator.sendBeacon(url, blob)) {
+      fetch(url, {
+        method: 'POST', body: payload, keepalive: true,
+        headers: { 'Content-Type': 'application/json' }
+      }).catch(function(){});
+    }
+  } catch (e) { /* swallow */ }
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def _layout(d: dict[str, Any], **kw: Any) -> str:
+    """Страница одной строкой — `"".join(_layout_fragments(...))`; аргументы те же."""
+    return "".join(_layout_fragments(d, **kw))
+
+
+def _layout_fragments(d: dict[str, Any], *, title: str, description: str,
+                      body: "str | Iterable[str]",
+                      nav: bool = False, canonical: str | None = None,
+                      extra_head: str = "", footer: bool = True, structured: str | None = None,
+                      surface: str = "", cookie_banner_enabled: bool = False, doc_menu: str = "",
+                      banner: str = "", slug: str = "") -> "list[str]":
+    """Страница как упорядоченные фрагменты: писатель отдаёт их `writelines`, не склеивая
+    (`_write`). `body` — строка или фрагменты; фрагмент не рвёт тег посередине.
+
+    `banner` — ШАПКА СТРАНИЦЫ, И ОНА НЕ ЕСТЬ СОДЕРЖАНИЕ.
 
     `<main>` есть ГОСПОДСТВУЮЩЕЕ СОДЕРЖАНИЕ документа; ориентир, который содержанием не
     является (баннер, навигация страницы), внутри него не живёт.  Пока страница отдавала
@@ -1495,7 +2117,8 @@ def _layout(d: dict[str, Any], *, title: str, description: str, body: str,
     # Условие ВЫВЕДЕНО из самого тела, а не объявлено флагом: страница, у которой
     # появится содержание, получит и хром — ничьей правкой. WCAG 2.4.1 не нарушается:
     # обязанность обойти блоки возникает вместе с блоками, которые надо обходить.
-    _has_body = bool(_re.sub(r"(?s)<[^>]+>", "", body or "").strip())
+    body = [body or ""] if isinstance(body, str) else list(body)
+    _has_body = any(_re.sub(r"(?s)<[^>]+>", "", frag).strip() for frag in body)
     skip_link = (f'<a class="skip-link" href="#main">{_typo("Перейти к содержанию")}</a>'
                  if _has_body else '')
     # Day/night toggle — chrome on every page that HAS content, regardless of `nav`
@@ -1513,77 +2136,13 @@ def _layout(d: dict[str, Any], *, title: str, description: str, body: str,
     # `editorial` = event-landings + static-pages (concrete-paper / Outremer).
     # Single SoT — no parallel `:root`/`:has(.article-wrapper)` cascade hack.
     surface_attr = f' data-surface="{_t(surface)}"' if surface else ''
-    return f"""<!DOCTYPE html>
-<html lang="{_t(lang)}"{surface_attr}>
-<head>
-{head}
-</head>
-<body>
-{skip_link}
-{nav_html}
-{theme_toggle}
-{doc_menu}
-{banner}
-<main id="main" role="main">
-{body}
-</main>
-{ftr}
-{cookie_banner}
-{media_ergonomics}
-<script>
-/* Display-window indicator 1[from ≤ now < until) per viewer clock
-   (Inv-STF-window-derived, surface-temporal-fixpoint.md). The reveal
-   (`data-visible-from`) is the exact dual of the original auto-hide
-   (`data-visible-until`, admin 2026-05-13: «пусть блок исчезнет после 20:30
-   по Москве») — one indicator covers both: a block appears at its window
-   start and disappears at its window end, so a page deployed before a
-   boundary still transitions at the precise moment without a redeploy.
-   Runs at page-load and every 30s thereafter — covers tabs left open across
-   a boundary. An unparseable/absent bound fails open on that side (a parse
-   error must never hide content). */
-(function(){{
-  function _applyWindows(){{
-    var nodes = document.querySelectorAll('[data-visible-until],[data-visible-from]');
-    var now = Date.now();
-    for (var i = 0; i < nodes.length; i++) {{
-      var from = Date.parse(nodes[i].getAttribute('data-visible-from') || '');
-      var until = Date.parse(nodes[i].getAttribute('data-visible-until') || '');
-      var vis = (isNaN(from) || now >= from) && (isNaN(until) || now < until);
-      nodes[i].style.display = vis ? '' : 'none';
-    }}
-  }}
-  _applyWindows();
-  setInterval(_applyWindows, 30000);
-}})();
-
-/* Pageview pingback — entity-statistics G-Set event (admin 2026-05-13 «считает
-   статистику»). One event per page-load → CF Worker /pv → DELA_STATS KV.
-   No cookies, no client-id; idempotency via cf-ray (CF generates per request).
-   No-op gracefully if Worker unreachable (sendBeacon + fallback fetch). */
-(function(){{
-  var slug = (document.querySelector('meta[name="dela:slug"]') || {{}}).content;
-  if (!slug) return;
-  var payload = JSON.stringify({{
-    p: slug,
-    r: (window.crypto && crypto.randomUUID) ? crypto.randomUUID() :
-       (Date.now() + '-' + Math.random().toString(36).slice(2)),
-    ref: document.referrer || ''
-  }});
-  var url = 'https://dela-edge.azaryarozet.workers.dev/pv';
-  try {{
-    var blob = new Blob([payload], {{ type: 'application/json' }});
-    if (!navigator.sendBeacon || !navigator.sendBeacon(url, blob)) {{
-      fetch(url, {{
-        method: 'POST', body: payload, keepalive: true,
-        headers: {{ 'Content-Type': 'application/json' }}
-      }}).catch(function(){{}});
-    }}
-  }} catch (e) {{ /* swallow */ }}
-}})();
-</script>
-</body>
-</html>
-"""
+    return [
+        f'<!DOCTYPE html>\n<html lang="{_t(lang)}"{surface_attr}>\n<head>\n', head,
+        "\n</head>\n<body>\n", skip_link, "\n", nav_html, "\n", theme_toggle, "\n",
+        doc_menu, "\n", banner, '\n<main id="main" role="main">\n', *body,
+        "\n</main>\n", ftr, "\n", cookie_banner, "\n", media_ergonomics, "\n",
+        _LAYOUT_SCRIPTS,
+    ]
 
 
 # ── Invariants ───────────────────────────────────────────────────────
@@ -1622,14 +2181,22 @@ def _effective_stage(event: dict[str, Any], now_iso: str | None = None) -> str:
     that day's 00:00. Defaults к the current UTC instant. Witness:
     tests/test_effective_stage_datetime_precise.py (cross-owner grid + live-2 pin).
     """
-    from datetime_parsers import anchor_dt, now_utc_naive, parse_iso_ts
-    stored = (event.get("status") or event.get("lifecycle", {}).get("stage") or "PLANNING")
+    if now_iso is None and _RENDER_CLOCK is not None:
+        return _RENDER_CLOCK.stage(event)
+    from datetime_parsers import now_utc_naive, parse_iso_ts
     if now_iso is None:
         now = now_utc_naive()
     else:
         now = parse_iso_ts(now_iso, naive_utc=True)
         if now is None:
-            return stored
+            return (event.get("status") or event.get("lifecycle", {}).get("stage") or "PLANNING")
+    return _stage_at(event, now)
+
+
+def _stage_at(event: dict[str, Any], now: Any) -> str:
+    """The stage-time law at an already-resolved naive-UTC instant (see _effective_stage)."""
+    from datetime_parsers import anchor_dt
+    stored = (event.get("status") or event.get("lifecycle", {}).get("stage") or "PLANNING")
     end = anchor_dt(event.get("t_end"), end=True)
     if end and now >= end:
         return "CONCLUDED"
@@ -1662,6 +2229,102 @@ def _all_stages_non_terminal() -> frozenset[str]:
                           "MOVEDONLINE", "CANCELLED", "ONGOING", "PLANNED"})
 
 
+# ── Render clock: one frozen «now» per build / preview request ──────
+
+class RenderClock:
+    """Одно «сейчас» на сборку и память стадий/видимости под ним.
+
+    Без часов каждый `visible` звал `now_utc_naive()` и заново разбирал t_key/t_end: сборка
+    видела россыпь чуть разных «сейчас» (событие, кончающееся посреди сборки, могло быть на
+    сайте и уже не быть в landing_section), а `sorted_events` спрашивал каждое событие дважды
+    (пул + член серии). Под часами все поверхности отвечают на ОДИН миг, а ответ помнится
+    на (событие, поверхность).
+
+    Память сверяется со снимком входов закона — status, lifecycle.stage, t_key, t_end,
+    broadcast (значения, не ссылки на вложенные dict): запись, правленная посреди запроса
+    (put объектного окна), пересчитывается, а не отдаётся устаревшей. Ключ — id(event) при удержании самого события: id не переиспользуется."""
+
+    def __init__(self, now: Any) -> None:
+        self.now = now                               # naive UTC, как now_utc_naive()
+        self._stages: dict[int, tuple[Any, ...]] = {}
+        self._visible: dict[tuple[int, str], tuple[Any, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _inputs(e: dict[str, Any]) -> tuple[Any, ...]:
+        # Значения, а не ссылки: dict `lifecycle`, правленный на месте, равен сам себе —
+        # в снимок идёт только то, что читает `_stage_at` (lifecycle.stage).
+        return (e.get("status"), (e.get("lifecycle") or {}).get("stage"),
+                e.get("t_key"), e.get("t_end"), tuple(e.get("broadcast") or ()))
+
+    def stage(self, e: dict[str, Any], inputs: "tuple[Any, ...] | None" = None) -> str:
+        inputs = self._inputs(e) if inputs is None else inputs
+        hit = self._stages.get(id(e))
+        if hit is not None and hit[0] is e and hit[1] == inputs:
+            self.hits += 1
+            return hit[2]
+        self.misses += 1
+        stage = _stage_at(e, self.now)
+        self._stages[id(e)] = (e, inputs, stage)
+        return stage
+
+    def visible(self, e: dict[str, Any], surface: str) -> bool:
+        inputs = self._inputs(e)
+        hit = self._visible.get((id(e), surface))
+        if hit is not None and hit[0] is e and hit[1] == inputs:
+            self.hits += 1
+            return hit[2]
+        ok = (surface in inputs[4]
+              and self.stage(e, inputs) in _renderable_for().get(surface, _all_stages_non_terminal()))
+        self._visible[id(e), surface] = (e, inputs, ok)
+        return ok
+
+    def stats(self) -> dict[str, Any]:
+        return {"now": self.now.isoformat(), "stages": len(self._stages),
+                "visible": len(self._visible), "hits": self.hits, "misses": self.misses}
+
+
+_RENDER_CLOCK: "RenderClock | None" = None
+
+
+@contextmanager
+def render_clock(now_iso: str | None = None) -> "Iterator[RenderClock]":
+    """Заморозить «сейчас» на время блока (сборка, запрос превью):
+
+        with render_clock():
+            build(d)
+
+    Внутри `_effective_stage`/`visible` без явного `now_iso` отвечают на этот миг и помнят
+    ответ; явный `now_iso` по-прежнему спрашивает закон напрямую. Вложенный `render_clock()`
+    без аргумента — те же часы (внешняя сборка задаёт миг), с аргументом — свои на блок.
+    Рабочие пула (fork) наследуют часы родителя — и миг у них тот же."""
+    global _RENDER_CLOCK
+    if now_iso is None and _RENDER_CLOCK is not None:
+        yield _RENDER_CLOCK
+        return
+    from datetime_parsers import now_utc_naive, parse_iso_ts
+    now = now_utc_naive() if now_iso is None else parse_iso_ts(now_iso, naive_utc=True)
+    if now is None:
+        raise ValueError(f"render_clock: unparseable now_iso {now_iso!r}")
+    prev, _RENDER_CLOCK = _RENDER_CLOCK, RenderClock(now)
+    try:
+        yield _RENDER_CLOCK
+    finally:
+        _RENDER_CLOCK = prev
+
+
+def _render_now() -> Any:
+    """The build's «now»: the render clock's instant, else the current UTC instant."""
+    if _RENDER_CLOCK is not None:
+        return _RENDER_CLOCK.now
+    from datetime_parsers import now_utc_naive
+    return now_utc_naive()
+
+
+_BUILD_STATS["render_clock"] = lambda: _RENDER_CLOCK.stats() if _RENDER_CLOCK else {"now": None}
+
+
 # The ONE owner of the stage-time law, exported for non-site surfaces (venture
 # tree-Table, …): they must NEVER re-derive CONCLUDED themselves (Inv-EV-stage-
 # time-derived has a single realization; a second spelling = drift).
@@ -1678,6 +2341,8 @@ def visible(e: dict[str, Any], surface: str, now_iso: str | None = None) -> bool
     ОДНО событие — и, в частности, тому, кто КВАНТИФИЦИРУЕТ по σ, — приходилось писать те же
     две строки самому, а два написания одного закона расходятся ровно тогда, когда таблица
     `renderable_for` пополнится. Ныне список есть свёртка предиката, и второго чтения нет."""
+    if now_iso is None and _RENDER_CLOCK is not None:
+        return _RENDER_CLOCK.visible(e, surface)
     if surface not in (e.get("broadcast") or []):
         return False
     allowed = _renderable_for().get(surface, _all_stages_non_terminal())
@@ -1710,6 +2375,94 @@ def broadcast_retraction() -> "tuple[str, list]":
     return "broadcast", []
 
 
+# ── Graph index: one immutable index per loaded snapshot ─────────────
+
+_GRAPH_INDEX_KEY = "_graph_index"     # derived per-snapshot index, not content — see graph_index
+_EMPTY: "tuple[Any, ...]" = ()
+
+
+class GraphIndex(NamedTuple):
+    """Обратные и прямые рёбра графа `d`, построенные ОДИН раз на снимок — вместо линейного
+    прохода по `events`/`publications` на каждый вопрос (`next(e for e in d["events"] …)`
+    на каждую посадочную, `any(…)` на каждого родителя серии). Значения — кортежи в порядке
+    объявления (порядок автора сохраняется), отображения — только для чтения."""
+    events_by_id: "Mapping[str, tuple[dict[str, Any], ...]]"       # str(id) → все носители id
+    children: "Mapping[Any, tuple[dict[str, Any], ...]]"           # parent_id → под-события
+    by_series: "Mapping[Any, tuple[dict[str, Any], ...]]"          # event_series → события
+    pubs_by_target: "Mapping[tuple[Any, Any], tuple[dict[str, Any], ...]]"  # (target_event, kind)
+    pubs_by_channel: "Mapping[Any, tuple[dict[str, Any], ...]]"
+    pubs_newest_first: "tuple[dict[str, Any], ...]"                # порядок ленты p_publications
+    events_by_person: "Mapping[str, tuple[dict[str, Any], ...]]"   # organizers
+    events_by_location: "Mapping[str, tuple[dict[str, Any], ...]]"  # events[].locations
+    events_by_place: "Mapping[str, tuple[dict[str, Any], ...]]"    # schedule beats ⊔ route_map
+
+    def event(self, event_id: Any) -> "dict[str, Any] | None":
+        """Первое событие с этим id (как `next(e for e in events if …)`), None — нет такого."""
+        hit = self.events_by_id.get(str(event_id))
+        return hit[0] if hit else None
+
+    def publications(self, target_event: Any, kind: Any) -> "tuple[dict[str, Any], ...]":
+        return self.pubs_by_target.get((target_event, kind), _EMPTY)
+
+
+def _pub_feed_key(p: dict[str, Any]) -> tuple[str]:
+    return (p.get("uploaded_at", "") or p.get("date", ""),)
+
+
+def graph_index(d: dict[str, Any]) -> GraphIndex:
+    """GraphIndex снимка `d`. Живёт в самом `d`, как `landing_children`: годен, пока списки
+    `events`/`publications` — те же объекты той же длины (превью читает d заново на каждый
+    GET; правка записи на месте — это новая загрузка, не мутация)."""
+    from types import MappingProxyType
+    events = d.get("events") or []
+    pubs = d.get("publications") or []
+    memo = d.get(_GRAPH_INDEX_KEY)
+    if (memo is not None and memo["events"] is events and memo["n_events"] == len(events)
+            and memo["pubs"] is pubs and memo["n_pubs"] == len(pubs)):
+        return memo["index"]
+
+    def add(table: dict[Any, list[Any]], key: Any, value: Any) -> None:
+        table.setdefault(key, []).append(value)
+
+    by_id: dict[str, list[Any]] = {}
+    children: dict[Any, list[Any]] = {}
+    by_series: dict[Any, list[Any]] = {}
+    by_person: dict[str, list[Any]] = {}
+    by_location: dict[str, list[Any]] = {}
+    by_place: dict[str, list[Any]] = {}
+    for e in events:
+        add(by_id, str(e.get("id")), e)
+        if "parent_id" in e:
+            add(children, e["parent_id"], e)
+        if e.get("event_series") is not None:
+            add(by_series, e["event_series"], e)
+        for pid in dict.fromkeys(x for x in (e.get("organizers") or []) if isinstance(x, str)):
+            add(by_person, pid, e)
+        for lid in dict.fromkeys(x for x in (e.get("locations") or []) if isinstance(x, str)):
+            add(by_location, lid, e)
+        beat_places = (b.get("place") for s in ((e.get("schedule") or {}).get("slots") or [])
+                       for b in (s.get("beats") or []))
+        waypoints = (e.get("route_map") or {}).get("waypoints") or []
+        for pl in dict.fromkeys(x for x in (*beat_places, *waypoints) if isinstance(x, str)):
+            add(by_place, pl, e)
+    by_target: dict[tuple[Any, Any], list[Any]] = {}
+    by_channel: dict[Any, list[Any]] = {}
+    for p in pubs:
+        add(by_target, (p.get("target_event"), p.get("kind")), p)
+        add(by_channel, p.get("channel"), p)
+
+    def frozen(table: dict[Any, list[Any]]) -> "Mapping[Any, tuple[Any, ...]]":
+        return MappingProxyType({k: tuple(v) for k, v in table.items()})
+
+    index = GraphIndex(
+        frozen(by_id), frozen(children), frozen(by_series), frozen(by_target),
+        frozen(by_channel), tuple(sorted(pubs, key=_pub_feed_key, reverse=True)),
+        frozen(by_person), frozen(by_location), frozen(by_place))
+    d[_GRAPH_INDEX_KEY] = {"events": events, "n_events": len(events),
+                           "pubs": pubs, "n_pubs": len(pubs), "index": index}
+    return index
+
+
 def series_representation(d: dict[str, Any],
                           member: "Callable[[dict], bool]") -> dict[str, str]:
     """ПРЕДСТАВИТЕЛЬСТВО СЕРИИ — ЕДИНСТВЕННЫЙ ДОМ закона Inv-EV-parent-resolves:
@@ -1732,16 +2485,25 @@ def series_representation(d: dict[str, Any],
     Прежде правило было ВКЛАДЫШЕМ внутри `sorted_events` — тем самым классом, который эта пара
     дверей уже сняла с ворот видимости (см. `visible`): закон, доступный лишь тому, кому нужен
     СПИСОК для ОДНОГО названного канала. Агрегат «Скоро» (σ связан квантором) спросить его не
-    мог — и не спрашивал."""
-    import collections
-    children = collections.defaultdict(list)
-    for e in d.get("events", []):
-        if "parent_id" in e:
-            children[e["parent_id"]].append(e)
+    мог — и не спрашивал.
+
+    ЛИНЕЙНО: дети — из `graph_index` (parent_id → части), носитель id родителя — словарём, а
+    `member` (полные ворота видимости) спрашивается НЕ БОЛЕЕ раза на событие — и только у
+    тех, кто носит id какого-нибудь родителя. Прежде — `any(…)` по ВСЕМ событиям на каждого
+    родителя: O(P·E) приведений и сравнений id. Отображение то же
+    (scripts/bench_series_representation.py сверяет с прежним телом на случайных графах)."""
+    ix = graph_index(d)
+    is_member: dict[int, bool] = {}
+
+    def _member(e: dict[str, Any]) -> bool:
+        hit = is_member.get(id(e))
+        if hit is None:
+            hit = is_member[id(e)] = bool(member(e))
+        return hit
+
     rep: dict[str, str] = {}
-    for parent_id, sub_events in children.items():
-        if not any(str(e.get("id")) == str(parent_id) and member(e)
-                   for e in d.get("events", [])):
+    for parent_id, sub_events in ix.children.items():
+        if not any(_member(e) for e in ix.events_by_id.get(str(parent_id), ())):
             continue
         first_child = sub_events[0]        # порядок объявления = порядок автора
         if first_child.get("skoro_state", "pending") == "pending":
@@ -1799,6 +2561,92 @@ def sorted_events(d: dict[str, Any], surface: str = "site", now_iso: str | None
     return sorted(pool, key=lambda e: e.get("t_key", "￿"))
 
 
+# ── Stage-transition schedule: when the visible sets next change ─────
+
+_STAGE_SCHEDULE_KEY = "_stage_schedule"   # derived per-snapshot schedule, not content — see stage_schedule
+
+# σ → проекции, чей вывод читает видимые на σ события (метки `owner_projections`).
+# `landing_section` — особый: его читает посадочная РОДИТЕЛЯ (`landing:<parent_id>`).
+# «Скоро» (telegram) есть π_E(V) = ∃σ (selected_for_broadcast) — его трогает смена на ЛЮБОМ σ.
+_SURFACE_PROJECTIONS: dict[str, tuple[str, ...]] = {"site": ("site",)}
+_ANY_SURFACE_PROJECTIONS: tuple[str, ...] = ("telegram",)
+
+
+class StageChange(NamedTuple):
+    """Граница стадии одного события: в миг `at` стадия `before` → `after`."""
+    at: Any                            # naive UTC, как now_utc_naive()
+    event_id: str
+    before: str
+    after: str
+    surfaces: tuple[str, ...]          # σ, чьё видимое множество в этот миг приобретает / теряет событие
+    projections: tuple[str, ...]       # метки Projection, чей вывод от этого может измениться
+
+
+def stage_schedule(d: dict[str, Any]) -> "tuple[StageChange, ...]":
+    """Все границы стадий всех событий, по возрастанию `at` (порядок объявления — при равенстве).
+
+    Стадия кусочно-постоянна между якорями события (`_stage_at`: начало t_key, конец t_end),
+    поэтому видимость меняется ТОЛЬКО в них: на каждом якоре сравниваются стадия за миг до и
+    в сам миг, и для каждого σ ∈ broadcast — видимость. Граница, не меняющая стадии, в
+    расписание не входит; меняющая стадию без смены видимости — входит с пустыми `surfaces`.
+    Живёт в самом `d` и сверяется со снимком входов каждого события (id, parent_id и входы
+    закона, как `RenderClock._inputs`): правка на месте (put объектного окна) — пересчёт."""
+    from datetime import timedelta
+    from datetime_parsers import anchor_dt
+    events = d.get("events") or []
+    key = tuple((e.get("id"), e.get("parent_id"), *RenderClock._inputs(e)) for e in events)
+    memo = d.get(_STAGE_SCHEDULE_KEY)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+    tick = timedelta(microseconds=1)
+    changes: list[StageChange] = []
+    for e in events:
+        anchors = {a for a in (anchor_dt(e.get("t_key")), anchor_dt(e.get("t_end"), end=True))
+                   if a is not None}
+        for at in sorted(anchors):
+            before, after = _stage_at(e, at - tick), _stage_at(e, at)
+            if before == after:
+                continue
+            flipped = tuple(
+                s for s in dict.fromkeys(e.get("broadcast") or [])
+                if (before in _renderable_for().get(s, _all_stages_non_terminal()))
+                != (after in _renderable_for().get(s, _all_stages_non_terminal())))
+            projections: dict[str, None] = {}
+            for s in flipped:
+                if s == "landing_section" and e.get("parent_id") is not None:
+                    projections[f"landing:{e['parent_id']}"] = None
+                projections.update(dict.fromkeys(_SURFACE_PROJECTIONS.get(s, ())))
+            if flipped:
+                projections.update(dict.fromkeys(_ANY_SURFACE_PROJECTIONS))
+            changes.append(StageChange(at, str(e.get("id")), before, after, flipped,
+                                       tuple(projections)))
+    changes.sort(key=lambda c: c.at)                   # устойчиво: равные — в порядке событий
+    schedule = tuple(changes)
+    d[_STAGE_SCHEDULE_KEY] = (key, schedule)
+    return schedule
+
+
+def next_stage_change(d: dict[str, Any], now_iso: str | None = None) -> "list[StageChange]":
+    """Ближайший миг строго после «сейчас», в который хоть одно видимое множество меняется, —
+    все изменения этого мига (пусто — больше границ нет). «Сейчас» — `now_iso`, иначе часы
+    сборки (`render_clock`), иначе текущий UTC. По ответу таймер / watch.py пересобирает
+    ровно `projections` ровно в `at`, вместо опроса или ручного пуша."""
+    import bisect
+    if now_iso is None:
+        now = _render_now()
+    else:
+        from datetime_parsers import parse_iso_ts
+        now = parse_iso_ts(now_iso, naive_utc=True)
+        if now is None:
+            raise ValueError(f"next_stage_change: unparseable now_iso {now_iso!r}")
+    schedule = [c for c in stage_schedule(d) if c.surfaces]
+    i = bisect.bisect_right([c.at for c in schedule], now)
+    if i == len(schedule):
+        return []
+    at = schedule[i].at
+    return [c for c in schedule[i:] if c.at == at]
+
+
 # ── Graph resolution: events reference entities by id (no value duplication) ─
 
 def resolve_refs(d: dict[str, Any], kind: str, ids: Any) -> list[Any]:
@@ -1832,8 +2680,164 @@ def resolve_refs(d: dict[str, Any], kind: str, ids: Any) -> list[Any]:
     return out
 
 
+# ── Place index: places table resolved once per snapshot ─────────────
+
+_PLACE_INDEX_KEY = "_place_index"     # derived per-snapshot index, not content — see place_index
+
+
+class PlaceEntry(NamedTuple):
+    """Одно место таблицы `places`, разрешённое один раз: его `location` (запись реестра
+    `locations` с id, None — не объявлена), адрес и готовый schema.org Place (без `@id`)."""
+    id: str
+    record: dict[str, Any]
+    location: "dict[str, Any] | None"
+    address: Any
+    jsonld: dict[str, Any]
+
+
+class PlaceIndex(NamedTuple):
+    by_id: dict[str, PlaceEntry]
+    by_location: dict[str, tuple[str, ...]]   # location id → id мест, в порядке таблицы
+
+    def get(self, pid: Any) -> "PlaceEntry | None":
+        return self.by_id.get(pid) if isinstance(pid, str) else None
+
+    def at(self, location_id: str) -> list[PlaceEntry]:
+        return [self.by_id[pid] for pid in self.by_location.get(location_id, ())]
+
+
+def place_index(d: dict[str, Any]) -> PlaceIndex:
+    """`places` → PlaceIndex. Дни и маршрут многодневной поездки берут место словарём, а
+    не собирают Place заново на каждый бит каждого слота. Живёт в самом `d`, как
+    `landing_children`: годен, пока таблицы `places` и `locations` — те же объекты."""
+    places, locations = d.get("places") or {}, d.get("locations")
+    memo = d.get(_PLACE_INDEX_KEY)
+    if memo is not None and memo["places"] is places and memo["locations"] is locations:
+        return memo["index"]
+    by_id: dict[str, PlaceEntry] = {}
+    by_location: dict[str, list[str]] = {}
+    for pid, rec in places.items():
+        rec = rec or {}
+        obj = _place_jsonld(rec, fallback_name=pid)
+        geo = rec.get("geo") or {}
+        if isinstance(geo, dict) and geo.get("lat") is not None and geo.get("lon") is not None:
+            obj["geo"] = {"@type": "GeoCoordinates",
+                          "latitude": geo["lat"], "longitude": geo["lon"]}
+        loc_id = rec.get("location")
+        loc = resolve_refs(d, "locations", [loc_id])[0] if isinstance(loc_id, str) else None
+        by_id[str(pid)] = PlaceEntry(str(pid), rec, loc, rec.get("address"), obj)
+        if loc is not None:
+            by_location.setdefault(loc_id, []).append(str(pid))
+    index = PlaceIndex(by_id, {k: tuple(v) for k, v in by_location.items()})
+    d[_PLACE_INDEX_KEY] = {"places": places, "locations": locations, "index": index}
+    return index
+
+
+# ── Structured-data graph: one node per entity per snapshot, pages cite it by @id ─
+
+_JSONLD_GRAPH_KEY = "_jsonld_graph"   # derived per-snapshot graph, not content — see jsonld_graph
+
+
+class JsonLdGraph:
+    """Узлы schema.org (Place, Person) — каждый строится ОДИН раз на снимок, со стабильным
+    `@id` = канон владельца + `#<реестр>-<id>`. Страница не встраивает узел, а ссылается на
+    него (`{"@id": …}`) и несёт лишь узлы, которые сама цитирует: одна и та же локация в
+    списке событий, на посадочной и во всех её днях — один объект, построенный один раз.
+
+    Запись без id (инлайн-запись в ссылочном поле, resolve_refs пропускает её как есть) —
+    не сущность графа: ей нечего разделять, и она встраивается как прежде."""
+
+    def __init__(self, d: dict[str, Any]) -> None:
+        self.base = _canonical(d)
+        self.places = place_index(d)
+        self.nodes: dict[str, dict[str, Any]] = {}              # @id → узел
+        self.ids: dict[tuple[str, str], str] = {}               # (реестр, id) → @id
+
+    def _intern(self, registry: str, ident: str, build: "Callable[[], dict[str, Any]]") -> str:
+        nid = self.ids.get((registry, ident))
+        if nid is None:
+            from urllib.parse import quote
+            nid = self.ids[registry, ident] = f"{self.base}/#{registry}-{quote(ident, safe='-_.~')}"
+            self.nodes[nid] = {"@id": nid, **build()}
+        return nid
+
+    def location(self, loc: Any) -> "str | dict[str, Any]":
+        """`locations`-запись (из resolve_refs) → @id узла Place, или инлайн-Place без id."""
+        if not isinstance(loc, dict) or not isinstance(loc.get("id"), str):
+            return _place_jsonld(loc if isinstance(loc, dict) else {"name": str(loc)})
+        return self._intern("location", loc["id"], lambda: _place_jsonld(loc))
+
+    def place(self, pid: str) -> str:
+        """`places`-таблица → @id узла Place. Один узел и для дня (`_day_subevent`), и для
+        маршрута (`itinerary`): готовый Place из `place_index`; место вне таблицы — имя = id."""
+        def build() -> dict[str, Any]:
+            entry = self.places.get(pid)
+            return dict(entry.jsonld) if entry else _place_jsonld({}, fallback_name=str(pid))
+        return self._intern("place", str(pid), build)
+
+    def person(self, p: Any) -> "str | dict[str, Any]":
+        """`people`-запись (из resolve_refs) → @id узла Person, или инлайн-Person без id."""
+        if not isinstance(p, dict) or not isinstance(p.get("id"), str):
+            return {"@type": "Person",
+                    "name": p.get("name", "") if isinstance(p, dict) else str(p)}
+        return self._intern("person", p["id"],
+                            lambda: {"@type": "Person", "name": p.get("name", p.get("id", ""))})
+
+    def page(self) -> "JsonLdPage":
+        return JsonLdPage(self)
+
+
+class JsonLdPage:
+    """Ссылки одной страницы на граф. Первое упоминание узла встраивает его целиком (с `@id`),
+    каждое следующее — голое `{"@id": …}`: страница несёт ровно свои узлы, каждый один раз.
+    «Первое» — в порядке построения, и он же порядок документа: эмиттеры вставляют ключи по
+    мере построения значений. Узел — общий объект графа, только для чтения (его читает
+    `json.dumps`, никто не правит)."""
+
+    def __init__(self, graph: JsonLdGraph) -> None:
+        self.graph = graph
+        self.cited: set[str] = set()
+
+    def ref(self, node: "str | dict[str, Any]") -> dict[str, Any]:
+        if isinstance(node, dict):            # инлайн — не сущность графа
+            return node
+        if node in self.cited:
+            return {"@id": node}
+        self.cited.add(node)
+        return self.graph.nodes[node]
+
+    def location(self, loc: Any) -> dict[str, Any]:
+        return self.ref(self.graph.location(loc))
+
+    def place(self, pid: str) -> dict[str, Any]:
+        return self.ref(self.graph.place(pid))
+
+    def person(self, p: Any) -> dict[str, Any]:
+        return self.ref(self.graph.person(p))
+
+    def dumps(self, root: dict[str, Any]) -> str:
+        import json as _j
+        return _j.dumps({"@context": "https://schema.org", **root}, ensure_ascii=False)
+
+
+def jsonld_graph(d: dict[str, Any]) -> JsonLdGraph:
+    """Граф структурированных данных этого снимка. Живёт в самом `d`, как
+    `landing_children`: годен, пока реестры `locations`/`people`/`places` и `bio` — те же
+    объекты (узлы строятся только из них и канона владельца)."""
+    sources = tuple(d.get(k) for k in ("locations", "people", "places", "bio"))
+    memo = d.get(_JSONLD_GRAPH_KEY)
+    if memo is not None and len(memo["sources"]) == len(sources) \
+            and all(a is b for a, b in zip(memo["sources"], sources)):
+        return memo["graph"]
+    graph = JsonLdGraph(d)
+    d[_JSONLD_GRAPH_KEY] = {"sources": sources, "graph": graph}
+    return graph
+
+
 def schema_events_jsonld(d: dict[str, Any]) -> str:
-    """schema.org ItemList of Events with refs resolved (graph-rich SEO markup)."""
+    """schema.org ItemList of Events with refs resolved (graph-rich SEO markup).
+    Places and people are cited by @id from `jsonld_graph(d)`."""
+    page = jsonld_graph(d).page()
     items = []
     for ev in sorted_events(d):
         obj = {
@@ -1844,11 +2848,10 @@ def schema_events_jsonld(d: dict[str, Any]) -> str:
         }
         locs = resolve_refs(d, "locations", ev.get("locations", []))
         if locs:
-            obj["location"] = [_place_jsonld(l) for l in locs]
+            obj["location"] = [page.location(l) for l in locs]
         orgs = resolve_refs(d, "people", ev.get("organizers", []))
         if orgs:
-            obj["organizer"] = [{"@type": "Person",
-                                 "name": p.get("name", p.get("id", ""))} for p in orgs]
+            obj["organizer"] = [page.person(p) for p in orgs]
         auds = resolve_refs(d, "audience", ev.get("audience", []))
         if auds:
             names = [a.get("name", a) if isinstance(a, dict) else a for a in auds]
@@ -1858,11 +2861,9 @@ def schema_events_jsonld(d: dict[str, Any]) -> str:
         items.append(obj)
     if not items:
         return ""
-    import json as _j
-    obj = {"@context": "https://schema.org", "@type": "ItemList",
-           "itemListElement": [{"@type": "ListItem", "position": i + 1, "item": e}
-                               for i, e in enumerate(items)]}
-    return _j.dumps(obj, ensure_ascii=False)
+    return page.dumps({"@type": "ItemList",
+                       "itemListElement": [{"@type": "ListItem", "position": i + 1, "item": e}
+                                           for i, e in enumerate(items)]})
 
 
 # ── P_publications: D → section HTML ────────────────────────────────
@@ -1894,13 +2895,11 @@ def p_publications(d: dict[str, Any]) -> str:
     # status, through the one derivation (Inv-PRES-consumer-derived), never from the
     # twin alone. Fail-open: unwitnessed ⊥ ⇒ still 'live' ⇒ renders exactly as today.
     from plan_status import derive_output_status  # lazy — plan_status imports us back
-    pubs = sorted(
-        [p for p in (d.get("publications") or [])
-         if p.get("status") == _published
-         and derive_output_status({"kind": "publication", "id": p.get("id")}, d)[0] == "live"],
-        key=lambda p: (p.get("uploaded_at", "") or p.get("date", ""),),
-        reverse=True,
-    )
+    # Порядок ленты — из graph_index (отсортирован однажды на снимок); фильтр после
+    # устойчивой сортировки даёт тот же порядок, что сортировка после фильтра.
+    pubs = [p for p in graph_index(d).pubs_newest_first
+            if p.get("status") == _published
+            and derive_output_status({"kind": "publication", "id": p.get("id")}, d)[0] == "live"]
     if not pubs:
         return ""
     items = []
@@ -2147,6 +3146,31 @@ def p_site(d: dict[str, Any]) -> str:
 _EVENT_SLUG_RE = _re.compile(r"[a-z0-9_-]+")
 
 
+@_lru_cache(maxsize=64)
+def _signup_json_at(path: str, mtime_ns: int) -> dict[str, Any]:
+    import json as _json
+    try:
+        data = _json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        _LOG.warning("%s unread (%s) — no transport override", path, type(e).__name__)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def signup_transport_override(slug: str, site_dir: Path = ROOT) -> str:
+    """`/<slug>/signup.json::transport_url`, прочитанный при СБОРКЕ. Прежде его читал клиент:
+    `fetch` на каждом визите посадочной — лишний round trip до того, как форме есть куда
+    слать, и заявка, отправленная раньше ответа, уходила мимо переопределения. Файла нет /
+    поле пусто ⇒ "" (переопределения нет). Ключ кэша — mtime: превью видит правку без
+    рестарта."""
+    path = site_dir / slug / "signup.json"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ""
+    return str(_signup_json_at(str(path), mtime_ns).get("transport_url") or "").strip()
+
+
 def event_signup_form(slug: str, label: str, email_fallback: str,
                       cta_label: str = "Оставить email",
                       lead_capture: dict[str, Any] | None = None,
@@ -2158,8 +3182,11 @@ def event_signup_form(slug: str, label: str, email_fallback: str,
     submit for in-place «Спасибо» UX, но no-JS path также submits-and-lands.
 
     `cta_label` parametrises the heading + button text. `transport_url` —
-    canonical lead endpoint (resolved by caller от secrets_manager
-    signup_capture_url). Slug validation: must match `[a-z0-9_-]+`.
+    lead endpoint resolved by the caller at build time (`/<slug>/signup.json`
+    override ⊔ secrets_manager signup_capture_url) and inlined as the form
+    action. The client re-reads signup.json only when
+    `lead_capture.transport_refresh` is set (opt-in refresh path).
+    Slug validation: must match `[a-z0-9_-]+`.
     """
     if not isinstance(slug, str) or not _EVENT_SLUG_RE.fullmatch(slug):
         raise ValueError(
@@ -2287,6 +3314,14 @@ def event_signup_form(slug: str, label: str, email_fallback: str,
         f'<input type="hidden" name="edition" value="{_lc_edition}">'
         f'<input type="hidden" name="variant" value="{_lc_variant}">'
     ) if _lc_edition else ""
+    # Transport уже в action (разрешён при сборке). Клиентский перечит signup.json —
+    # только по явному `lead_capture.transport_refresh`: смена endpoint без пересборки.
+    # Неблокирующий: до ответа форма шлёт по встроенному action, не «в никуда».
+    _refresh_js = f"""
+  /* Opt-in refresh: /<slug>/signup.json может сменить встроенный transport. */
+  fetch("/{slug_t}/signup.json").then(function(r){{return r.ok?r.json():null}})
+    .then(function(d){{if(d&&d.transport_url)transport=d.transport_url;}})
+    .catch(function(){{}});""" if lc.get("transport_refresh") else ""
     return f'''<section id="signup" class="signup" aria-labelledby="signup-h">
   <h3 id="signup-h" class="signup-h3">{cta_html}</h3>
   <form id="signup-form" class="signup-form" novalidate
@@ -2321,11 +3356,7 @@ def event_signup_form(slug: str, label: str, email_fallback: str,
   if(!f) return;
   var btn=document.getElementById("su-btn");
   var msg=document.getElementById("signup-msg");
-  var transport=f.getAttribute("action") || "";
-  /* Optional /<slug>/signup.json override — single SoT для transport_url. */
-  fetch("/{slug_t}/signup.json").then(function(r){{return r.ok?r.json():null}})
-    .then(function(d){{if(d&&d.transport_url)transport=d.transport_url;}})
-    .catch(function(){{}});
+  var transport=f.getAttribute("action") || "";{_refresh_js}
   f.addEventListener("submit",function(e){{
     var name=f.name.value.trim(),email=f.email.value.trim();
     if(name.length<2){{e.preventDefault();f.name.focus();return;}}
@@ -2357,8 +3388,8 @@ def event_signup_form(slug: str, label: str, email_fallback: str,
 # Schema.org EventStatus enum — Spec-driven SoT.
 # Admin-side `status` (PLANNING/DRAFT/OPEN/CLOSED) is project-lifecycle,
 def _place_jsonld(loc: dict[str, Any], fallback_name: str = "") -> dict[str, Any]:
-    """Schema.org Place — single SoT used by schema_events_jsonld + _event_jsonld
-    flat-path + _event_jsonld itinerary-path. Inv-SEM-jsonld-valid:
+    """Schema.org Place — single SoT behind every JsonLdGraph Place node
+    (event locations, day places, itinerary waypoints). Inv-SEM-jsonld-valid:
     addressCountry на PostalAddress (not Place); free-form address strings
     pass through unchanged. fallback_name для places_table entries where
     the dict key (not "id" field) is the canonical reference."""
@@ -2433,8 +3464,12 @@ def _beat_subtype(beat: dict[str, Any]) -> str:
     return "Event"
 
 
-def _day_subevent(d: dict[str, Any], ev: dict[str, Any], day: dict[str, Any], slot: dict[str, Any] | None) -> dict[str, Any]:
-    """Build a sub-Event for one day. Resolves places from typed schedule."""
+def _day_subevent(d: dict[str, Any], ev: dict[str, Any], day: dict[str, Any], slot: dict[str, Any] | None,
+                  page: "JsonLdPage | None" = None) -> dict[str, Any]:
+    """Build a sub-Event for one day. Resolves places from typed schedule; each place is
+    cited by @id on `page` (the landing's JsonLdPage), built once per snapshot."""
+    if page is None:
+        page = jsonld_graph(d).page()
     iso_date = ""
     if slot and slot.get("date"):
         dt = slot["date"]
@@ -2452,23 +3487,13 @@ def _day_subevent(d: dict[str, Any], ev: dict[str, Any], day: dict[str, Any], sl
             sub_type = "EducationEvent"
         elif beat_types:
             sub_type = beat_types[0]
-        # Locations: each beat.place → Schema.org Place.
-        places_table = d.get("places") or {}
+        # Locations: each beat.place → Schema.org Place (place_index — one dict hit).
+        places = place_index(d)
         for b in beats:
             pid = b.get("place")
-            if not pid or pid not in places_table:
+            if not pid or places.get(pid) is None:
                 continue
-            p = places_table[pid] or {}
-            place_obj: dict[str, Any] = {"@type": "Place",
-                               "name": p.get("name", pid)}
-            if p.get("address"):
-                place_obj["address"] = p["address"]
-            geo = p.get("geo") or {}
-            if isinstance(geo, dict) and geo.get("lat") is not None and geo.get("lon") is not None:
-                place_obj["geo"] = {"@type": "GeoCoordinates",
-                                    "latitude": geo["lat"],
-                                    "longitude": geo["lon"]}
-            locations.append(place_obj)
+            locations.append(page.place(pid))
     obj: dict[str, Any] = {
         "@type": sub_type,
         "name": f"{title}",
@@ -2499,8 +3524,12 @@ def _event_jsonld(d: dict[str, Any], ev: dict[str, Any]) -> str:
     Admin-side `status` (PLANNING/DRAFT/OPEN/CLOSED) is project lifecycle;
     Schema.org `eventStatus` requires a real lifecycle enum — see
     _SCHEMA_EVENT_STATUS map. Pre-publication states ⇒ EventScheduled.
+
+    Places and people (event locations, organizers, day places, itinerary
+    waypoints) are `{"@id": …}` references into `jsonld_graph(d)`; each cited
+    node is embedded once, at its first mention, and referenced thereafter.
     """
-    import json as _j
+    page = jsonld_graph(d).page()
 
     fmt = ev.get("format") or []
     days = ev.get("days") or []
@@ -2536,7 +3565,6 @@ def _event_jsonld(d: dict[str, Any], ev: dict[str, Any]) -> str:
     # arrivalTime mirrored alongside startDate/endDate for Trip-aware
     # crawlers; both are valid co-existing properties.
     obj: dict[str, Any] = {
-        "@context": "https://schema.org",
         "@type": "Event",
         "name": name,
         "description": description,
@@ -2559,13 +3587,12 @@ def _event_jsonld(d: dict[str, Any], ev: dict[str, Any]) -> str:
     if locs:
         # TouristTrip: location is the trip's geographic scope.
         # Single-location trips render as one object (less syntactic noise).
-        loc_list = [_place_jsonld(l) for l in locs]
+        loc_list = [page.location(l) for l in locs]
         obj["location"] = loc_list[0] if len(loc_list) == 1 else loc_list
 
     orgs = resolve_refs(d, "people", ev.get("organizers", []))
     if orgs:
-        obj["organizer"] = [{"@type": "Person",
-                             "name": p.get("name", p.get("id", ""))} for p in orgs]
+        obj["organizer"] = [page.person(p) for p in orgs]
     auds = resolve_refs(d, "audience", ev.get("audience", []))
     if auds:
         names = [a.get("name", a) if isinstance(a, dict) else a for a in auds]
@@ -2594,7 +3621,7 @@ def _event_jsonld(d: dict[str, Any], ev: dict[str, Any]) -> str:
         sub_events: list[dict[str, Any]] = []
         for day in days:
             slot = slot_by_day.get(day.get("day"))
-            sub_events.append(_day_subevent(d, ev, day, slot))
+            sub_events.append(_day_subevent(d, ev, day, slot, page))
         if sub_events:
             obj["subEvent"] = sub_events
 
@@ -2604,25 +3631,19 @@ def _event_jsonld(d: dict[str, Any], ev: dict[str, Any]) -> str:
         # of schedule beat-places when route_map absent.
         rm = (ev.get("route_map") or {}).get("waypoints") or []
         if not rm:
-            seen: list[str] = []
-            for s in schedule:
-                for b in (s.get("beats") or []):
-                    pid = b.get("place")
-                    if pid and pid not in seen:
-                        seen.append(pid)
-            rm = seen
-        places_table = d.get("places") or {}
+            # dict — упорядоченное множество: «уже было?» за O(1), не линейным поиском.
+            rm = list(dict.fromkeys(b.get("place") for s in schedule
+                                    for b in (s.get("beats") or []) if b.get("place")))
         itin_items: list[dict[str, Any]] = []
         for pos, pid in enumerate(rm, start=1):
-            p = places_table.get(pid) or {}
             itin_items.append({"@type": "ListItem",
                                "position": pos,
-                               "item": _place_jsonld(p, fallback_name=pid)})
+                               "item": page.place(pid)})
         if itin_items:
             obj["itinerary"] = {"@type": "ItemList",
                                 "itemListElement": itin_items}
 
-    return _j.dumps(obj, ensure_ascii=False)
+    return page.dumps(obj)
 
 
 def _event_canonical(d: dict[str, Any], ev: dict[str, Any]) -> str:
@@ -2720,6 +3741,67 @@ def _person_link_html(d: dict[str, Any], person_id: str, escape: Callable[[Any],
     return f'<a href="{safe_lk}">{escape(nm)}</a>' if safe_lk else escape(nm)
 
 
+class LandingProfile:
+    """Замер фаз `p_event_landing`: событие → фаза → {seconds, bytes, calls}.
+
+    Opt-in (`profile_landings()`); выключенный замер — это `_LANDING_PROFILE is None`
+    и прямой вызов фазы, без таймера и без записи. Фаза — имя `_render_*` без
+    префикса; `bytes` — UTF-8 длина её фрагментов. Рендеры в рабочих пула
+    (`render_projections`, workers > 1) сюда не попадают — они в других процессах."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def run(self, slug: str, phase: "Callable[[_LandingCtx], list[str]]",
+            ctx: "_LandingCtx") -> "list[str]":
+        import time as _time
+        t0 = _time.perf_counter()
+        parts = phase(ctx)
+        dt = _time.perf_counter() - t0
+        name = phase.__name__.removeprefix("_render_")
+        rec = self.events.setdefault(slug, {}).setdefault(
+            name, {"seconds": 0.0, "bytes": 0, "calls": 0})
+        rec["seconds"] += dt
+        rec["bytes"] += sum(len(p.encode("utf-8")) for p in parts)
+        rec["calls"] += 1
+        return parts
+
+    def phases(self) -> "dict[str, dict[str, Any]]":
+        """Итог по фазам поверх всех событий — какая фаза доминирует вообще."""
+        out: dict[str, dict[str, Any]] = {}
+        for per_event in self.events.values():
+            for name, rec in per_event.items():
+                acc = out.setdefault(name, {"seconds": 0.0, "bytes": 0, "calls": 0})
+                for k in acc:
+                    acc[k] += rec[k]
+        return out
+
+    def as_dict(self) -> "dict[str, Any]":
+        return {"events": self.events, "phases": self.phases()}
+
+    def dump(self, path: "str | Path") -> None:
+        import json as _json
+        _write(Path(path), _json.dumps(self.as_dict(), ensure_ascii=False, indent=2) + "\n")
+
+
+_LANDING_PROFILE: "LandingProfile | None" = None
+
+
+@contextmanager
+def profile_landings() -> "Iterator[LandingProfile]":
+    """Включить замер фаз посадочных на время блока:
+
+        with profile_landings() as prof:
+            p_event_landing(d, ev)
+        prof.dump("landing-phases.json")"""
+    global _LANDING_PROFILE
+    prev, _LANDING_PROFILE = _LANDING_PROFILE, LandingProfile()
+    try:
+        yield _LANDING_PROFILE
+    finally:
+        _LANDING_PROFILE = prev
+
+
 @dataclass
 class _LandingCtx:
     """Shared render-state for `p_event_landing`'s phase helpers.
@@ -2746,6 +3828,86 @@ class _LandingCtx:
     pricing_html: str = ""  # rendered pricing-display aside; reused for duplicate-before-includes
 
 
+def _landing_phase_inputs(ctx: "_LandingCtx", phase: str) -> str:
+    """Канонический JSON РОВНО тех входов, что читает event-локальная фаза. Цена: поля
+    pricing/status/status_banner события. Секции: поддерево события (m — его
+    валидированная форма), `ctx.ph`/`ctx.pricing_html` от фазы цены, узел
+    `event_policy`, email владельца (контакт доступности по умолчанию) и АДРЕСА сущностей,
+    на которые проза события и `event_policy` ссылается `[[…]]` (люди, места, события —
+    то, что π_addr из них выводит; цели собраны по строковым полям, `_wikilink_refs`).
+    Правка секций одного события не трогает ключи остальных посадочных."""
+    import json as _json
+    ev = ctx.ev
+    if phase == "pricing_status":               # цена и статус — всё, что фаза читает
+        return _json.dumps({"phase": phase, "pricing": ev.get("pricing"),
+                            "status": ev.get("status"),
+                            "status_banner": ev.get("status_banner", True)},
+                           ensure_ascii=False, sort_keys=True, default=str)
+    ev_json = _json.dumps(ev, ensure_ascii=False, sort_keys=True, default=str)
+    inputs: dict[str, Any] = {"phase": phase, "ev": ev_json}
+    if phase == "sections_and_programme":
+        policy = ctx.d.get("event_policy") or {}
+        inputs.update(ph=ctx.ph, pricing_html=ctx.pricing_html, event_policy=policy,
+                      email=ctx.bio.get("email", ""),
+                      refs={r: entity_address(ctx.d, r) for r in _wikilink_refs(ev, policy)})
+    return _json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _wikilink_refs(*nodes: Any) -> "list[str]":
+    """Цели `[[…]]` во всех строковых значениях узлов — по полям, а не регэкспом по их
+    JSON-дампу (где экранирование `"`/`\\n` искажает подпись, а совпадение может
+    перешагнуть границу поля). Грамматика — `link.WIKILINK`, как у `_prose_entity_links`."""
+    import link
+    refs: set[str] = set()
+
+    def _walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for v in node.values():
+                _walk(v)
+        elif isinstance(node, (list, tuple)):
+            for v in node:
+                _walk(v)
+        elif isinstance(node, str) and "[[" in node:
+            refs.update(m.group(1).strip() for m in link.WIKILINK.finditer(node))
+
+    for node in nodes:
+        _walk(node)
+    return sorted(refs)
+
+
+def _landing_fragment_cached(render: "Callable[[_LandingCtx], list[str]]"
+                             ) -> "Callable[[_LandingCtx], list[str]]":
+    """Фаза посадочной → та же фаза через `_LANDING_FRAGMENTS` (ключ — хэш
+    `_landing_phase_inputs`, версия типографики и кода — как у блоков static-md, плюс
+    исходники модулей, формирующих фазы: `event_schema` (модель секций и дней) и
+    `link` (грамматика `[[…]]`) — `_landing_code_digest`).
+
+    Кэшируется не только HTML, но и то, что фаза пишет в ctx (`pricing_html`, `ph`):
+    попадание восстанавливает их, и следующая фаза видит ровно то же состояние.
+    Предупреждение о битом подтексте `[[…#…]]` звучит лишь на холодном рендере."""
+    name = render.__name__.removeprefix("_render_")
+
+    @_functools.wraps(render)
+    def cached(ctx: "_LandingCtx") -> "list[str]":
+        import json as _json
+        if not _LANDING_FRAGMENTS.enabled:
+            return render(ctx)
+
+        def _cold() -> str:
+            parts = render(ctx)
+            return _json.dumps({"parts": parts, "pricing_html": ctx.pricing_html,
+                                "ph": ctx.ph}, ensure_ascii=False)
+
+        hit = _json.loads(_LANDING_FRAGMENTS.get(
+            f"landing:{name}:{_landing_code_digest()}", _landing_phase_inputs(ctx, name),
+            "", _cold))
+        ctx.pricing_html = hit["pricing_html"]
+        ctx.ph.update(hit["ph"])
+        return hit["parts"]
+
+    return cached
+
+
 def _render_header(ctx: "_LandingCtx") -> "list[str]":
     """Phase (b) — top-banner, cover-line eyebrow, three-level header
     (concept-h1 / locus-h2 / organizers-h3, with single-h1 fallback),
@@ -2909,6 +4071,7 @@ def _render_header(ctx: "_LandingCtx") -> "list[str]":
     return parts
 
 
+@_landing_fragment_cached
 def _render_pricing_status(ctx: "_LandingCtx") -> "list[str]":
     """Phases (c)+(d) — pricing-display `<aside>`, render-time {{name}}
     placeholder dict (written into `ctx.ph` for the sections phase), and the
@@ -2968,6 +4131,7 @@ def _render_pricing_status(ctx: "_LandingCtx") -> "list[str]":
     return parts
 
 
+@_landing_fragment_cached
 def _render_sections_and_programme(ctx: "_LandingCtx") -> "list[str]":
     """Phases (e)+(f) — kept together because they share `_admin_section_titles`
     / `programme_inserted`. (e) drops the explicit «Программа» section, iterates
@@ -3231,13 +4395,47 @@ def _has_landing_terminal(d: dict[str, Any], slug: str) -> bool:
     signup, contact, about_organizer) skips for that parent's landing. Chrome (legal
     footer + cookie banner) — не «блок», renders unconditionally."""
     return any(
-        _se.get("parent_id") == slug
-        and "landing_section" in (_se.get("broadcast") or [])
+        "landing_section" in (_se.get("broadcast") or [])
         and _se.get("landing_terminal")
-        for _se in (d.get("events") or [])
+        for _se in graph_index(d).children.get(slug, ())
     )
 
 
+_LANDING_CHILDREN_KEY = "_landing_children"   # derived per-snapshot index, not content — see landing_children
+
+
+def landing_children(d: dict[str, Any], now_iso: str | None = None) -> "dict[str, list[Any]]":
+    """parent_id → под-события, видимые на `landing_section`, t_key-хронологично.
+
+    Один `sorted_events(d, "landing_section")` на снимок вместо одного на каждую
+    посадочную (предикат видимости и разбор дат по всему списку — O(E²) за сборку).
+    Индекс живёт в самом `d`, как `_asset_root`: превью читает d заново на каждый GET,
+    деплой — однажды. Он годен, пока список событий тот же и той же длины, `now_iso`
+    тот же, а при `now_iso=None` — пока не пройдена ближайшая граница видимости
+    (начало t_key или конец t_end события канала): стадия, а с ней и видимость,
+    меняется только на этих границах."""
+    from datetime_parsers import anchor_dt
+    events = d.get("events") or []
+    memo = d.get(_LANDING_CHILDREN_KEY)
+    if (memo is not None and memo["events"] is events and memo["n"] == len(events)
+            and memo["now_iso"] == now_iso
+            and (now_iso is not None or memo["until"] is None
+                 or _render_now() < memo["until"])):
+        return memo["index"]
+    now = _render_now()
+    index: dict[str, list[Any]] = {}
+    for se in sorted_events(d, "landing_section", now_iso):
+        index.setdefault(se.get("parent_id"), []).append(se)
+    until = None
+    if now_iso is None:
+        until = min((b for e in events if "landing_section" in (e.get("broadcast") or [])
+                     for b in (anchor_dt(e.get("t_key")), anchor_dt(e.get("t_end"), end=True))
+                     if b is not None and b > now), default=None)
+    d[_LANDING_CHILDREN_KEY] = {"events": events, "n": len(events), "now_iso": now_iso,
+                                "until": until, "index": index}
+    return index
+
+
 def _render_subevents(ctx: "_LandingCtx") -> "list[str]":
     """Phase (g) — `landing_section`-broadcast sub-events of this event →
     `<section class="subevent …">` blocks (description `<p>`s, an optional
@@ -3262,8 +4460,9 @@ def _render_subevents(ctx: "_LandingCtx") -> "list[str]":
     # the page at render time — no manual broadcast-list surgery after the event
     # (the live-2 manual removal, admin mandate 2026-07-08); pages deployed BEFORE
     # the boundary transition client-side via the display-window attributes below.
-    sub_events = [se for se in sorted_events(d, "landing_section")
-                  if se.get("parent_id") == slug]
+    # The gate is evaluated ONCE per snapshot, not once per landing: `landing_children`
+    # groups that same sorted_events list by parent_id.
+    sub_events = landing_children(d).get(slug, [])
     _subev_parts: list[str] = []
     for se in sub_events:
         se_type = se.get("type", "event")
@@ -3404,19 +4603,22 @@ def _render_signup(ctx: "_LandingCtx") -> "list[str]":
         # transport URL (CF Worker /lead). Resolved via secrets_manager
         # signup_capture_url (canonical lead endpoint, configurable per
         # deployment). No-JS submit lands at Worker; JS upgrades AJAX UX.
-        _transport_url = ""
-        try:
-            import sys as _sys, os as _os
-            # НЕ хардкодить дом: путь приходит из СВОЕГО расположения (модуль
-            # знает, где он лежит) — иначе archive-mode теряет изоляцию и
-            # подтягивает код с ОТСТАВШЕГО диска реплики (Σ 2026-07-11:
-            # деплой из архива импортировал старый broadcast_relation с FP).
-            _sys.path.insert(0, str(Path(__file__).resolve().parent))
-            from secrets_manager import secrets as _secrets
-            _transport_url = _secrets.get_key("signup_capture_url") or ""
-        except Exception as _e:
-            _LOG.warning("signup_capture_url unread (%s) — empty transport", type(_e).__name__)
-            _transport_url = ""
+        # `/<slug>/signup.json` override — разрешён ЗДЕСЬ, при сборке, и встроен в action
+        # (прежде его тянул клиент на каждом визите); без него — signup_capture_url.
+        _transport_url = signup_transport_override(slug)
+        if not _transport_url:
+            try:
+                import sys as _sys, os as _os
+                # НЕ хардкодить дом: путь приходит из СВОЕГО расположения (модуль
+                # знает, где он лежит) — иначе archive-mode теряет изоляцию и
+                # подтягивает код с ОТСТАВШЕГО диска реплики (Σ 2026-07-11:
+                # деплой из архива импортировал старый broadcast_relation с FP).
+                _sys.path.insert(0, str(Path(__file__).resolve().parent))
+                from secrets_manager import secrets as _secrets
+                _transport_url = _secrets.get_key("signup_capture_url") or ""
+            except Exception as _e:
+                _LOG.warning("signup_capture_url unread (%s) — empty transport", type(_e).__name__)
+                _transport_url = ""
         parts.append(event_signup_form(
             slug,
             ev_label,
@@ -3721,7 +4923,13 @@ def _render_legal(ctx: "_LandingCtx") -> "list[str]":
 
 
 def p_event_landing(d: dict[str, Any], ev: dict[str, Any]) -> str:
-    """Project one Event from the graph to a standalone landing HTML page.
+    """`p_event_landing_fragments`, склеенная в одну строку (превью, тесты)."""
+    return "".join(p_event_landing_fragments(d, ev))
+
+
+def p_event_landing_fragments(d: dict[str, Any], ev: dict[str, Any]) -> "list[str]":
+    """Project one Event from the graph to a standalone landing HTML page,
+    as ordered fragments (`_layout_fragments`; writer: `_write`).
 
     Single render path: schema-validated essay layout. No legacy fallback.
     Schema (see event_schema.EventModel for the source of truth):
@@ -3745,7 +4953,7 @@ def p_event_landing(d: dict[str, Any], ev: dict[str, Any]) -> str:
 
     Render pipeline: validate → build `_LandingCtx` once → compose the phase
     helpers (`_render_header` … `_render_legal`) → wrap in `.article-wrapper`
-    → `_layout`. The phase helpers carry the load-bearing comments (admin
+    → `_layout_fragments`. The phase helpers carry the load-bearing comments (admin
     directives, Inv-* references, incident notes) verbatim.
     """
     bio = d.get("bio", {})
@@ -3784,12 +4992,17 @@ def p_event_landing(d: dict[str, Any], ev: dict[str, Any]) -> str:
         d=d, ev=ev, m=m, slug=slug, bio=bio, date_str=date_str,
         org_ids=org_ids, inline=inline, h_aug=h_aug, breath=_breath,
     )
+    _prof = _LANDING_PROFILE
+
+    def _phase(render: "Callable[[_LandingCtx], list[str]]") -> "list[str]":
+        return render(ctx) if _prof is None else _prof.run(slug, render, ctx)
+
     _is_terminal = _has_landing_terminal(d, slug)
     _content_tail: list[str] = [] if _is_terminal else [
-        *_render_open_questions(ctx),
-        *_render_signup(ctx),
-        *_render_contact(ctx),
-        *_render_about_organizer(ctx),
+        *_phase(_render_open_questions),
+        *_phase(_render_signup),
+        *_phase(_render_contact),
+        *_phase(_render_about_organizer),
     ]
     # admin 2026-05-12 reconsider (Natalia-terminal): root-resolution shifted from
     # «reorder parts to put legal before subevent» (commit fedd0aab — awkward mid-page
@@ -3808,16 +5021,16 @@ def p_event_landing(d: dict[str, Any], ev: dict[str, Any]) -> str:
     # пусть дышит до privacy link. Polychromie-31 attribution живёт в Spec
     # (event-paris-2026-09.md::references), не на rendered page.
     parts: list[str] = [
-        *_render_header(ctx),
-        *_render_pricing_status(ctx),
-        *_render_sections_and_programme(ctx),
-        *_render_subevents(ctx),
+        *_phase(_render_header),
+        *_phase(_render_pricing_status),
+        *_phase(_render_sections_and_programme),
+        *_phase(_render_subevents),
         *_content_tail,
-        *_render_landing_footer_image(ctx),
-        *_render_legal(ctx),
+        *_phase(_render_landing_footer_image),
+        *_phase(_render_legal),
     ]
 
-    body = f'  <article class="article-wrapper">{"".join(parts)}</article>'
+    body = ['  <article class="article-wrapper">', *parts, '</article>']
 
     lead_text = m.lead if hasattr(m, "lead") else m.get("lead", "")
     # SEO meta-description must be a single string — collapse paragraphs
@@ -3845,7 +5058,7 @@ def p_event_landing(d: dict[str, Any], ev: dict[str, Any]) -> str:
     # noise. Admin direct 2026-05-11 «сверху стрелка не нужна». Conditional:
     # event has dedicated web_addresses → suppress nav-back.
     _has_dedicated_fqdn = bool(ev.get("web_addresses"))
-    return _layout(
+    return _layout_fragments(
         d,
         title=title_full,
         description=_meta_trim(lead_meta or m.concept if hasattr(m, "concept") else m.get("concept", title_full)),
@@ -4098,6 +5311,25 @@ _GRAMMAR: "list[tuple[str, Any, Any]]" = [
 ]
 
 
+def _compile_grammar_scanner(grammar: "list[tuple[str, Any, Any]]") -> "_re.Pattern[str]":
+    """СУДЬЯ одним проходом: все продукции — ОДНА альтернация с именованными группами, в
+    порядке таблицы (тот же приоритет, что у рендера: image прежде link, strong прежде em).
+
+    Равносильность с «∀ p: search(p)» по существованию: если продукция p совпадает в позиции
+    i, левосторонний скан альтернации находит совпадение не правее i (либо i поглощено более
+    ранним совпадением — и нарушение уже найдено). Собственные группы продукций нумерованные
+    и без обратных ссылок — обёртка их не ломает."""
+    flags = {pat.flags for _n, pat, _r in grammar}
+    if len(flags) != 1:
+        raise ValueError(f"_GRAMMAR: продукции с разными флагами {sorted(flags)} — "
+                         f"одна альтернация их не выразит")
+    return _re.compile("|".join(f"(?P<{name}>{pat.pattern})" for name, pat, _r in grammar),
+                       flags.pop())
+
+
+_GRAMMAR_SCAN = _compile_grammar_scanner(_GRAMMAR)
+
+
 def _md_inline(html_text: str) -> str:
     """Inline markdown → HTML — the RENDER projection of `_GRAMMAR`.
 
@@ -4153,58 +5385,260 @@ def _inline_svg(src: str) -> str:
     return ""
 
 
-def _md_static_to_html(md_body: str, line_mode: str = "verse",
-                       fragments: "Iterable[str] | None" = None,
-                       structural: "Iterable[str] | None" = None,
-                       fragment_source: str = "") -> str:
-    """Render a constrained markdown subset → HTML body fragment.
+# ── Кэш блоков статик-рендера (персистентный, контент-адресуемый) ─────────────────────
+#
+# Конспект и static-страницы перерендерятся на КАЖДОЙ сборке и КАЖДОМ preview-GET, хотя
+# правится обычно один абзац. Дорогое в рендере — ЧИСТАЯ часть блока (типограф по строкам,
+# _md_inline, капитель, span.l): она есть функция (текст блока, line_mode, правила, код).
+# Она и кэшируется — на диске, по ключу sha256(код генератора ‖ версия rule-pack ‖ line_mode
+# ‖ вид блока ‖ текст). СОСТОЯНИЕ документа (якоря `seen`, шапка статьи, структурные
+# границы, плееры фрагментов) в кэш НЕ входит и вычисляется заново при каждом рендере —
+# поэтому вывод байт-в-байт равен холодному по построению, а не по надежде.
+
+class _MdBlockCache:
+    """Двухуровневый (процесс → диск) кэш чистых рендеров блоков static-md.
+
+    Диск: `<dir>/<kk>/<key><suffix>` — контент-адресуемо, запись атомарна, параллельные
+    preview-воркеры не конфликтуют. `enabled=False` — рендер всегда холодный (тесты).
+    Диск тоже ограничен: попадание трогает файл, и при первой записи процесса (затем —
+    каждые `prune_every` записей) остаются `disk_max` последних по использованию — записи
+    прежних версий генератора и правил, которые больше не попадают, уходят первыми."""
+
+    prune_every = 256
+
+    def __init__(self, root: "Path | None", maxsize: int = 4096, suffix: str = ".html",
+                 disk_max: int = 20000) -> None:
+        self.root = root
+        self.suffix = suffix
+        self.maxsize = maxsize      # процессный уровень ограничен: поток не копит документ
+        self.disk_max = disk_max
+        self.writes = 0
+        self.evicted = 0
+        self.enabled = True
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._mem: dict[str, str] = {}
+
+    def key(self, kind: str, payload: str, line_mode: str) -> str:
+        import hashlib as _hashlib
+        h = _hashlib.sha256()
+        for part in (_generator_digest(), _TYPO_ENGINE.version(), line_mode, kind, payload):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, kind: str, payload: str, line_mode: str, render: "Callable[[], str]") -> str:
+        if not self.enabled:
+            return render()
+        k = self.key(kind, payload, line_mode)
+        hit = self._mem.get(k)
+        if hit is not None:
+            self.hits += 1
+            return hit
+        path = self.root / k[:2] / f"{k}{self.suffix}" if self.root is not None else None
+        if path is not None:
+            try:
+                hit = path.read_text(encoding="utf-8")
+            except OSError:
+                hit = None
+            if hit is not None:
+                self.disk_hits += 1
+                _touch(path)
+                self._remember(k, hit)
+                return hit
+        self.misses += 1
+        html = render()
+        self._remember(k, html)
+        if path is not None:
+            try:
+                _write(path, html)
+            except Exception as e:
+                _LOG.warning("md block cache: %s не записан (%s)", path, type(e).__name__)
+            else:
+                if self.writes % self.prune_every == 0:
+                    self.prune()
+                self.writes += 1
+        return html
+
+    def prune(self) -> int:
+        """Оставить на диске `disk_max` записей, последних по использованию. → удалено."""
+        if self.root is None or not self.root.is_dir():
+            return 0
+        n = _prune_lru(self.root.glob(f"*/*{self.suffix}"), self.disk_max)
+        self.evicted += n
+        return n
+
+    def _remember(self, k: str, html: str) -> None:
+        self._mem[k] = html
+        if len(self._mem) > self.maxsize:
+            del self._mem[next(iter(self._mem))]      # FIFO: старейшая запись
+
+    def clear(self, disk: bool = False) -> None:
+        self._mem.clear()
+        self.hits = self.disk_hits = self.misses = 0
+        if disk and self.root is not None and self.root.is_dir():
+            import shutil as _sh
+            _sh.rmtree(self.root, ignore_errors=True)
 
-    fragments — якоря секций, чей ПЕРВОИСТОЧНИК (фрагмент эфира) конспект несёт при себе.
-    Объявляется ДОКУМЕНТОМ (frontmatter `fragments:`), как и `line_mode`: рендерер не гадает,
-    он исполняет объявленное. Плеер встаёт НА ПОЛЯХ (рельс сетки), против своей секции —
-    Inv-CONSP-fragment-at-source. Привязка к носителю ВЫВОДИТСЯ: `/audio/text/<якорь>.m4a`,
-    где якорь есть тот самый адрес, что секция уже несёт.
+    def stats(self) -> dict[str, Any]:
+        return {"enabled": self.enabled, "root": str(self.root) if self.root else None,
+                "size": len(self._mem), "hits": self.hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "writes": self.writes, "evicted": self.evicted}
 
-    line_mode — СЕМАНТИКА переноса строки, объявляемая ДОКУМЕНТОМ (frontmatter
-    `line_mode:`), не угадываемая рендерером:
-      verse (default) — перенос авторский: строка → span.l блок (висячий
-              отступ её wrap'ов — CSS-регистр). Класс: построчно-правленные
-              тексты (конспект; засвидетельствовано 2026-07-10).
-      flow  — перенос редакторский: строки склеиваются пробелом (классический
-              markdown). Класс: legal/manifesto-документы, набранные с
-              wrap-ом по удобству. Закрывает квантификационную дыру
-              line-fidelity (инвариант предполагал verse у ВСЕХ static-md).
 
-    Pure function. No external markdown library — the subset is small and
-    bounded by the legal-doc / manifesto / konspekt class. Inline HTML in
-    source is passed through verbatim (admin-authored, single-SoT trusted;
-    no L0 untrusted input flows here). HTML comments are stripped — they
-    carry admin-fill placeholders meant for the source file, not visitors.
+@_lru_cache(maxsize=1)
+def _generator_digest() -> str:
+    """sha256 исходника генератора — «версия кода» в ключах кэша: любая правка рендера
+    отставляет записанное, без ручного номера формата, который можно забыть поднять."""
+    import hashlib as _hashlib
+    try:
+        return _hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return "unknown"
 
-    Line-fidelity contract (Inv-SITE-line-fidelity): admin edits these
-    files построчно (Релевантное Окно) — a newline inside a paragraph or a
-    list item is an AUTHORED break and renders as <br>; the published page
-    must show the exact line structure the admin approved. Blank line =
-    paragraph boundary, как прежде. The 2026-07-10 konspekt render collapsed
-    authored lines and split every multi-line bullet into <ul>+<p> fragments
-    mid-sentence — this contract is the permanent constraint against both.
-    """
-    body = _re.sub(r"<!--.*?-->", "", md_body, flags=_re.DOTALL)
 
-    out: list[str] = []
-    paragraph: list[str] = []
-    list_buf: list[list[str]] = []
-    table_buf: list[str] = []       # накопитель pipe-строк; разделитель |---| = тип-дискриминатор GFM
-    quote_buf: list[str] = []       # накопитель blockquote-строк (> …)
-    list_kind = "ul"                # тип открытого списка: МАРКЕР решает тег (- →ul, N.→ol) — один механизм
-    seen_ids: set[str] = set()      # адреса подтекстов ЭТОГО документа — уникальны в его пределах
-    _frag = frozenset(fragments or ())
-    _seen_structural = 0
-    _structural = frozenset(structural or ())   # ⊥ = пусто: не объявили — все h2 суть содержание   # ⊥ = пусто: не объявили — плееров нет (не «все»)
-    seen_h1 = False
-    seen_section = False   # первый h2/h3 закрывает «шапку статьи»
-
-    def _block(lines: list[str]) -> str:
+@_lru_cache(maxsize=None)
+def _module_digest(name: str) -> str:
+    """sha256 исходника импортируемого модуля `name` — как `_generator_digest`, для
+    соседей генератора; "absent", когда модуля нет (деплой без него)."""
+    import hashlib as _hashlib
+    import importlib.util as _ilu
+    try:
+        spec = _ilu.find_spec(name)
+        origin = spec.origin if spec is not None else None
+        if not origin or not Path(origin).is_file():
+            return "absent"
+        return _hashlib.sha256(Path(origin).read_bytes()).hexdigest()[:16]
+    except (ImportError, OSError, ValueError):
+        return "absent"
+
+
+def _landing_code_digest() -> str:
+    """Версия кода фаз посадочной: генератор уже в ключе, здесь — его соседи."""
+    return "+".join(_module_digest(m) for m in ("event_schema", "link"))
+
+
+_MD_BLOCK_CACHE = _MdBlockCache(_cache_root() / "md-blocks")
+_BUILD_STATS["md_block_cache"] = _MD_BLOCK_CACHE.stats
+# Тот же двухуровневый кэш — для event-локальных фаз посадочной (`_landing_fragment_cached`):
+# значение — JSON фрагментов фазы и записанного ею в ctx.
+_LANDING_FRAGMENTS = _MdBlockCache(_cache_root() / "landing-fragments", suffix=".json",
+                                   disk_max=2000)
+_BUILD_STATS["landing_fragments"] = _LANDING_FRAGMENTS.stats
+
+
+_HR_FORMS = ("<hr>", '<hr class="doc-part-rule" aria-hidden="true">')
+
+
+def _iter_lines(text: str) -> "Iterator[str]":
+    """Строки `text` по одной — как `text.split("\\n")`, но без списка всех строк."""
+    i = 0
+    while True:
+        j = text.find("\n", i)
+        if j < 0:
+            yield text[i:]
+            return
+        yield text[i:j]
+        i = j + 1
+
+
+# КЛАССИФИКАТОР СТРОКИ static-md — ОДНА скомпилированная альтернация вместо цепочки
+# раздельных проверок. Порядок ветвей = прежний приоритет (линейка → картинка → h3/h2/h1 →
+# таблица → список → цитата → пусто → текст); вид строки = имя сработавшей ветви
+# (`lastgroup`: внешняя группа закрывается последней). Применяется к `raw_line.rstrip()`;
+# ведущий пробел значим лишь для висячего отступа открытого пункта (см. `_MdStatic.feed`).
+_MD_LINE_RE = _re.compile(
+    r"(?P<rule>\s*(?P<rc>[-_*])[ \t]*(?:(?P=rc)[ \t]*){2,})\Z"        # = _MD_RULE_RE
+    r"|(?P<image>\s*!\[(?P<alt>[^\]]*)\]\((?P<src>[^)]+)\))\Z"        # = _MD_IMG_RE
+    r"|(?P<h3>### .*)"
+    r"|(?P<h2>## .*)"
+    r"|(?P<h1># .*)"
+    r"|(?P<table>\s*\|.*)"
+    r"|(?P<ul>\s*- .*)"
+    r"|(?P<ol>\s*\d+\.\s+(?P<item>.*))"
+    r"|(?P<quote>\s*>.*)"
+    r"|(?P<blank>)\Z"
+    r"|(?P<text>)")
+
+# Какой открытый блок строка данного вида ПРОДОЛЖАЕТ; любой другой открытый блок она
+# закрывает. Открытым бывает не больше одного блока — пять ручных буферов прежнего
+# токенизатора были одним состоянием, записанным пятью переменными.
+_MD_LINE_CONTINUES: "dict[str, str | None]" = {
+    "rule": None, "image": None, "h3": None, "h2": None, "h1": None,
+    "table": "table", "ul": "list", "ol": "list", "quote": "quote",
+    "blank": None, "text": "p", "cont": "list",
+}
+
+
+class _MdStatic:
+    """Блочная машина состояний static-md: строка → вид (`_MD_LINE_RE`) → переход
+    (`_MD_LINE_CONTINUES`) → обработчик вида. Состояние — один открытый блок
+    (`open` ∈ {None, "p", "list", "table", "quote"}) и его буфер `buf`; готовый HTML
+    копится в `out` и отдаётся `drain`."""
+
+    def __init__(self, line_mode: str, fragments: "Iterable[str] | None",
+                 structural: "Iterable[str] | None", fragment_source: str,
+                 assert_each: bool, headings: "dict[str, dict[str, Any]] | None") -> None:
+        self.line_mode = line_mode
+        self.fragment_source = fragment_source
+        self.assert_each = assert_each
+        self.headings = headings
+        self.out: list[str] = []
+        self.open: "str | None" = None
+        self.buf: list = []             # строки p/table/quote; для list — пункты (list[list[str]])
+        self.list_kind = "ul"           # тип открытого списка: МАРКЕР решает тег (- →ul, N.→ol) — один механизм
+        self.seen_ids: set[str] = set()  # адреса подтекстов ЭТОГО документа — уникальны в его пределах
+        self.frag = frozenset(fragments or ())           # ⊥ = пусто: не объявили — плееров нет (не «все»)
+        self.structural = frozenset(structural or ())    # ⊥ = пусто: не объявили — все h2 суть содержание
+        self.seen_structural = 0
+        self.seen_h1 = False
+        self.seen_section = False       # первый h2/h3 закрывает «шапку статьи»
+        self.emitted = 0                # смещение следующего фрагмента в собранном документе
+        self.n_yielded = 0              # порядковый номер следующего фрагмента (блока)
+        self.pending_headings: dict[int, str] = {}   # номер блока → якорь, ждущий смещения
+
+    # ── переходы ──────────────────────────────────────────────────────────────
+
+    def feed(self, raw_line: str) -> None:
+        line = raw_line.rstrip()
+        m = _MD_LINE_RE.match(line)
+        kind = m.lastgroup
+        if kind == "text" and self.open == "list" and raw_line[:1] in (" ", "\t"):
+            kind = "cont"               # висячий отступ → продолжение ОТКРЫТОГО пункта, не новый <p>
+        if self.open is not None and self.open != _MD_LINE_CONTINUES[kind]:
+            self.close()
+        self._ON_LINE[kind](self, line, m)
+
+    def close(self) -> None:
+        """Закрыть открытый блок (если есть) — отрендерить его буфер в `out`."""
+        kind, buf = self.open, self.buf
+        if kind is None:
+            return
+        self.open, self.buf = None, []
+        self._ON_CLOSE[kind](self, buf)
+
+    def drain(self, final: bool) -> "Iterator[str]":
+        out = self.out
+        # Хвостовые линейки ДЕРЖИМ до следующей строки: структурный маркер снимает
+        # авторскую линейку прямо перед собой (out.pop в `_on_h2`) — отданное уже не снять.
+        keep = len(out)
+        if not final:
+            while keep and out[keep - 1].strip() in _HR_FORMS:
+                keep -= 1
+        for frag in out[:keep]:
+            if self.assert_each:
+                _assert_rendered(frag, self.emitted)
+            if self.n_yielded in self.pending_headings:
+                self.headings[self.pending_headings.pop(self.n_yielded)]["offset"] = self.emitted  # type: ignore[index]
+            self.emitted += len(frag) + 1           # + "\n" между фрагментами
+            self.n_yielded += 1
+            yield frag
+        del out[:keep]
+
+    # ── рендер ────────────────────────────────────────────────────────────────
+
+    def _block(self, lines: list[str]) -> str:
         # _typo + amp-normal per source line (boundaries are authored, real);
         # emphasis резолвится над \n-joined текстом (пары через перенос), затем
         # verse: каждая авторская строка — span.l (эргономический регистр:
@@ -4212,11 +5646,64 @@ def _md_static_to_html(md_body: str, line_mode: str = "verse",
         # mobile_375); flow: строки — одно течение (пробел).
         joined = _md_inline("\n".join(_amp_normal(_typo(l)) for l in lines))
         joined = _abbr_smallcaps(joined)
-        return _wrap_lines(joined) if line_mode == "verse" else joined.replace("\n", " ")
+        return _wrap_lines(joined) if self.line_mode == "verse" else joined.replace("\n", " ")
+
+    def _cached_block(self, lines: list[str]) -> str:
+        # Кэшируется ЧИСТОЕ тело блока; обёртка (класс шапки статьи) — состояние, она снаружи.
+        return _MD_BLOCK_CACHE.get("block", "\n".join(lines), self.line_mode,
+                                   lambda: self._block(lines))
+
+    def _heading(self, raw: str) -> str:
+        # Текст заголовка — чистый; его id (`seen`) и плеер фрагмента — состояние, вне кэша.
+        return _MD_BLOCK_CACHE.get("heading", raw, self.line_mode,
+                                   lambda: _h_punct(_md_inline(_amp_normal(_typo(raw)))))
+
+    def _emit_heading(self, level: int, raw: str) -> str:
+        hid = anchor(raw, self.seen_ids)
+        # Индекс заголовков (якорь → уровень, текст, блок, смещение) пишется ПРИ рендере:
+        # тот же `seen`, что дал id, — второго вывода адреса нет.
+        if self.headings is not None:
+            ordinal = self.n_yielded + len(self.out)
+            self.headings[hid] = {"level": level, "text": raw, "block": ordinal}
+            self.pending_headings[ordinal] = hid
+        self.out.append(f'<h{level} id="{hid}">{self._heading(raw)}</h{level}>')
+        return hid
+
+    @staticmethod
+    def _table_cells(r: str) -> "list[str]":
+        r = r.strip()
+        if r.startswith("|"):
+            r = r[1:]
+        if r.endswith("|"):
+            r = r[:-1]
+        return [c.strip() for c in r.split("|")]
 
-    def _flush_paragraph() -> None:
-        if not paragraph:
-            return
+    def _render_table(self, rows: "list[str]", delim: "list[str]") -> str:
+        aligns = ["center" if c.startswith(":") and c.endswith(":")
+                  else "right" if c.endswith(":")
+                  else "left" if c.startswith(":") else "" for c in delim]
+
+        def _sty(i: int) -> str:
+            a = aligns[i] if i < len(aligns) else ""
+            return f' style="text-align:{a}"' if a else ""
+
+        def _cell(c: str) -> str:      # тот же инлайн-конвейер, что у _block — единый SoT типографики
+            return _md_inline(_amp_normal(_typo(c)))
+
+        head = self._table_cells(rows[0])
+        ncol = len(head)
+        thead = "".join(f"<th{_sty(i)}>{_cell(head[i])}</th>" for i in range(ncol))
+        body = []
+        for r in rows[2:]:
+            cs = (self._table_cells(r) + [""] * ncol)[:ncol]
+            body.append("<tr>" + "".join(f"<td{_sty(i)}>{_cell(cs[i])}</td>"
+                                         for i in range(ncol)) + "</tr>")
+        return (f"<table><thead><tr>{thead}</tr></thead>"
+                f"<tbody>{''.join(body)}</tbody></table>")
+
+    # ── закрытие блоков ───────────────────────────────────────────────────────
+
+    def _close_p(self, paragraph: list[str]) -> None:
         # АБЗАЦ, ЦЕЛИКОМ НАБРАННЫЙ ВЫДЕЛЕНИЕМ, — НЕ АБЗАЦ, А ЗАГОЛОВОК.
         #
         # Роль читается С ДАННЫХ, а не объявляется: строка, у которой выделено ВСЁ, ничего
@@ -4236,85 +5723,43 @@ def _md_static_to_html(md_body: str, line_mode: str = "verse",
         # абзацами. Уровень — h3, тот же, что у нумерованных разделов: и те и другие суть
         # прямые дети части документа (глубина ВЫВЕДЕНА из структуры, не выбрана).
         if len(paragraph) == 1 and (_m := _FULL_EMPH_RE.match(paragraph[0].strip())):
-            _raw = _m.group(1).strip()
-            _id = anchor(_raw, seen_ids)
-            out.append(f'<h3 id="{_id}">'
-                       f"{_h_punct(_md_inline(_amp_normal(_typo(_raw))))}</h3>")
-            paragraph.clear()
+            self._emit_heading(3, _m.group(1).strip())
             return
         # «Шапка статьи» — структурное правило (не контентное): абзацы ПОСЛЕ
         # h1 ДО первого h2/h3 несут meta-регистр (дата, байлайн — CSS muted).
-        cls = ' class="article-meta"' if (seen_h1 and not seen_section) else ""
-        out.append(f"<p{cls}>{_block(paragraph)}</p>")
-        paragraph.clear()
-
-    def _flush_list() -> None:
-        if list_buf:
-            items_html = "".join(f"<li>{_block(li)}</li>" for li in list_buf)
-            out.append(f"<{list_kind}>{items_html}</{list_kind}>")   # тег = list_kind: - →ul, N.→ol
-            list_buf.clear()
+        cls = ' class="article-meta"' if (self.seen_h1 and not self.seen_section) else ""
+        self.out.append(f"<p{cls}>{self._cached_block(paragraph)}</p>")
 
-    def _flush_quote() -> None:
-        if quote_buf:
-            out.append(f"<blockquote><p>{_block(quote_buf)}</p></blockquote>")
-            quote_buf.clear()
+    def _close_list(self, items: "list[list[str]]") -> None:
+        items_html = _MD_BLOCK_CACHE.get(
+            "list", "\x1e".join("\n".join(li) for li in items), self.line_mode,
+            lambda: "".join(f"<li>{self._block(li)}</li>" for li in items))
+        kind = self.list_kind
+        self.out.append(f"<{kind}>{items_html}</{kind}>")   # тег = list_kind: - →ul, N.→ol
 
-    def _table_cells(r: str) -> "list[str]":
-        r = r.strip()
-        if r.startswith("|"):
-            r = r[1:]
-        if r.endswith("|"):
-            r = r[:-1]
-        return [c.strip() for c in r.split("|")]
+    def _close_quote(self, lines: list[str]) -> None:
+        self.out.append(f"<blockquote><p>{self._cached_block(lines)}</p></blockquote>")
 
-    def _flush_table() -> None:
+    def _close_table(self, rows: list[str]) -> None:
         # ТОТАЛЬНОСТЬ + ⊥-ЧЕСТНОСТЬ: pipe-блок — таблица ТОЛЬКО при GFM-разделителе во 2-й
         # строке (`|:--|--:|`). Это тип-дискриминатор: его наличие ОДНОЗНАЧНО отличает
         # таблицу от прозы-с-палкой (`P(A|B)`), поэтому решение — не эвристика, а грамматика.
         # Нет разделителя ⇒ по GFM это НЕ таблица ⇒ строки честно возвращаются в абзац
         # (не молчаливая деградация: раньше таблица тоже падала в абзац, но БЕЗ поддержки —
         # теперь валидная таблица рендерится, а невалидное — по спецификации проза).
-        if not table_buf:
-            return
-        rows = table_buf[:]
-        table_buf.clear()
-        delim = _table_cells(rows[1]) if len(rows) >= 2 else []
+        delim = self._table_cells(rows[1]) if len(rows) >= 2 else []
         is_table = bool(delim) and all(_re.fullmatch(r":?-{1,}:?", c) for c in delim)
         if not is_table:
-            for r in rows:
-                paragraph.append(r.strip())
-            _flush_paragraph()
+            self._close_p(rows)
             return
-        aligns = ["center" if c.startswith(":") and c.endswith(":")
-                  else "right" if c.endswith(":")
-                  else "left" if c.startswith(":") else "" for c in delim]
-
-        def _sty(i: int) -> str:
-            a = aligns[i] if i < len(aligns) else ""
-            return f' style="text-align:{a}"' if a else ""
-
-        def _cell(c: str) -> str:      # тот же инлайн-конвейер, что у _block — единый SoT типографики
-            return _md_inline(_amp_normal(_typo(c)))
+        self.out.append(_MD_BLOCK_CACHE.get("table", "\n".join(rows), self.line_mode,
+                                            lambda: self._render_table(rows, delim)))
 
-        head = _table_cells(rows[0])
-        ncol = len(head)
-        thead = "".join(f"<th{_sty(i)}>{_cell(head[i])}</th>" for i in range(ncol))
-        body = []
-        for r in rows[2:]:
-            cs = (_table_cells(r) + [""] * ncol)[:ncol]
-            body.append("<tr>" + "".join(f"<td{_sty(i)}>{_cell(cs[i])}</td>"
-                                         for i in range(ncol)) + "</tr>")
-        out.append(f"<table><thead><tr>{thead}</tr></thead>"
-                   f"<tbody>{''.join(body)}</tbody></table>")
+    _ON_CLOSE = {"p": _close_p, "list": _close_list, "table": _close_table, "quote": _close_quote}
 
-    def _flush_all() -> None:
-        _flush_paragraph()
-        _flush_list()
-        _flush_table()
-        _flush_quote()
+    # ── обработчики видов строки (открытый блок чужого вида уже закрыт `feed`) ──
 
-    for raw_line in body.split("\n"):
-        line = raw_line.rstrip()
+    def _on_rule(self, line: str, m: "_re.Match[str]") -> None:
         # ТЕМАТИЧЕСКИЙ РАЗРЫВ (CommonMark §4.1): строка из трёх и более `-`, `_` или `*`
         # одного вида. Грамматика его НЕ ЗНАЛА, и потому `---` доезжал до мира АБЗАЦЕМ —
         # тремя дефисами на странице и в каждой её проекции (замер 2026-07-19, PDF ТКП,
@@ -4322,151 +5767,247 @@ def _md_static_to_html(md_body: str, line_mode: str = "verse",
         # рендерер прочёл его как прозу. Граница частей уже рисуется `.doc-part-rule`, и
         # разрыв — та же граница, объявленная разметкой вместо frontmatter, поэтому и
         # носитель у них один.
-        if _MD_RULE_RE.fullmatch(line.strip()):
-            _flush_all()
-            out.append('<hr class="doc-part-rule" aria-hidden="true">')
-            continue
-        m_img = _MD_IMG_RE.fullmatch(line.strip())      # СТРОКА-КАРТИНКА = БЛОК (figure+caption)
-        if m_img:
-            _flush_all()
-            alt, src = m_img.group(1), _u(m_img.group(2))
-            cap = _md_inline(_amp_normal(_typo(alt))) if alt else ""
-            # ВЕКТОР — В ДОКУМЕНТ (иначе тема — догадка изолированного документа); растр — <img>.
-            svg = _inline_svg(m_img.group(2))
-            if svg:
-                # ОДНО ОПИСАНИЕ, ОДИН НОСИТЕЛЬ. У вставленной фигуры описание уже есть —
-                # `aria-label` внутри неё. Дублировать его <figcaption>'ом значит держать
-                # ОДИН факт в ДВУХ носителях, и подпись начинает жить своей жизнью: она
-                # утверждала то, чего в источнике не было (Σ 2026-07-13, админ: «подписей
-                # вокруг иллюстрации не запрашивал»). Растру figcaption оставлен: у <img>
-                # своего описания в документе нет, alt его не отображает.
-                out.append(f"<figure>{svg}</figure>")
-            else:
-                out.append(f'<figure><img src="{src}" alt="{alt}" loading="lazy">'
-                           + (f"<figcaption>{cap}</figcaption>" if cap else "") + "</figure>")
-            continue
-        # КАЖДЫЙ заголовок несёт АДРЕС своего подтекста (Inv-LINK-address-derived). Голый
-        # <hN> оставлял адресуемым только верхний уровень — единственный, который админ и
-        # назвал исключением. Адрес выводится из ТЕКСТА заголовка (до типографики), поэтому
-        # новая секция получает его сама, и `#slaydy-pyatnadtsat-protsentov` доезжает до мира.
-        if line.startswith("### "):
-            _flush_all()
-            seen_section = True
-            _raw = line[4:].strip()
-            out.append(f'<h3 id="{anchor(_raw, seen_ids)}">'
-                       f"{_h_punct(_md_inline(_amp_normal(_typo(_raw))))}</h3>")
-            continue
-        if line.startswith("## "):
-            _flush_all()
-            seen_section = True
-            _raw = line[3:].strip()
-            # СТРУКТУРА — НЕ СОДЕРЖАНИЕ (admin 2026-07-19: «пусть SUMMARY и BODY будут отделены
-            # графически, не этими заголовками»). Заголовки вроде SUMMARY / ТЕЛО не НАЗЫВАЮТ
-            # раздел — они РАЗМЕЧАЮТ границу частей документа, и слово «ТЕЛО» читателю не
-            # сообщает ничего, кроме того, что уже видно глазом. Такой маркер проецируется в
-            # ГРАНИЦУ, а текст его исчезает: разделение — работа типографики, не лексики.
-            #
-            # ЧТО ИМЕННО структурно — объявляет ДОКУМЕНТ (frontmatter `structural_headings:`),
-            # тем же законом, что `line_mode` и `fragments`: рендерер не гадает и не держит
-            # словаря «служебных слов» (такой словарь был бы хардкодом, обязанным разойтись с
-            # каждым новым жанром и языком). Не объявили — обычный h2, поведение прежнее.
-            if _raw in _structural:
-                # ГРАНИЦА РИСУЕТСЯ МЕЖДУ ЧАСТЯМИ, А НЕ ПЕРЕД ПЕРВОЙ. Первый маркер лишь
-                # ОТКРЫВАЕТ начальную часть — над ней уже стоит заголовок документа, и правило
-                # там отделяло бы текст от поля страницы, а не часть от части. N маркеров ⇒
-                # N−1 границ: ровно арифметика разбиения, а не «по маркеру на каждый».
-                if _seen_structural:
-                    # ГРАНИЦА ЧАСТЕЙ — ОДИН ФАКТ, И У НЕГО ОДНО КОДИРОВАНИЕ.
-                    # Автор, писавший до появления `structural_headings:`, отбивал части
-                    # ЛИНЕЙКОЙ (`---`), а маркер теперь ВЫВОДИТ ту же границу сам. Оба
-                    # доезжали, и граница рисовалась дважды: в HTML две линейки подряд, в
-                    # TXT — два `* * *` через пустую строку (замерено на живом артефакте
-                    # 2026-07-19, админ увидел это как «дубляж в TXT»). Побеждает ВЫВЕДЕННАЯ:
-                    # авторская линейка непосредственно перед маркером есть второе кодирование
-                    # уже объявленного, и снимается — сам маркер при этом остаётся источником
-                    # истины, поэтому документ без `structural_headings:` ничего не теряет.
-                    while out and out[-1].strip() in ("<hr>", '<hr class="doc-part-rule" aria-hidden="true">'):
-                        out.pop()
-                    out.append('<hr class="doc-part-rule" aria-hidden="true">')
-                _seen_structural += 1
-                continue
-            _id = anchor(_raw, seen_ids)
-            out.append(f'<h2 id="{_id}">'
-                       f"{_h_punct(_md_inline(_amp_normal(_typo(_raw))))}</h2>")
-            # СВИДЕТЕЛЬСТВО СТОИТ ПРИ ВЫСКАЗЫВАНИИ (Inv-CONSP-fragment-at-source) — тот же
-            # закон, что и у иллюстрации: «плеер в шапке не свидетельствует высказывание, он
-            # украшает документ». Конспект есть ВЫВОД; фрагмент эфира — его ПЕРВОИСТОЧНИК, и
-            # читатель должен доставать источник НЕ СХОДЯ С МЕСТА.
-            #
-            # ПРИВЯЗКА ВЫВОДИТСЯ, а не объявляется таблицей: имя файла = anchor(заголовок), то
-            # есть ТОТ ЖЕ адрес, который секция уже несёт (Inv-LINK-address-derived). Замерено
-            # на живом носителе: 7/7 клипов совпали с выведенными якорями. Новая секция со
-            # своим клипом получает плеер САМА — ни строки кода, ни строки таблицы.
-            #
-            # ЧТО именно вынести — решение РЕДАКТОРСКОЕ и живёт ДАННЫМИ при самой сущности
-            # (frontmatter `fragments:`), как и `line_mode`. Рендерер не гадает: он исполняет
-            # объявленное. Вкус (сколько, какие, не подряд) не легализуется в закон.
-            if _id in _frag:
-                src = fragment_source.format(anchor=_id) if fragment_source else f"/audio/text/{_id}.m4a"
-                out.append(
-                    f'<aside class="fragment" aria-label="Фрагмент эфира — этот отрывок дословно">'
-                    f'<audio controls preload="none" src="{src}"></audio>'
-                    f'</aside>')
-            continue
-        if line.startswith("# "):
-            _flush_all()
-            seen_h1 = True
-            _raw = line[2:].strip()
-            out.append(f'<h1 id="{anchor(_raw, seen_ids)}">'
-                       f"{_h_punct(_md_inline(_amp_normal(_typo(_raw))))}</h1>")
-            continue
-        if line.strip().startswith("|"):
-            # СТРОКА-ТАБЛИЦА = БЛОК (leading `|` — объявленная грамматика подмножества;
-            # проза-с-палкой начинается не с `|`). Накапливаем; тип решит _flush_table.
-            _flush_paragraph()
-            _flush_list()
-            _flush_quote()
-            table_buf.append(line.strip())
-            continue
-        _m_ol = _re.match(r"\d+\.\s+(.*)", line.strip())
-        if line.lstrip().startswith("- ") or _m_ol:
-            # СПИСОК = ОДИН механизм: МАРКЕР решает тег (- →ul, N.→ol). <ol> есть
-            # АВТОСЛЕДСТВИЕ этого, а не вторая ветка (декларативно: маркер → тег).
-            _flush_paragraph()
-            _flush_table()
-            _flush_quote()
-            _kind = "ul" if line.lstrip().startswith("- ") else "ol"
-            if list_buf and list_kind != _kind:
-                _flush_list()                       # смена типа списка = разные списки
-            list_kind = _kind
-            item = line.lstrip()[2:].strip() if _kind == "ul" else _m_ol.group(1).strip()
-            list_buf.append([item])
-            continue
-        if line.strip().startswith(">"):
-            # BLOCKQUOTE = контейнер-блок (Σ: ТКП worked-examples «> Бухгалтер: …»).
-            _flush_paragraph()
-            _flush_list()
-            _flush_table()
-            quote_buf.append(line.strip().lstrip(">").strip())
-            continue
-        if not line.strip():
-            _flush_all()
-            continue
-        if list_buf and raw_line[:1] in (" ", "\t"):
-            # Hanging indent → continuation of the OPEN bullet, not a new <p>.
-            list_buf[-1].append(line.strip())
-            continue
-        _flush_list()
-        _flush_table()
-        _flush_quote()
-        paragraph.append(line.strip())
-    _flush_all()
-    html = "\n".join(out)
+        self.out.append('<hr class="doc-part-rule" aria-hidden="true">')
+
+    def _on_image(self, line: str, m: "_re.Match[str]") -> None:
+        # СТРОКА-КАРТИНКА = БЛОК (figure+caption)
+        alt, src = m.group("alt"), _u(m.group("src"))
+        cap = _md_inline(_amp_normal(_typo(alt))) if alt else ""
+        # ВЕКТОР — В ДОКУМЕНТ (иначе тема — догадка изолированного документа); растр — <img>.
+        svg = _inline_svg(m.group("src"))
+        if svg:
+            # ОДНО ОПИСАНИЕ, ОДИН НОСИТЕЛЬ. У вставленной фигуры описание уже есть —
+            # `aria-label` внутри неё. Дублировать его <figcaption>'ом значит держать
+            # ОДИН факт в ДВУХ носителях, и подпись начинает жить своей жизнью: она
+            # утверждала то, чего в источнике не было (Σ 2026-07-13, админ: «подписей
+            # вокруг иллюстрации не запрашивал»). Растру figcaption оставлен: у <img>
+            # своего описания в документе нет, alt его не отображает.
+            self.out.append(f"<figure>{svg}</figure>")
+        else:
+            self.out.append(f'<figure><img src="{src}" alt="{alt}" loading="lazy">'
+                            + (f"<figcaption>{cap}</figcaption>" if cap else "") + "</figure>")
+
+    # КАЖДЫЙ заголовок несёт АДРЕС своего подтекста (Inv-LINK-address-derived). Голый
+    # <hN> оставлял адресуемым только верхний уровень — единственный, который админ и
+    # назвал исключением. Адрес выводится из ТЕКСТА заголовка (до типографики), поэтому
+    # новая секция получает его сама, и `#slaydy-pyatnadtsat-protsentov` доезжает до мира.
+    def _on_h3(self, line: str, m: "_re.Match[str]") -> None:
+        self.seen_section = True
+        self._emit_heading(3, line[4:].strip())
+
+    def _on_h2(self, line: str, m: "_re.Match[str]") -> None:
+        self.seen_section = True
+        _raw = line[3:].strip()
+        # СТРУКТУРА — НЕ СОДЕРЖАНИЕ (admin 2026-07-19: «пусть SUMMARY и BODY будут отделены
+        # графически, не этими заголовками»). Заголовки вроде SUMMARY / ТЕЛО не НАЗЫВАЮТ
+        # раздел — они РАЗМЕЧАЮТ границу частей документа, и слово «ТЕЛО» читателю не
+        # сообщает ничего, кроме того, что уже видно глазом. Такой маркер проецируется в
+        # ГРАНИЦУ, а текст его исчезает: разделение — работа типографики, не лексики.
+        #
+        # ЧТО ИМЕННО структурно — объявляет ДОКУМЕНТ (frontmatter `structural_headings:`),
+        # тем же законом, что `line_mode` и `fragments`: рендерер не гадает и не держит
+        # словаря «служебных слов» (такой словарь был бы хардкодом, обязанным разойтись с
+        # каждым новым жанром и языком). Не объявили — обычный h2, поведение прежнее.
+        if _raw in self.structural:
+            # ГРАНИЦА РИСУЕТСЯ МЕЖДУ ЧАСТЯМИ, А НЕ ПЕРЕД ПЕРВОЙ. Первый маркер лишь
+            # ОТКРЫВАЕТ начальную часть — над ней уже стоит заголовок документа, и правило
+            # там отделяло бы текст от поля страницы, а не часть от части. N маркеров ⇒
+            # N−1 границ: ровно арифметика разбиения, а не «по маркеру на каждый».
+            if self.seen_structural:
+                # ГРАНИЦА ЧАСТЕЙ — ОДИН ФАКТ, И У НЕГО ОДНО КОДИРОВАНИЕ.
+                # Автор, писавший до появления `structural_headings:`, отбивал части
+                # ЛИНЕЙКОЙ (`---`), а маркер теперь ВЫВОДИТ ту же границу сам. Оба
+                # доезжали, и граница рисовалась дважды: в HTML две линейки подряд, в
+                # TXT — два `* * *` через пустую строку (замерено на живом артефакте
+                # 2026-07-19, админ увидел это как «дубляж в TXT»). Побеждает ВЫВЕДЕННАЯ:
+                # авторская линейка непосредственно перед маркером есть второе кодирование
+                # уже объявленного, и снимается — сам маркер при этом остаётся источником
+                # истины, поэтому документ без `structural_headings:` ничего не теряет.
+                out = self.out
+                while out and out[-1].strip() in _HR_FORMS:
+                    out.pop()
+                out.append('<hr class="doc-part-rule" aria-hidden="true">')
+            self.seen_structural += 1
+            return
+        _id = self._emit_heading(2, _raw)
+        # СВИДЕТЕЛЬСТВО СТОИТ ПРИ ВЫСКАЗЫВАНИИ (Inv-CONSP-fragment-at-source) — тот же
+        # закон, что и у иллюстрации: «плеер в шапке не свидетельствует высказывание, он
+        # украшает документ». Конспект есть ВЫВОД; фрагмент эфира — его ПЕРВОИСТОЧНИК, и
+        # читатель должен доставать источник НЕ СХОДЯ С МЕСТА.
+        #
+        # ПРИВЯЗКА ВЫВОДИТСЯ, а не объявляется таблицей: имя файла = anchor(заголовок), то
+        # есть ТОТ ЖЕ адрес, который секция уже несёт (Inv-LINK-address-derived). Замерено
+        # на живом носителе: 7/7 клипов совпали с выведенными якорями. Новая секция со
+        # своим клипом получает плеер САМА — ни строки кода, ни строки таблицы.
+        #
+        # ЧТО именно вынести — решение РЕДАКТОРСКОЕ и живёт ДАННЫМИ при самой сущности
+        # (frontmatter `fragments:`), как и `line_mode`. Рендерер не гадает: он исполняет
+        # объявленное. Вкус (сколько, какие, не подряд) не легализуется в закон.
+        if _id in self.frag:
+            src = (self.fragment_source.format(anchor=_id) if self.fragment_source
+                   else f"/audio/text/{_id}.m4a")
+            self.out.append(
+                f'<aside class="fragment" aria-label="Фрагмент эфира — этот отрывок дословно">'
+                f'<audio controls preload="none" src="{src}"></audio>'
+                f'</aside>')
+
+    def _on_h1(self, line: str, m: "_re.Match[str]") -> None:
+        self.seen_h1 = True
+        self._emit_heading(1, line[2:].strip())
+
+    def _on_table(self, line: str, m: "_re.Match[str]") -> None:
+        # СТРОКА-ТАБЛИЦА = БЛОК (leading `|` — объявленная грамматика подмножества;
+        # проза-с-палкой начинается не с `|`). Накапливаем; тип решит _close_table.
+        self.open = "table"
+        self.buf.append(line.strip())
+
+    def _on_list(self, line: str, m: "_re.Match[str]") -> None:
+        # СПИСОК = ОДИН механизм: МАРКЕР решает тег (- →ul, N.→ol). <ol> есть
+        # АВТОСЛЕДСТВИЕ этого, а не вторая ветка (декларативно: маркер → тег).
+        kind = "ul" if m.lastgroup == "ul" else "ol"
+        if self.open == "list" and self.list_kind != kind:
+            self.close()                        # смена типа списка = разные списки
+        self.list_kind = kind
+        item = line.lstrip()[2:].strip() if kind == "ul" else m.group("item").strip()
+        self.open = "list"
+        self.buf.append([item])
+
+    def _on_cont(self, line: str, m: "_re.Match[str]") -> None:
+        # Hanging indent → continuation of the OPEN bullet, not a new <p>.
+        self.buf[-1].append(line.strip())
+
+    def _on_quote(self, line: str, m: "_re.Match[str]") -> None:
+        # BLOCKQUOTE = контейнер-блок (Σ: ТКП worked-examples «> Бухгалтер: …»).
+        self.open = "quote"
+        self.buf.append(line.strip().lstrip(">").strip())
+
+    def _on_blank(self, line: str, m: "_re.Match[str]") -> None:
+        pass                                    # пустая строка лишь закрывает блок (`feed`)
+
+    def _on_text(self, line: str, m: "_re.Match[str]") -> None:
+        self.open = "p"
+        self.buf.append(line.strip())
+
+    _ON_LINE = {"rule": _on_rule, "image": _on_image, "h3": _on_h3, "h2": _on_h2,
+                "h1": _on_h1, "table": _on_table, "ul": _on_list, "ol": _on_list,
+                "quote": _on_quote, "blank": _on_blank, "text": _on_text, "cont": _on_cont}
+
+
+def _md_static_iter(md_body: str, line_mode: str = "verse",
+                    fragments: "Iterable[str] | None" = None,
+                    structural: "Iterable[str] | None" = None,
+                    fragment_source: str = "",
+                    assert_each: bool = True,
+                    headings: "dict[str, dict[str, Any]] | None" = None) -> "Iterator[str]":
+    """Потоковая форма `_md_static_to_html`: отдаёт HTML-фрагменты (блок за блоком) в
+    порядке документа; `"\\n".join(...)` над ними — ровно `_md_static_to_html`.
+
+    Живёт только открытый блок: буферы строк, якоря `seen` и удерживаемая хвостовая
+    линейка — пиковая память растёт лишь с числом заголовков (`seen`), не с текстом
+    документа (scripts/bench_md_stream.py). Разбор — `_MdStatic` (классификатор строки +
+    машина состояний блоков; пропускная способность — scripts/bench_md_tokenizer.py).
+    `assert_each` — Inv-SITE-no-raw-markdown над КАЖДЫМ фрагментом в момент отдачи:
+    нарушение ловится там, где порождено, а не после сборки страницы.
+    `headings` — dict-приёмник индекса заголовков (см. `heading_index`)."""
+    body = _re.sub(r"<!--.*?-->", "", md_body, flags=_re.DOTALL)
+    machine = _MdStatic(line_mode, fragments, structural, fragment_source,
+                        assert_each, headings)
+    for raw_line in _iter_lines(body):
+        machine.feed(raw_line)
+        yield from machine.drain(final=False)
+    machine.close()
+    yield from machine.drain(final=True)
+
+
+def _md_static_to_html(md_body: str, line_mode: str = "verse",
+                       fragments: "Iterable[str] | None" = None,
+                       structural: "Iterable[str] | None" = None,
+                       fragment_source: str = "",
+                       headings: "dict[str, dict[str, Any]] | None" = None) -> str:
+    """Render a constrained markdown subset → HTML body fragment.
+
+    fragments — якоря секций, чей ПЕРВОИСТОЧНИК (фрагмент эфира) конспект несёт при себе.
+    Объявляется ДОКУМЕНТОМ (frontmatter `fragments:`), как и `line_mode`: рендерер не гадает,
+    он исполняет объявленное. Плеер встаёт НА ПОЛЯХ (рельс сетки), против своей секции —
+    Inv-CONSP-fragment-at-source. Привязка к носителю ВЫВОДИТСЯ: `/audio/text/<якорь>.m4a`,
+    где якорь есть тот самый адрес, что секция уже несёт.
+
+    line_mode — СЕМАНТИКА переноса строки, объявляемая ДОКУМЕНТОМ (frontmatter
+    `line_mode:`), не угадываемая рендерером:
+      verse (default) — перенос авторский: строка → span.l блок (висячий
+              отступ её wrap'ов — CSS-регистр). Класс: построчно-правленные
+              тексты (конспект; засвидетельствовано 2026-07-10).
+      flow  — перенос редакторский: строки склеиваются пробелом (классический
+              markdown). Класс: legal/manifesto-документы, набранные с
+              wrap-ом по удобству. Закрывает квантификационную дыру
+              line-fidelity (инвариант предполагал verse у ВСЕХ static-md).
+
+    Pure function. No external markdown library — the subset is small and
+    bounded by the legal-doc / manifesto / konspekt class. Inline HTML in
+    source is passed through verbatim (admin-authored, single-SoT trusted;
+    no L0 untrusted input flows here). HTML comments are stripped — they
+    carry admin-fill placeholders meant for the source file, not visitors.
+
+    Line-fidelity contract (Inv-SITE-line-fidelity): admin edits these
+    files построчно (Релевантное Окно) — a newline inside a paragraph or a
+    list item is an AUTHORED break and renders as <br>; the published page
+    must show the exact line structure the admin approved. Blank line =
+    paragraph boundary, как прежде. The 2026-07-10 konspekt render collapsed
+    authored lines and split every multi-line bullet into <ul>+<p> fragments
+    mid-sentence — this contract is the permanent constraint against both.
+    """
+    html = "\n".join(_md_static_iter(md_body, line_mode, fragments, structural,
+                                      fragment_source, assert_each=False,
+                                      headings=headings))
     _assert_rendered(html)
     return html
 
 
-def _assert_rendered(html: str) -> None:
+def _judged(fragments: "Iterable[str]", sep: str = "\n") -> "Iterator[str]":
+    """Поток фрагментов под судьёй ВСЕГО тела: после последнего фрагмента —
+    `_assert_rendered(sep.join(...))`, как у `_md_static_to_html`.
+
+    Судья фрагмента не видит пары, разорванной границей блока (`*руб\n\nи 3*` —
+    каждый блок чист, склейка — нет): продукции `_GRAMMAR` не ограничены по длине, окна
+    фиксированной ширины нет. Потребитель обязан дочитать поток до записи (`_write` —
+    атомарен: отказ посреди потока файл не трогает)."""
+    seen: list[str] = []
+    for frag in fragments:
+        seen.append(frag)
+        yield frag
+    _assert_rendered(sep.join(seen))
+
+
+def _interleave(sep: str, fragments: "Iterable[str]") -> "Iterator[str]":
+    """`sep.join(fragments)` как поток фрагментов: `"".join(_interleave(s, xs)) == s.join(xs)`."""
+    for i, frag in enumerate(fragments):
+        if i:
+            yield sep
+        yield frag
+
+
+class RenderViolation(NamedTuple):
+    """Одно нарушение Inv-SITE-no-raw-markdown: продукция, смещение в документе, текст."""
+    production: str
+    offset: int
+    text: str
+
+
+class RawMarkdownError(ValueError):
+    """Рендер отказал: в выходе осталась неотрендеренная разметка. `violations` — все."""
+
+    def __init__(self, message: str, violations: "list[RenderViolation]") -> None:
+        super().__init__(message)
+        self.violations = violations
+
+
+def scan_rendered(html: str, base: int = 0) -> "list[RenderViolation]":
+    """Все совпадения продукций `_GRAMMAR` в `html` одним проходом (пусто ⇔ закон держит)."""
+    return [RenderViolation(m.lastgroup or "?", base + m.start(), m.group(0))
+            for m in _GRAMMAR_SCAN.finditer(html)]
+
+
+def _assert_rendered(html: str, base: int = 0) -> None:
     """Inv-SITE-no-raw-markdown — рендер НЕ ОТГРУЖАЕТ публике то, чего не понял.
 
     Σ 2026-07-12: рендерер не знал ссылок и молча пропустил их насквозь — `[Ольга Розет](…)`
@@ -4478,13 +6019,19 @@ def _assert_rendered(html: str) -> None:
     Первый заход судил ОДНУ продукцию (ссылку) — и пропустил бы КАРТИНКУ, чей `![…](…)`
     ссылочная продукция съедает, оставляя сироту «!»: закон, перечисляющий продукции, есть
     ВТОРОЕ кодирование грамматики, и оно отстаёт от первого ровно на ту продукцию, которой ещё
-    нет. Квантификация по таблице снимает класс: новая продукция судится ДАРОМ."""
-    for name, pat, _rep in _GRAMMAR:
-        m = pat.search(html)
-        if m:
-            raise ValueError(
-                f"Inv-SITE-no-raw-markdown: неотрендеренная разметка ({name}) дошла до выхода — "
-                f"{m.group(0)[:60]!r}. Рендер обязан ОТКАЗАТЬ, а не отгрузить её публике.")
+    нет. Квантификация по таблице снимает класс: новая продукция судится ДАРОМ.
+
+    Один проход (`_GRAMMAR_SCAN`), отчёт — ВСЕ нарушения с продукцией и смещением
+    (`base` сдвигает смещения, когда судится фрагмент: поток зовёт судью на каждом блоке,
+    и нарушение ловится там, где порождено)."""
+    violations = scan_rendered(html, base)
+    if violations:
+        listed = "; ".join(f"{v.production}@{v.offset} {v.text[:60]!r}" for v in violations[:10])
+        more = f" (+{len(violations) - 10})" if len(violations) > 10 else ""
+        raise RawMarkdownError(
+            f"Inv-SITE-no-raw-markdown: неотрендеренная разметка дошла до выхода — "
+            f"{len(violations)}: {listed}{more}. Рендер обязан ОТКАЗАТЬ, а не отгрузить её публике.",
+            violations)
 
 
 def p_redirect(d: dict[str, Any], to: str, title: str = "") -> str:
@@ -4543,7 +6090,7 @@ def _meta_join(parts: list[str] | tuple[str, ...], lang: str = "ru") -> str:
     DATA (knowledge/system/typography/<lang>.yaml `meta_join`, same SoT and
     loader as every typography rule); built-ins are the fail-open fallback.
     """
-    mj = (_load_typo_rules(lang).get("meta_join") or {})
+    mj = _TYPO_ENGINE.meta_join(lang)
     terminal = str(mj.get("terminal") or ".!?…:;»")
     separator = str(mj.get("separator") or " — ")
     cleaned = [" ".join(str(p).split()) for p in parts]
@@ -4636,7 +6183,8 @@ def p_document_menu(delivered: "Any" = (), *, printable: bool = True) -> str:
             if items else "")
 
 
-def _document_body(md_text: str) -> "tuple[dict[str, Any], str]":
+def _document_body(md_text: str, headings: "dict[str, dict[str, Any]] | None" = None
+                   ) -> "tuple[dict[str, Any], str]":
     """(front-matter, rendered body) — the ONE call that turns a document's source into
     its body, shared by every projection of it.
 
@@ -4645,11 +6193,89 @@ def _document_body(md_text: str) -> "tuple[dict[str, Any], str]":
     reached one of them.  A projection family whose members re-derive the body
     separately is the drift this whole module is about, one floor down."""
     fm, body_md = parse_static_md(md_text)
-    return fm, _md_static_to_html(
-        body_md, line_mode=str(fm.get("line_mode") or "verse"),
-        fragments=fm.get("fragments") or (),
-        fragment_source=str(fm.get("fragment_source") or ""),
-        structural=fm.get("structural_headings") or ())
+    return fm, _md_static_to_html(body_md, headings=headings, **_document_md_args(fm))
+
+
+def _document_body_fragments(md_text: str, headings: "dict[str, dict[str, Any]] | None" = None
+                             ) -> "tuple[dict[str, Any], Iterator[str]]":
+    """`_document_body` потоком: тело — фрагменты `_md_static_iter`, `"\n".join` над ними —
+    ровно тело `_document_body`. Судья — над склеенным телом (`_judged`), как у
+    `_document_body`: отказ приходит с последним фрагментом. Ленив: `headings`
+    наполняется по мере чтения."""
+    fm, body_md = parse_static_md(md_text)
+    return fm, _judged(_md_static_iter(body_md, assert_each=False, headings=headings,
+                                       **_document_md_args(fm)))
+
+
+def _document_md_args(fm: dict[str, Any]) -> dict[str, Any]:
+    """Объявления документа (frontmatter), которые исполняет рендер тела."""
+    return {"line_mode": str(fm.get("line_mode") or "verse"),
+            "fragments": fm.get("fragments") or (),
+            "fragment_source": str(fm.get("fragment_source") or ""),
+            "structural": fm.get("structural_headings") or ()}
+
+
+# ── Индекс заголовков: якорь → (уровень, текст, блок, смещение) ──────────────────────────
+#
+# `anchor()` ВЫВОДИТ адрес подтекста из заголовка, но резолвер ссылок (`_prose_entity_links`,
+# `entity_address`) не знал, какие якоря СУЩЕСТВУЮТ — битый `#фрагмент` обнаруживался лишь в
+# мире. Индекс пишется рендером (тот же `seen`), лежит рядом со страницей (`headings.json`)
+# и собирается в карту сайта: проверка фрагмента — поиск в словаре, не перерендер. Тот же
+# файл кормит клиентскую навигацию по странице без обхода DOM.
+
+_HEADINGS_FILE = "headings.json"
+
+#: Карта сайта: адрес страницы (`Page.url`) → её индекс. Наполняется ТОЛЬКО
+#: `load_heading_indexes` — сборка пишет `headings.json` всех static-страниц и грузит карту
+#: ДО первого рендера, так что `fragment_known` не зависит от порядка рендера и от процесса.
+SITE_HEADINGS: "dict[str, dict[str, dict[str, Any]]]" = {}
+
+
+def heading_index(md_text: str) -> "dict[str, dict[str, Any]]":
+    """Индекс заголовков документа (рендер тела — через кэш блоков, то есть дёшево)."""
+    idx: dict[str, dict[str, Any]] = {}
+    _document_body(md_text, headings=idx)
+    return idx
+
+
+def heading_index_file(slug: str) -> PurePosixPath:
+    """Носитель индекса — рядом со страницей: `<slug>/headings.json`."""
+    return _page.Page(slug).file.parent / _HEADINGS_FILE
+
+
+def p_heading_index(md_text: str) -> str:
+    """Индекс → компактный JSON (порядок ключей = порядок документа)."""
+    import json as _json
+    return _json.dumps(heading_index(md_text), ensure_ascii=False, separators=(",", ":"))
+
+
+def load_heading_indexes(site_dir: "str | Path") -> int:
+    """Собрать уже записанные `*/headings.json` сборки в SITE_HEADINGS. → число страниц."""
+    import json as _json
+    root, n = Path(site_dir), 0
+    for f in sorted(root.rglob(_HEADINGS_FILE)):
+        page = _page.Page.of_file(f.parent.relative_to(root) / _page.INDEX)
+        if page is None:
+            continue
+        try:
+            SITE_HEADINGS[page.url] = _json.loads(f.read_text(encoding="utf-8"))
+            n += 1
+        except (OSError, ValueError) as e:
+            _LOG.warning("headings index %s нечитаем (%s)", f, type(e).__name__)
+    return n
+
+
+def fragment_known(href: str) -> "bool | None":
+    """Существует ли `#фрагмент` ссылки `href` на её странице. None (⊥) — индекса страницы
+    нет в карте: «не вижу» ≠ «нет» (Inv-EPI-unknown-is-identity); без фрагмента — True."""
+    from urllib.parse import urlsplit, unquote
+    parts = urlsplit(href)
+    if not parts.fragment:
+        return True
+    idx = SITE_HEADINGS.get(parts.path or "/")
+    if idx is None:
+        return None
+    return unquote(parts.fragment) in idx
 
 
 def p_document(d: dict[str, Any], md_text: str, slug: str = "", css: str = "") -> str:
@@ -4685,10 +6311,17 @@ def p_document(d: dict[str, Any], md_text: str, slug: str = "", css: str = "") -
 
 def p_static_page(d: dict[str, Any], md_text: str, slug: str = "",
                   formats: "Any" = None) -> str:
-    """Project (D, static.md) → standalone HTML page.
+    """`p_static_page_fragments`, склеенная в одну строку."""
+    return "".join(p_static_page_fragments(d, md_text, slug, formats))
+
+
+def p_static_page_fragments(d: dict[str, Any], md_text: str, slug: str = "",
+                            formats: "Any" = None) -> "list[str]":
+    """Project (D, static.md) → standalone HTML page, as ordered fragments.
 
     Pure projection. Front-matter `title` drives <title>/<h1>; `description`
-    drives meta-description. Body rendered via `_md_static_to_html`. Layout
+    drives meta-description. Body streamed via `_md_static_iter` (block by
+    block); the raw-markdown judge runs over the joined body (`_judged`). Layout
     inherits the owner's footer.legal + cookie banner + skip-link surface
     — single SoT for trust-base across every page (Inv-SITE-trust-base).
 
@@ -4700,7 +6333,7 @@ def p_static_page(d: dict[str, Any], md_text: str, slug: str = "",
     Web-Broadcasting host (konspekt: canonical → parisinseptember.ru while
     mirrored on olgarozet.ru — mirror must not self-canonicalize).
     """
-    fm, body_html = _document_body(md_text)
+    fm, body = _document_body_fragments(md_text)
     title = fm.get("title") or ""
     description = fm.get("description") or title
     slug = fm.get("slug") or slug
@@ -4712,8 +6345,8 @@ def p_static_page(d: dict[str, Any], md_text: str, slug: str = "",
     # коммерческих поверхностях (лендинг), не на текстовых (конспект/manifesto);
     # сама политика-страница тем более не ссылается на себя.
     legal_html = _legal_footer(d) if fm.get("legal_footer") is True else ""
-    article = (f'  <article class="article-wrapper">{body_html}'
-               f'{legal_html}</article>')
+    article = ['  <article class="article-wrapper">', *_interleave("\n", body), legal_html,
+               '</article>']
     base_canon = _canonical(d)
     canonical = fm.get("canonical") or (
         f"{base_canon}/{slug}/" if base_canon and slug else "")
@@ -4721,7 +6354,7 @@ def p_static_page(d: dict[str, Any], md_text: str, slug: str = "",
     # byline-крюк Readability-семейства (Safari/Firefox/Chrome reader).
     author_meta = (f'<meta name="author" content="{_t(fm.get("author"))}">\n'
                    if fm.get("author") else "")
-    return _layout(
+    return _layout_fragments(
         d,
         title=(title or "Страница"),
         description=_meta_trim(description),
@@ -4874,6 +6507,9 @@ def _apply_extractor(rule: dict[str, Any], external_url: str | None, platform_id
     return None
 
 
+_EVENT_ANCHORS_KEY = "_event_anchors"   # derived per-snapshot π_anchor, not content — see all_event_anchors
+
+
 def event_anchors(d: dict[str, Any], event_id: str, only_live: bool = True) -> dict[str, Any]:
     """π_anchor functor: derive anchor URL-locators per Channel from publications[].
 
@@ -4887,7 +6523,27 @@ def event_anchors(d: dict[str, Any], event_id: str, only_live: bool = True) -> d
     only_live: if True, only publications с status=live count; else include planned.
     Default True (admin'ское «оформившееся событие имеет Главный Пост» — Main Post
     must be live к момент anchor-resolution).
+
+    A lookup into `all_event_anchors(d, only_live)` — the Spec, the presence
+    witness and the publication pass are paid once per snapshot, not per event.
     """
+    return dict(all_event_anchors(d, only_live).get(event_id) or {})
+
+
+def all_event_anchors(d: dict[str, Any], only_live: bool = True) -> dict[Any, dict[str, Any]]:
+    """π_anchor для ВСЕХ событий разом: event_id → {anchor key → locator}.
+
+    Одно чтение `status_groups` Спеки, один вызов свидетеля присутствия, один проход по
+    publications (main_post сгруппированы по target_event) — вместо всех трёх на каждое
+    событие (Скоро, посадочные, Telegram спрашивают каждое). Ключи: id каждого события
+    (пустой dict — якорей нет) ⊔ target_event каждого засчитанного main_post. Живёт в
+    самом `d`, как `graph_index`, и годен, пока годен он (те же списки событий и
+    публикаций). Результат — общий: правьте копию (`event_anchors` её и отдаёт)."""
+    ix = graph_index(d)
+    memo = d.setdefault(_EVENT_ANCHORS_KEY, {})
+    hit = memo.get(only_live)
+    if hit is not None and hit[0] is ix:
+        return hit[1]
     # Status filter from the Spec's OWN semantic groups (entity-publication.md::
     # enforcement_data.status_groups.completed) — the prior literal `== "live"` named a
     # status that exists NOWHERE in the taxonomy (planned/staged/…/published), so every
@@ -4900,7 +6556,7 @@ def event_anchors(d: dict[str, Any], event_id: str, only_live: bool = True) -> d
         _completed = set((_ed("entity-publication").get("status_groups") or {})
                          .get("completed") or ())
     except Exception as e:  # unreadable Spec ⇒ NO main_post anchors — loudly, never silently
-        _LOG.warning("event_anchors: status_groups SoT unreadable (%s: %s) — "
+        _LOG.warning("all_event_anchors: status_groups SoT unreadable (%s: %s) — "
                      "main_post anchors disabled this render", type(e).__name__, e)
         _completed = set()
     # Liveness gate: a stored status is a CLAIM; death is MEASURED. The presence axis
@@ -4925,17 +6581,15 @@ def event_anchors(d: dict[str, Any], event_id: str, only_live: bool = True) -> d
         _owner = d.get("_owner")   # stamped by load_owner_data; an off-waist dict ⇒ ⊥ (logged)
         _absent = absent_publication_ids(_owner) if _owner else None
     except Exception as e:  # a buggy witness must not kill the render — but LOUDLY
-        _LOG.warning("event_anchors: presence witness failed (%s: %s) — liveness blind",
+        _LOG.warning("all_event_anchors: presence witness failed (%s: %s) — liveness blind",
                      type(e).__name__, e)
     if _absent is None:
-        _LOG.debug("event_anchors: presence death-witness blind (unmeasured/unreadable) — gate passes all")
+        _LOG.debug("all_event_anchors: presence death-witness blind (unmeasured/unreadable) — gate passes all")
 
-    anchors: dict[str, Any] = {}
-    for p in d.get("publications", []):
+    out: dict[Any, dict[str, Any]] = {}
+    for p in d.get("publications") or []:           # ОДИН проход: main_post → его target_event
         if p.get("kind") != "main_post":
             continue
-        if p.get("target_event") != event_id:
-            continue
         if only_live and p.get("status") not in _completed:
             continue
         if _absent and str(p.get("id")) in _absent:   # PROVEN dead on its medium (any channel)
@@ -4947,18 +6601,20 @@ def event_anchors(d: dict[str, Any], event_id: str, only_live: bool = True) -> d
         canonical_key = _anchor_key_for(channel)
         locator = _apply_extractor(rule, p.get("external_url"), p.get("platform_id"))
         if locator is not None:
-            anchors[canonical_key] = locator
+            out.setdefault(p.get("target_event"), {})[canonical_key] = locator
     # Augment с landing URL when explicit publication absent but event.web_addresses present.
     # admin'ская модель: «Кампания основную информацию вещает через Посадочную» —
     # landing is canonical и rarely needs separate Publication entry.
-    if "landing" not in anchors:
-        ev = next((e for e in d.get("events", []) if e.get("id") == event_id), None)
-        if ev:
+    for evs in ix.events_by_id.values():
+        ev = evs[0]                                   # первый носитель id — как ix.event
+        anchors = out.setdefault(ev.get("id"), {})
+        if "landing" not in anchors:
             web_addrs = ev.get("web_addresses") or []
             if web_addrs:
                 addr = web_addrs[0]
                 anchors["landing"] = addr if addr.startswith("http") else f"https://{addr}"
-    return anchors
+    memo[only_live] = (ix, out)
+    return out
 
 
 def p_telegram(d: dict[str, Any]) -> str:
@@ -5284,7 +6940,52 @@ if(d.ok){{submitted=true;
 # why the next site reproduced it. atomic_write_text is already total (ensure_dir inside), so
 # this is a deletion: two hand-rolled mkdirs go, and crash-safety plus writer-isolation that
 # no raw call ever had come for free.
-from utils.atomic import atomic_write_text as _write   # noqa: E402
+from utils.atomic import atomic_write_text as _atomic_write_text   # noqa: E402
+
+
+@_lru_cache(maxsize=1)
+def _new_file_mode() -> int:
+    """Mode a plain `open(path, "w")` would create with: 0o666 minus the process umask."""
+    import os as _os
+    umask = _os.umask(0)
+    _os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _write(path: "str | Path", content: "str | bytes | Iterable[str]") -> None:
+    """The ONE total write verb. `str` goes to `atomic_write_text` as before; bytes and
+    ordered fragments take the same protocol streamed — parent ensured, temp file in the
+    target's directory, `writelines`, fsync, `os.replace` — so a page is never joined
+    into one string and a reader never sees a half-written file. The temp file gets the
+    mode a plain write would (mkstemp alone leaves 0600): the published page must not
+    depend on which path wrote it."""
+    if isinstance(content, str):
+        _atomic_write_text(path, content)
+        return
+    import os as _os
+    import tempfile as _tempfile
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        _os.fchmod(fd, _new_file_mode())
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            with _os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+                fh.flush()
+                _os.fsync(fh.fileno())
+        else:
+            with _os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+                fh.writelines(content)
+                fh.flush()
+                _os.fsync(fh.fileno())
+        _os.replace(tmp, path)
+    except BaseException:
+        try:
+            _os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 class Projection(NamedTuple):
@@ -5295,13 +6996,18 @@ class Projection(NamedTuple):
     GET, деплой берёт его однажды; таблица выводится из того же d, что и рендер)."""
     label: str
     file: PurePosixPath
-    render: Callable[[], str]
+    render: "Callable[[], str]"
+    stream: "Callable[[], Iterable[str]] | None" = None   # та же страница упорядоченными фрагментами
 
     @property
     def address(self) -> str:
         """Адрес, по которому мир его берёт — ФУНКЦИЯ носителя, не второе объявление."""
         return _page.address_of(self.file)
 
+    def fragments(self) -> "Iterable[str]":
+        """Вывод `render()` фрагментами для `_write`; без `stream` — одна строка целиком."""
+        return self.stream() if self.stream is not None else (self.render(),)
+
 
 def owner_projections(d: dict[str, Any]) -> "list[Projection]":
     """ЕДИНСТВЕННАЯ деривация «что владелец публикует СОБОЙ» — π и F одной функцией.
@@ -5369,13 +7075,141 @@ def retired_carriers(d: dict[str, Any]) -> "list[Path]":
     return [_page.Page(cons.get("link") or "init").at(ROOT).parent]
 
 
+# ── Parallel page build: landings + static pages on a process pool ───
+
+def page_projections(d: dict[str, Any], site_dir: "str | Path" = ROOT,
+                     formats: "Callable[[str], Any] | None" = None) -> "list[Projection]":
+    """Посадочные событий и static-страницы — те же `Projection`, что у владельца.
+
+    Посадочная есть ⟺ у события определены lead + sections (ровно то, что требует
+    `p_event_landing`); порядок — порядок `d.events`, затем `discover_static_pages`.
+    Static-страница рендерится в ЧИТАТЕЛЬСКОЙ форме: `formats(slug)` — доставленные
+    форматы документа (⊥ = ни одного; меню несёт лишь «Распечатать»)."""
+    out: list[Projection] = []
+    for ev in d.get("events") or []:
+        if ev.get("lead") and ev.get("sections"):
+            out.append(Projection(f"landing:{ev['id']}", _page.Page(ev["id"]).file,
+                                  lambda ev=ev: p_event_landing(d, ev),
+                                  lambda ev=ev: p_event_landing_fragments(d, ev)))
+    for slug, path in discover_static_pages(site_dir):
+        def stream(p: Path = path, s: str = slug) -> "list[str]":
+            return p_static_page_fragments(d, p.read_text(encoding="utf-8"), s,
+                                           formats=(formats(s) if formats else {}))
+        out.append(Projection(f"static:{slug}", _page.Page(slug).file,
+                              lambda stream=stream: "".join(stream()), stream))
+    return out
+
+
+def _warm_render_caches(d: dict[str, Any]) -> None:
+    """Прогреть кэши правил ДО fork: каждый рабочий наследует их копией страниц
+    памяти, а не перечитывает Спеки и rule pack сам. Сбой прогрева не фатален —
+    тот же вызов повторит (и честно уронит) сам рендер."""
+    warm: "list[Callable[[], Any]]" = [
+        _rulepack, _generator_digest, _vulgar_fraction_table, _no_terminal_period_cfg,
+        _math_symbols_cfg, _math_rel_wrap_re, _ongoing_eligible, _renderable_for,
+        _all_stages_non_terminal, _schema_event_status_map, lambda: landing_children(d),
+        lambda: place_index(d), lambda: all_event_anchors(d),
+        lambda: schema_events_jsonld(d),          # узлы графа JSON-LD — до fork, одни на всех
+        lambda: _TYPO_ENGINE.pack((d.get("languages") or {}).get("host") or "ru")]
+    for fn in warm:
+        try:
+            fn()
+        except Exception as e:
+            _LOG.debug("warm %s failed before fork (%s) — worker recomputes",
+                       getattr(fn, "__name__", fn), type(e).__name__)
+
+
+_FORK_PROJECTIONS: "list[Projection]" = []   # задания пула: наследуются fork'ом, не пиклятся
+
+
+def _render_forked(i: int) -> str:
+    return _FORK_PROJECTIONS[i].render()
+
+
+def render_projections(projections: "list[Projection]", workers: int = 1) -> "list[str]":
+    """HTML проекций в ПОРЯДКЕ `projections` — при `workers > 1` на пуле процессов.
+
+    Каждая проекция — чистая функция снимка `d`, поэтому рабочие форкаются ПОСЛЕ
+    загрузки данных и прогрева кэшей правил (вызывающий зовёт `_warm_render_caches(d)`
+    до нас) и получают задания индексом: замыкания `render` не пиклятся, они наследуются. `pool.map` собирает
+    результаты в фиксированном порядке — вывод побайтно равен последовательной сборке.
+    Исключение рендера в рабочем поднимается здесь же, как и в последовательной сборке.
+    Счётчики `build_stats()` рабочих в родителя не возвращаются.
+
+    Без старта `fork` (Windows) — честная деградация в последовательную сборку."""
+    if workers <= 1 or len(projections) < 2:
+        return [p.render() for p in projections]
+    import multiprocessing as _mp
+    if "fork" not in _mp.get_all_start_methods():
+        _LOG.warning("render_projections: no fork start method — rendering serially")
+        return [p.render() for p in projections]
+    global _FORK_PROJECTIONS
+    _FORK_PROJECTIONS = list(projections)
+    try:
+        with _mp.get_context("fork").Pool(min(workers, len(projections))) as pool:
+            return pool.map(_render_forked, range(len(projections)), chunksize=1)
+    finally:
+        _FORK_PROJECTIONS = []
+
+
 if __name__ == "__main__":
-    d = load()
-    for _pr in owner_projections(d):
-        _write(ROOT / _pr.file, _pr.render())
-        print(f"{_pr.label}: {_pr.file}")
-    for _dead in retired_carriers(d):
-        if _dead.is_dir():
-            import shutil as _sh
-            _sh.rmtree(_dead)
-        print(f"booking: omitted (booking_disabled) — {_dead.name}/ снят")
+    import argparse as _argparse
+    _ap = _argparse.ArgumentParser(description="Regenerate the owner projections.")
+    _ap.add_argument("--pages", action="store_true",
+                     help="also render event landings and static pages")
+    _ap.add_argument("--workers", type=int, default=1,
+                     help="process-pool size for --pages (1 = serial)")
+    _ap.add_argument("--profile-landings", metavar="JSON", default="",
+                     help="with --pages: dump per-phase landing timings (forces --workers 1)")
+    _ap.add_argument("--next-change", action="store_true",
+                     help="print (JSON) when a surface's visible set next changes and which "
+                          "projections that touches, then exit without building")
+    _args = _ap.parse_args()
+    if _args.next_change:
+        import json as _json
+        with render_clock():
+            _changes = next_stage_change(load())
+        print(_json.dumps({
+            "at": _changes[0].at.isoformat() if _changes else None,
+            "changes": [{"event": c.event_id, "before": c.before, "after": c.after,
+                         "surfaces": list(c.surfaces), "projections": list(c.projections)}
+                        for c in _changes],
+        }, ensure_ascii=False, indent=2))
+        raise SystemExit(0)
+    with render_clock():                # одно «сейчас» на всю сборку
+        d = load(typeset=True)
+        if _args.pages:                 # индексы заголовков — до любого рендера (fragment_known)
+            for _slug, _path in discover_static_pages(ROOT):
+                _write(ROOT / heading_index_file(_slug),
+                       p_heading_index(_path.read_text(encoding="utf-8")))
+        load_heading_indexes(ROOT)      # карта сайта: свежие индексы, иначе — прошлой сборки
+        for _pr in owner_projections(d):
+            _write(ROOT / _pr.file, _pr.render())
+            print(f"{_pr.label}: {_pr.file}")
+        if _args.pages:
+            _warm_render_caches(d)
+            _pages = page_projections(d)
+            from contextlib import nullcontext as _nullcontext
+            if _args.profile_landings and _args.workers > 1:
+                # Замер живёт в процессе: форк пишет в СВОЮ копию _LANDING_PROFILE, и родитель
+                # выгрузил бы пустой JSON как успешный. Профиль — только последовательно.
+                _LOG.warning("--profile-landings: --workers %d → 1 (замер в форках теряется)",
+                             _args.workers)
+                _args.workers = 1
+            with (profile_landings() if _args.profile_landings else _nullcontext()) as _prof:
+                if _args.workers <= 1:              # последовательно — фрагменты прямо в файл
+                    for _pr in _pages:
+                        _write(ROOT / _pr.file, _pr.fragments())
+                        print(f"{_pr.label}: {_pr.file}")
+                else:
+                    for _pr, _page_html in zip(_pages, render_projections(_pages, _args.workers)):
+                        _write(ROOT / _pr.file, _page_html)
+                        print(f"{_pr.label}: {_pr.file}")
+            if _args.profile_landings:
+                _prof.dump(_args.profile_landings)
+                print(f"landing phases: {_args.profile_landings}")
+        for _dead in retired_carriers(d):
+            if _dead.is_dir():
+                import shutil as _sh
+                _sh.rmtree(_dead)
+            print(f"booking: omitted (booking_disabled) — {_dead.name}/ снят")
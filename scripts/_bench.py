@@ -0,0 +1,109 @@
+"""
+Shared helpers for the scripts/bench_*.py benchmarks: timing (`timed`,
+`best_of`, `measure`), the identity gate every benchmark passes before it
+reports a number (`identical`), and baseline revisions of generate.py loaded
+from git (`revision_before`, `load_baseline`).
+
+A baseline is compiled from `git show REV:generate.py` under the same
+`__file__` as the current module, so it resolves the same typography rules and
+data. Its caches (rule pack, block caches, data snapshots) go to a scratch
+directory removed at exit: a benchmark must not write derived files of another
+revision into the repo tree or into the user cache the real build reads.
+"""
+import atexit
+import gc
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def timed(fn) -> "tuple[float, Any]":
+    """(секунды, результат) одного вызова."""
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def best_of(fn, repeat: int, before=None) -> float:
+    """Лучшее время `fn()` из `repeat`; `before()` — вне замера (сброс кэша и т. п.).
+    Сборщик на время вызова выключен, как у timeit: он шум, не замер."""
+    best = float("inf")
+    for _ in range(repeat):
+        if before:
+            before()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+    return best
+
+
+def measure(fn) -> "tuple[float, int]":
+    """(секунды, пик tracemalloc в байтах) одного вызова."""
+    tracemalloc.start()
+    try:
+        dt, _ = timed(fn)
+        _cur, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return dt, peak
+
+
+def identical(got, want, what: str) -> bool:
+    """Гейт перед любым числом: `got == want`, иначе печатает `FAIL: <what>` → False."""
+    if got == want:
+        return True
+    print(f"FAIL: {what}")
+    return False
+
+
+def revision_before(request_id: str) -> str:
+    """Parent of the commit that implemented `request_id` (`[<id>] …`, not `[<id>] fix: …`).
+
+    Resolved by subject, not pinned by hash: a hash inside an unmerged series stops
+    resolving after a rebase. Exits with a hint when no such commit is in the history."""
+    log = subprocess.run(["git", "log", "--reverse", "--format=%h %s"], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    tag = f"[{request_id}] "
+    for line in log.splitlines():
+        sha, _, subject = line.partition(" ")
+        if subject.startswith(tag) and not subject[len(tag):].startswith("fix:"):
+            return f"{sha}~1"
+    raise SystemExit(f"no commit with subject '{tag}…' in the history; pass --baseline <rev>")
+
+
+def load_baseline(rev: str) -> types.ModuleType:
+    """generate.py at `rev` as module `generate_baseline`, its caches in a scratch dir."""
+    src = subprocess.run(["git", "show", f"{rev}:generate.py"], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    scratch = Path(tempfile.mkdtemp(prefix="bench-baseline-"))
+    atexit.register(shutil.rmtree, scratch, ignore_errors=True)
+    mod = types.ModuleType("generate_baseline")
+    mod.__file__ = str(ROOT / "generate.py")
+    sys.modules[mod.__name__] = mod          # dataclasses ищут модуль класса в sys.modules
+    prev = os.environ.get("GENERATE_CACHE_DIR")
+    os.environ["GENERATE_CACHE_DIR"] = str(scratch)   # кэши, связанные при импорте
+    try:
+        exec(compile(src, mod.__file__, "exec"), mod.__dict__)
+    finally:
+        if prev is None:
+            del os.environ["GENERATE_CACHE_DIR"]
+        else:
+            os.environ["GENERATE_CACHE_DIR"] = prev
+    if hasattr(mod, "_cache_root"):
+        mod._cache_root = lambda: scratch
+    if hasattr(mod, "_rulepack_dir"):        # ревизии, писавшие rule pack в дерево репо
+        mod._rulepack_dir = lambda: scratch / "rulepacks"
+    return mod
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+data.yaml load time: the previous loader (`yaml.safe_load`, pure Python) vs
+`generate.load()` cold (C loader, snapshot miss + write) and warm (snapshot
+hit, no YAML parse at all).
+
+Every variant must produce the same record as the previous loader, including
+`_asset_root`, key order and scalar types (compared by repr), before any
+timing is reported. Snapshots are written to a scratch directory, never to
+the build's cache root.
+
+Usage:
+    python3 scripts/bench_data_load.py                # best of 5
+    python3 scripts/bench_data_load.py --repeat 20
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import yaml  # noqa: E402
+
+import generate  # noqa: E402
+from _bench import best_of, identical  # noqa: E402
+
+
+def previous_load() -> dict:
+    data = yaml.safe_load(generate.DATA.read_text(encoding="utf-8"))
+    data[generate._ASSET_ROOT_KEY] = str(generate.DATA.parent)
+    return data
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    cache = generate._DATA_SNAPSHOTS
+    ref = repr(previous_load())
+    with tempfile.TemporaryDirectory() as tmp:
+        cache.root = Path(tmp)
+
+        def wipe() -> None:
+            for p in Path(tmp).glob("*.pickle"):
+                p.unlink()
+
+        cache.enabled = False
+        parsed = generate.load()
+        cache.enabled = True
+        wipe()
+        miss = generate.load()
+        hit = generate.load()
+        for name, d in (("C loader", parsed), ("snapshot miss", miss), ("snapshot hit", hit)):
+            if not identical(repr(d), ref, f"{name} record differs from yaml.safe_load"):
+                return 1
+
+        t_prev = best_of(previous_load, args.repeat)
+        cache.enabled = False
+        t_c = best_of(generate.load, args.repeat)
+        cache.enabled = True
+        t_cold = best_of(generate.load, args.repeat, before=wipe)
+        generate.load()
+        t_warm = best_of(generate.load, args.repeat)
+
+    lines = generate.DATA.read_text(encoding="utf-8").count("\n")
+    print(f"data.yaml: {lines} lines, loader {cache.loader_version()}")
+    print(f"{'variant':>24} {'ms':>8} {'speedup':>8}")
+    for name, t in (("yaml.safe_load (prev)", t_prev), ("C loader, no snapshot", t_c),
+                    ("cold (miss + write)", t_cold), ("warm (snapshot hit)", t_warm)):
+        print(f"{name:>24} {t * 1000:>8.1f} {t_prev / t:>8.1f}")
+    print(f"identical record (repr, incl. _asset_root): OK (best of {args.repeat})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Graph queries at scale: the per-question scans of a baseline revision of
+generate.py vs the per-snapshot `graph_index`, on data.yaml grown 10×, 100×
+and 1000×.
+
+The graph is grown by cloning every event and publication under suffixed
+ids, with `parent_id` / `target_event` remapped into the same clone, so
+series, sub-events and main posts keep their shape at every scale. At each
+scale the queries a build asks are timed on a fixed sample of events
+(`event_anchors`, `_has_landing_terminal`), plus one `series_representation`
+and one `p_publications` per snapshot. The current figures include building
+the index. Every answer must equal the baseline's before any timing is
+reported. The default baseline is the revision before the GraphIndex commit,
+found by its subject (scripts/_bench.py), so later commits do not move it.
+
+Usage:
+    python3 scripts/bench_graph_index.py                       # before GraphIndex, 10/100/1000×
+    python3 scripts/bench_graph_index.py --baseline <rev> --scales 10 100 --sample 50
+"""
+import argparse
+import copy
+import logging
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+from _bench import identical, load_baseline, revision_before, timed  # noqa: E402
+
+
+def grown(d: dict, scale: int) -> dict:
+    out = {k: v for k, v in d.items() if not k.startswith("_")}
+    out["_asset_root"] = d.get("_asset_root")
+    events, pubs = list(d.get("events") or []), list(d.get("publications") or [])
+    for i in range(1, scale):
+        sfx = f"~{i}"
+        for e in d.get("events") or []:
+            c = copy.deepcopy(e)
+            c["id"] = f"{e['id']}{sfx}"
+            if "parent_id" in c:
+                c["parent_id"] = f"{c['parent_id']}{sfx}"
+            events.append(c)
+        for p in d.get("publications") or []:
+            c = copy.deepcopy(p)
+            c["id"] = f"{p.get('id')}{sfx}"
+            if c.get("target_event"):
+                c["target_event"] = f"{c['target_event']}{sfx}"
+            pubs.append(c)
+    out["events"], out["publications"] = events, pubs
+    return out
+
+
+def run(mod: types.ModuleType, d: dict, sample: "list[str]") -> "tuple[float, list]":
+    return timed(lambda: [[mod.event_anchors(d, i, only_live=False) for i in sample],
+                          [mod._has_landing_terminal(d, i) for i in sample],
+                          mod.series_representation(d, lambda e: True),
+                          mod.p_publications(d)])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--baseline", default="",
+                    help="git revision of the baseline generate.py (default: before user-021)")
+    ap.add_argument("--scales", type=int, nargs="*", default=[10, 100, 1000])
+    ap.add_argument("--sample", type=int, default=100, help="events queried per scale")
+    args = ap.parse_args()
+    logging.disable(logging.WARNING)           # ⊥-свидетели (presence, Spec) — шум, не замер
+
+    args.baseline = args.baseline or revision_before("user-021")
+    base = load_baseline(args.baseline)
+    d0 = generate.load()
+    print(f"{'scale':>6} {'events':>8} {'pubs':>8} {'baseline s':>11} {'index s':>9} {'speedup':>8}")
+    for scale in [1, *args.scales]:
+        d = grown(d0, scale)
+        ids = [e["id"] for e in d["events"]]
+        sample = ids[:: max(1, len(ids) // args.sample)][: args.sample]
+        t_base, want = run(base, d, sample)
+        d.pop(generate._GRAPH_INDEX_KEY, None)
+        t_cur, got = run(generate, d, sample)
+        if not identical(got, want, f"answers differ from {args.baseline} at {scale}×"):
+            return 1
+        print(f"{scale:>6} {len(d['events']):>8} {len(d['publications']):>8} "
+              f"{t_base:>11.3f} {t_cur:>9.3f} {t_base / t_cur:>8.1f}")
+    print(f"identical answers with {args.baseline}: OK ({args.sample} sampled events per scale)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
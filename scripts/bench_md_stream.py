@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Static-markdown memory benchmark: `_md_static_to_html` (whole string) vs
+`_md_static_iter` streamed through `_write`, both written to a scratch file.
+Static pages add `_judged` on top of the stream (the raw-markdown judge over
+the joined body), which keeps the rendered body; that check is
+scripts/check_stream_judge.py, this bench measures the bare stream.
+
+Builds a synthetic conspectus-shaped document (headings, verse paragraphs,
+lists, tables, quotes, rules) of N lines, checks that the streamed file is
+byte-identical to the string render, then reports tracemalloc peak for both
+at several lengths. The streamed peak grows only with the heading-anchor set
+(`seen`, needed for unique ids), not with the document text.
+
+The block cache is disabled for the run (both paths render cold).
+
+Usage:
+    python3 scripts/bench_md_stream.py                  # 5k, 20k, 50k lines
+    python3 scripts/bench_md_stream.py --lines 50000
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+from _bench import identical, measure  # noqa: E402
+
+_BLOCKS = [
+    "## Раздел {i}",
+    "Первая строка абзаца {i} в «кавычках»\nвторая строка с **выделением\nчерез перенос** и *курсивом*",
+    "- пункт {i}\n  продолжение пункта\n- второй пункт [ссылка](https://olgarozet.ru)",
+    "1. нумерованный {i}\n2. второй",
+    "> Цитата {i}\n> вторая строка",
+    "| Колонка | Число |\n|:--|--:|\n| строка {i} | {i} |",
+    "### Подраздел {i}",
+    "---",
+]
+
+
+def synthetic(lines: int) -> str:
+    out: list[str] = ["# Синтетический конспект", "12 мая 2026 · автор", ""]
+    i = 0
+    while len(out) < lines:
+        out.extend(_BLOCKS[i % len(_BLOCKS)].format(i=i).split("\n"))
+        out.append("")
+        i += 1
+    return "\n".join(out[:lines])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, nargs="*", default=[5_000, 20_000, 50_000])
+    ap.add_argument("--line-mode", default="verse", choices=("verse", "flow"))
+    args = ap.parse_args()
+    generate._MD_BLOCK_CACHE.enabled = False
+
+    print(f"{'lines':>8} {'doc KiB':>8} {'string peak KiB':>16} {'stream peak KiB':>16} "
+          f"{'string s':>9} {'stream s':>9}")
+    def string(path: Path, doc: str) -> None:
+        generate._write(path, generate._md_static_to_html(doc, args.line_mode))
+
+    def stream(path: Path, doc: str) -> None:
+        generate._write(path, generate._interleave(
+            "\n", generate._md_static_iter(doc, args.line_mode)))
+
+    tmp = tempfile.TemporaryDirectory()
+    a, b = Path(tmp.name) / "string.html", Path(tmp.name) / "stream.html"
+    for n in args.lines:
+        doc = synthetic(n)
+        string(a, doc)
+        stream(b, doc)
+        if not identical(b.read_bytes(), a.read_bytes(),
+                         f"streamed output differs from string render at {n} lines"):
+            return 1
+        t_str, p_str = measure(lambda: string(a, doc))
+        t_stm, p_stm = measure(lambda: stream(b, doc))
+        print(f"{n:>8} {len(doc.encode()) / 1024:>8.0f} {p_str / 1024:>16.0f} "
+              f"{p_stm / 1024:>16.0f} {t_str:>9.2f} {t_stm:>9.2f}")
+    tmp.cleanup()
+    print("byte-identical: OK (peaks exclude the input string, which both paths hold)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Static-markdown tokenizer throughput: lines per second of `_md_static_to_html`
+(line classifier + block state machine) against a baseline revision of
+generate.py taken from git.
+
+The baseline module is compiled from `git show REV:generate.py` under the same
+`__file__`, so it resolves the same typography rules and data; its caches
+(the rule pack included) go to a scratch directory (scripts/_bench.py).
+Both renders of the synthetic document (scripts/bench_md_stream.py) must be
+byte-identical, in both line modes, before any timing is reported. The block cache is disabled for
+both sides (where the revision has one): every line is classified and
+rendered cold. The default baseline is the last revision before the
+table-driven tokenizer, found by the subject of its commit (scripts/_bench.py)
+rather than a hash, so neither later commits nor a rebase move or break it.
+
+Usage:
+    python3 scripts/bench_md_tokenizer.py                    # baseline = before the tokenizer
+    python3 scripts/bench_md_tokenizer.py --baseline <rev> --lines 20000 --repeat 5
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import generate  # noqa: E402
+from bench_md_stream import synthetic  # noqa: E402
+from _bench import best_of, identical, load_baseline, revision_before  # noqa: E402
+
+# Классификатор строк и машина блоков пришли коммитом «[user-010] …»; база — его родитель.
+TOKENIZER_REQUEST = "user-010"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--baseline", default="",
+                    help="git revision of the baseline generate.py (default: before user-010)")
+    ap.add_argument("--lines", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    args.baseline = args.baseline or revision_before(TOKENIZER_REQUEST)
+    base = load_baseline(args.baseline)
+    for mod in (generate, base):
+        cache = getattr(mod, "_MD_BLOCK_CACHE", None)   # ревизии до кэша блоков его не имеют
+        if cache is not None:
+            cache.enabled = False
+    doc = synthetic(args.lines)
+
+    for mode in ("verse", "flow"):
+        if not identical(generate._md_static_to_html(doc, mode), base._md_static_to_html(doc, mode),
+                         f"{mode} render differs from {args.baseline}"):
+            return 1
+
+    print(f"{'line mode':>10} {'baseline l/s':>13} {'current l/s':>12} {'ratio':>6}")
+    for mode in ("verse", "flow"):
+        t_base = best_of(lambda: base._md_static_to_html(doc, mode), args.repeat)
+        t_cur = best_of(lambda: generate._md_static_to_html(doc, mode), args.repeat)
+        print(f"{mode:>10} {args.lines / t_base:>13.0f} {args.lines / t_cur:>12.0f} "
+              f"{t_base / t_cur:>6.2f}")
+    print(f"byte-identical with {args.baseline}: OK ({args.lines} lines, best of {args.repeat})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Page assembly memory benchmark: string path (`Projection.render()` → one
+joined page → `_write`) vs fragment path (`Projection.fragments()` →
+`writelines` inside the same `_write`), on the largest projections.
+
+Both paths write the same page into a scratch directory; the two files must
+be byte-identical and have the same mode before any measurement is reported.
+tracemalloc peak is taken per path with the render caches already warm, so the
+difference is the assembly itself (body join, `_layout` f-string, final concatenation), not the
+markdown or the landing phases.
+
+Usage:
+    python3 scripts/bench_page_assembly.py          # static:styles-vs-trends, landing:paris-2026-09
+    python3 scripts/bench_page_assembly.py --pages landing:paris-2026-09
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+from _bench import identical, measure  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--pages", nargs="*",
+                    default=["static:styles-vs-trends", "landing:paris-2026-09"])
+    args = ap.parse_args()
+
+    d = generate.load(typeset=True)
+    by_label = {p.label: p for p in generate.page_projections(d)}
+    missing = [lab for lab in args.pages if lab not in by_label]
+    if missing:
+        print(f"FAIL: no such projection: {', '.join(missing)}")
+        return 1
+    generate._warm_render_caches(d)
+
+    print(f"{'page':>28} {'KiB':>6} {'string peak KiB':>16} {'stream peak KiB':>16} "
+          f"{'string s':>9} {'stream s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for lab in args.pages:
+            pr = by_label[lab]
+            a, b = Path(tmp) / "string.html", Path(tmp) / "stream.html"
+            generate._write(a, pr.render())                  # прогрев + эталон
+            generate._write(b, pr.fragments())
+            if not (identical(b.read_bytes(), a.read_bytes(),
+                              f"{lab}: fragment write differs from the string write")
+                    and identical(b.stat().st_mode, a.stat().st_mode,
+                                  f"{lab}: fragment write mode {b.stat().st_mode:o} "
+                                  f"!= string write mode {a.stat().st_mode:o}")):
+                return 1
+            t_str, p_str = measure(lambda: generate._write(a, pr.render()))
+            t_stm, p_stm = measure(lambda: generate._write(b, pr.fragments()))
+            print(f"{lab:>28} {a.stat().st_size / 1024:>6.0f} {p_str / 1024:>16.0f} "
+                  f"{p_stm / 1024:>16.0f} {t_str:>9.3f} {t_stm:>9.3f}")
+    print("byte-identical: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Parallel landing build: serial vs process-pool `render_projections` on a
+synthetic dataset of N event landings (default 200).
+
+The synthetic events are clones of the landing-capable events in data.yaml
+(lead + sections) under fresh ids, appended to the real snapshot. The
+pooled output must be byte-identical to the serial one, in the same order,
+before any timing is reported.
+
+Usage:
+    python3 scripts/bench_parallel_landings.py                  # 200 events, 2/4/cpu workers
+    python3 scripts/bench_parallel_landings.py --events 200 --workers 2 8
+"""
+import argparse
+import copy
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+import site_page  # noqa: E402
+from _bench import identical, timed  # noqa: E402
+
+
+def synthetic(d: dict, n: int) -> "list[generate.Projection]":
+    templates = [ev for ev in d.get("events") or [] if ev.get("lead") and ev.get("sections")]
+    if not templates:
+        raise SystemExit("no landing-capable event (lead + sections) in data.yaml")
+    clones = []
+    for i in range(n):
+        ev = copy.deepcopy(templates[i % len(templates)])
+        ev["id"] = f"{ev['id']}-synth-{i:03d}"
+        clones.append(ev)
+    d["events"] = list(d.get("events") or []) + clones
+    return [generate.Projection(f"landing:{ev['id']}", site_page.Page(ev["id"]).file,
+                                lambda ev=ev: generate.p_event_landing(d, ev))
+            for ev in clones]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--events", type=int, default=200)
+    ap.add_argument("--workers", type=int, nargs="*",
+                    default=sorted({2, 4, os.cpu_count() or 1}))
+    args = ap.parse_args()
+
+    d = generate.load(typeset=True)
+    pages = synthetic(d, args.events)
+    generate._warm_render_caches(d)
+
+    t_serial, serial = timed(lambda: generate.render_projections(pages, workers=1))
+    print(f"{'workers':>8} {'seconds':>8} {'speedup':>8}")
+    print(f"{1:>8} {t_serial:>8.2f} {1.0:>8.2f}")
+    for w in args.workers:
+        if w <= 1:
+            continue
+        dt, pooled = timed(lambda: generate.render_projections(pages, workers=w))
+        if not identical(pooled, serial, f"{w} workers differ from the serial build"):
+            return 1
+        print(f"{w:>8} {dt:>8.2f} {t_serial / dt:>8.2f}")
+    print(f"byte-identical to serial: OK ({len(pages)} landings, cpu_count={os.cpu_count()})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Series representation: the previous O(P·E) body (reproduced below as
+`reference`) vs the linear `generate.series_representation`.
+
+First a randomized comparison: R random graphs (parents, parts, orphans whose
+parent is missing, duplicate and integer ids, int/str parent_id mixes, mixed
+`skoro_state`) under random membership predicates must give the same mapping
+from both. Then a timing on S series of K parts each: the reference converts
+and compares ids O(S·E) times, the linear version looks each parent up once.
+Member-predicate calls (the full visibility gate) are counted for both; the
+linear version evaluates it at most once per event.
+
+Usage:
+    python3 scripts/bench_series_representation.py                 # 500 graphs, 2000 series × 4
+    python3 scripts/bench_series_representation.py --graphs 2000 --series 5000 --parts 3 --seed 7
+"""
+import argparse
+import collections
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+from _bench import identical, timed  # noqa: E402
+
+
+def reference(d: dict, member) -> dict:
+    """The body `series_representation` had before the index — kept verbatim."""
+    children = collections.defaultdict(list)
+    for e in d.get("events", []):
+        if "parent_id" in e:
+            children[e["parent_id"]].append(e)
+    rep: dict = {}
+    for parent_id, sub_events in children.items():
+        if not any(str(e.get("id")) == str(parent_id) and member(e)
+                   for e in d.get("events", [])):
+            continue
+        first_child = sub_events[0]
+        if first_child.get("skoro_state", "pending") == "pending":
+            rep.update({str(c.get("id")): str(parent_id) for c in sub_events})
+        else:
+            rep[str(parent_id)] = str(first_child.get("id"))
+    return rep
+
+
+def random_graph(rng: random.Random) -> dict:
+    ids = [f"e{i}" if rng.random() < 0.8 else i for i in range(rng.randint(0, 40))]
+    ids += rng.sample(ids, k=min(len(ids), rng.randint(0, 3)))          # duplicate ids
+    events = []
+    for i in ids:
+        e = {"id": i, "broadcast": rng.sample(["site", "telegram", "landing_section"],
+                                              k=rng.randint(0, 2))}
+        if ids and rng.random() < 0.5:
+            parent = rng.choice(ids + ["missing"])
+            e["parent_id"] = str(parent) if rng.random() < 0.3 else parent
+        if rng.random() < 0.5:
+            e["skoro_state"] = rng.choice(["pending", "published", "live"])
+        events.append(e)
+    rng.shuffle(events)
+    return {"events": events}
+
+
+def many_series(series: int, parts: int) -> dict:
+    events = []
+    for s in range(series):
+        events.append({"id": f"series-{s}", "broadcast": ["site"]})
+        for k in range(parts):
+            events.append({"id": f"series-{s}-part-{k}", "parent_id": f"series-{s}",
+                           "broadcast": ["site"],
+                           **({"skoro_state": "published"} if s % 3 == 0 else {})})
+    return {"events": events}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--graphs", type=int, default=500)
+    ap.add_argument("--series", type=int, default=2000)
+    ap.add_argument("--parts", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    for n in range(args.graphs):
+        d = random_graph(rng)
+        salt = rng.random()
+        member = (lambda s: lambda e: hash((str(e.get("id")), s)) % 3 != 0)(salt)
+        want = reference(d, member)
+        got = generate.series_representation(d, member)
+        if not identical(list(got.items()), list(want.items()),
+                         f"graph #{n} (seed {args.seed}) differs from the reference"):
+            print(f"  reference: {want}\n  linear:    {got}")
+            return 1
+    print(f"randomized: {args.graphs} graphs identical to the reference (seed {args.seed})")
+
+    d = many_series(args.series, args.parts)
+    calls = {"n": 0}
+
+    def member(e: dict) -> bool:
+        calls["n"] += 1
+        return generate.visible(e, "site", "2026-01-01")
+
+    rows = []
+    for name, fn in (("reference", reference), ("linear", generate.series_representation)):
+        calls["n"] = 0
+        d.pop(generate._GRAPH_INDEX_KEY, None)      # индекс строится в замер
+        dt, out = timed(lambda: fn(d, member))
+        rows.append((name, dt, calls["n"], out))
+    if not identical(rows[1][3], rows[0][3], "many-series mapping differs from the reference"):
+        return 1
+    print(f"{len(d['events'])} events, {args.series} series × {args.parts} parts")
+    print(f"{'':>10} {'seconds':>9} {'member calls':>13}")
+    for name, dt, n, _ in rows:
+        print(f"{name:>10} {dt:>9.3f} {n:>13}")
+    print(f"speedup ×{rows[0][1] / rows[1][1]:.0f}, identical mapping: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
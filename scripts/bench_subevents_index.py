@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Sub-event lookup for landings: per-landing `sorted_events` scan vs the
+per-snapshot `landing_children` index.
+
+Builds a synthetic snapshot of P parent events, each with S sub-events
+broadcast to `landing_section` (mixed past / ongoing / future windows, so the
+visibility gate really filters), then resolves every parent's sub-events
+both ways. The per-parent lists must be identical (same events, same order)
+before any timing is reported.
+
+Usage:
+    python3 scripts/bench_subevents_index.py                    # 200 parents × 3 sub-events
+    python3 scripts/bench_subevents_index.py --parents 300 --subs 4
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+from _bench import identical, timed  # noqa: E402
+
+
+def synthetic(parents: int, subs: int) -> dict:
+    today = date.today()
+    events = []
+    for p in range(parents):
+        pid = f"parent-{p:04d}"
+        events.append({"id": pid, "title": pid, "broadcast": ["site"], "status": "PLANNING",
+                       "t_key": (today + timedelta(days=p % 90)).isoformat()})
+        for s in range(subs):
+            start = today + timedelta(days=(p * 7 + s * 13) % 120 - 30)   # часть — в прошлом
+            events.append({"id": f"{pid}-sub-{s}", "parent_id": pid, "title": f"sub {s}",
+                           "broadcast": ["landing_section"], "status": "PLANNING",
+                           "t_key": start.isoformat(),
+                           "t_end": (start + timedelta(days=s % 3)).isoformat()})
+    return {"events": events}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--parents", type=int, default=200)
+    ap.add_argument("--subs", type=int, default=3)
+    args = ap.parse_args()
+
+    d = synthetic(args.parents, args.subs)
+    slugs = [e["id"] for e in d["events"] if not e.get("parent_id")]
+
+    t_scan, scan = timed(lambda: {slug: [se for se in generate.sorted_events(d, "landing_section")
+                                         if se.get("parent_id") == slug] for slug in slugs})
+    t_index, index = timed(lambda: {slug: generate.landing_children(d).get(slug, [])
+                                    for slug in slugs})
+
+    def ids(by_slug: dict) -> dict:
+        return {s: [e["id"] for e in by_slug[s]] for s in slugs}
+
+    if not identical(ids(index), ids(scan), "index differs from the per-landing scan"):
+        return 1
+    n_events = len(d["events"])
+    shown = sum(len(v) for v in index.values())
+    print(f"events={n_events} landings={len(slugs)} visible sub-events={shown}")
+    print(f"{'per-landing scan':>18} {t_scan:>8.3f} s")
+    print(f"{'snapshot index':>18} {t_index:>8.3f} s   ×{t_scan / t_index:.0f}")
+    print("identical per-landing sub-event lists: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Typography benchmark: compiled `generate._typo` vs `reference` below (the
+pass-by-pass chain it replaced, kept here as the byte-identity oracle).
+
+Feeds both every string of data.yaml — each leaf, its blank-line paragraphs and
+its lines (the granularities renderers hand to `_typo`) — asserts byte-identical
+output, then times both over the same corpus.
+
+Usage:
+    python3 scripts/bench_typography.py               # 20 rounds, lang=ru
+    python3 scripts/bench_typography.py --rounds 100 --lang en
+"""
+import argparse
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import yaml  # noqa: E402
+
+import generate  # noqa: E402
+from _bench import best_of  # noqa: E402
+
+
+def reference(s: str, lang: str = "ru") -> str:
+    """The pass-by-pass chain `generate._typo` was before the compiled plan — kept
+    verbatim (module names qualified) as the byte-identity oracle."""
+    if not s:
+        return s
+    pack = generate._TYPO_ENGINE.pack(lang)
+    unit_re, prep_re, before_re, around_re, replacements, quote_re = pack.compiled
+    out = s
+    if quote_re is not None:
+        out = quote_re[0].sub(r"\1" + quote_re[1] + r"\2" + quote_re[2], out)
+    for _a, _b in replacements:
+        out = out.replace(_a, _b)
+    if unit_re is not None:
+        out = unit_re.sub(r"\1" + generate._NBSP + r"\2", out)
+    if prep_re is not None:
+        out = prep_re.sub(r"\1" + generate._NBSP, out)
+    if before_re is not None:
+        out = before_re.sub(generate._NBSP, out)
+    if around_re is not None:
+        out = around_re.sub(r"\1" + generate._NBSP, out)
+    # Inv-TYPO-apostrophe-curly: straight ' → curly ’ (U+2019).
+    # Conservative: only between alphanumeric boundaries (don't touch code/quotes).
+    out = re.sub(r"(\w)'(\w)", r"\1’\2", out, flags=re.UNICODE)
+    # Inv-TYPO-typographic-quotes: ASCII " → locale's outer guillemets via pair-walk.
+    # Governing locale = text's overall locale (admin 2026-05-11). Pair-walk depth:
+    # 0 = next " is OPEN, 1 = next " is CLOSE. Idempotent (no ASCII " → no-op).
+    if pack.outer_quotes is not None and '"' in out:
+        q_open, q_close = pack.outer_quotes
+        buf, depth = [], 0
+        for ch in out:
+            if ch == '"':
+                buf.append(q_open if depth == 0 else q_close)
+                depth ^= 1
+            else:
+                buf.append(ch)
+        out = "".join(buf)
+    # Inv-TYPO-em-dash-not-hyphen (compound case): «\w+—\w+» tight em-dash between
+    # word-chars (no surrounding spaces) = compound word with WRONG em-dash; fix к hyphen.
+    # Spaces around em-dash preserved (parenthetical/dialogue context).
+    out = re.sub(r"(?<=\w)—(?=\w)", "-", out, flags=re.UNICODE)
+    # Inv-TYPO-vulgar-fraction-glyph: «1/2» → «½», «3/4» → «¾», etc.
+    # Non-standard pairs (5/9, 7/13, …) → fraction-slash form `N⁄M`.
+    out = generate._vulgar_fractions_apply(out)
+    # Inv-TYPO-en-dash-vs-em — Spec proof is `deferred` (Phase 3: text-scan + admin
+    # discipline). The earlier eager `(\d)-(\d)→\1–\2` substitution mangled ISO dates
+    # «2026-05-13»→«2026–05–13» and phone numbers system-wide; removed to match the Spec.
+    return out
+
+
+def corpus(node, out: list[str]) -> list[str]:
+    """Every string leaf of `node`, plus its paragraphs and lines."""
+    if isinstance(node, dict):
+        for v in node.values():
+            corpus(v, out)
+    elif isinstance(node, list):
+        for v in node:
+            corpus(v, out)
+    elif isinstance(node, str):
+        out.append(node)
+        if "\n" in node:
+            out.extend(p.strip() for p in node.split("\n\n") if p.strip())
+            out.extend(l for l in node.split("\n") if l)
+    return out
+
+
+def over(fn, strings: list[str], lang: str):
+    """Один проход `fn` по корпусу — единица замера."""
+    def run() -> None:
+        for s in strings:
+            fn(s, lang)
+    return run
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rounds", type=int, default=20)
+    ap.add_argument("--lang", default="ru")
+    args = ap.parse_args()
+
+    strings = corpus(yaml.safe_load((ROOT / "data.yaml").read_text(encoding="utf-8")), [])
+    pack = generate._TYPO_ENGINE.pack(args.lang)
+    print(f"corpus: {len(strings)} strings, {sum(map(len, strings))} chars; "
+          f"rules: {pack.path or '∅ (no rule file — _typo is near no-op)'} v{pack.version}")
+
+    diverged = [s for s in strings
+                if generate._typo(s, args.lang) != reference(s, args.lang)]
+    if diverged:
+        print(f"FAIL: {len(diverged)} strings diverge from the reference chain:")
+        for s in diverged[:10]:
+            print(f"  {s[:80]!r}")
+        return 1
+    print("byte-identical: OK")
+
+    ref = best_of(over(reference, strings, args.lang), args.rounds)
+    new = best_of(over(generate._typo, strings, args.lang), args.rounds)
+    per = 1e6 / max(len(strings), 1)
+    print(f"reference chain: {ref * 1e3:8.2f} ms/corpus  {ref * per:6.2f} µs/string")
+    print(f"compiled plan:   {new * 1e3:8.2f} ms/corpus  {new * per:6.2f} µs/string")
+    print(f"speedup:         {ref / new:8.2f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
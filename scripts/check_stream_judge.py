@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Streamed static-page body regression check: Inv-SITE-no-raw-markdown must hold
+for the stream exactly as for the string render.
+
+`_md_static_iter` judges each fragment on its own, so a pair split by a block
+boundary (`цена 5 *руб` / `и 3* шт`) is clean in every fragment and raw only
+in the joined body. Static pages stream their body (`_document_body_fragments`
+→ `p_static_page_fragments`); each case below must be refused by the stream
+iff `_md_static_to_html` refuses it, and an accepted stream must join to the
+string render.
+
+Usage:
+    python3 scripts/check_stream_judge.py
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate  # noqa: E402
+
+CASES = [
+    "цена 5 *руб\n\nи 3* шт",                       # em across paragraphs
+    "**начало\n\n- пункт** конец",                   # strong: paragraph → list
+    "> цитата *раз\n\n## Заголовок*",                # em: quote → heading
+    "[текст\n\nссылки](https://olgarozet.ru)",       # link split by a blank line
+    "строка *курсив* и **жирный**\n\nвторой абзац",  # clean: must pass
+    "первая *строка\nвторая* строка",                # pair across lines of ONE block: rendered
+]
+
+
+def refused(fn) -> "tuple[bool, str]":
+    try:
+        return False, fn()
+    except generate.RawMarkdownError:
+        return True, ""
+
+
+def main() -> int:
+    argparse.ArgumentParser(description=__doc__.strip().splitlines()[0]).parse_args()
+    generate._MD_BLOCK_CACHE.enabled = False
+    bad = []
+    for i, md in enumerate(CASES):
+        want, html = refused(lambda: generate._md_static_to_html(md))
+        got, streamed = refused(
+            lambda: "\n".join(generate._document_body_fragments(md)[1]))
+        if want != got or streamed != html:
+            bad.append(f"#{i} string {'refused' if want else 'ok'}, "
+                       f"stream {'refused' if got else 'ok'}: {md!r}")
+    if bad:
+        print("FAIL: streamed body judged differently from the string render:")
+        print("\n".join(f"  {b}" for b in bad))
+        return 1
+    print(f"{len(CASES)} cases: stream refuses exactly what the string render refuses: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
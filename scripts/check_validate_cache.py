@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+validate_cached regression check: a cached EventModel must not share nested
+objects with the raw dict it was first built from.
+
+validate() keeps `pricing`, `cohort` and the `extra` values by reference. The
+cache used to build its model from the first caller's dict, so an in-place
+edit of that dict afterwards (`ev["pricing"]["fee"] = 999`) leaked into the
+model every later caller with the original content got back. Each case below
+validates through the cache, mutates the first dict, then validates a fresh
+dict with the original content; the answer must equal plain validate().
+Events from data.yaml are checked the same way when it is present.
+
+Usage:
+    python3 scripts/check_validate_cache.py
+"""
+import argparse
+import copy
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import event_schema  # noqa: E402
+
+CASES = [
+    {"id": "x", "title": "T", "pricing": {"fee": 100}},
+    {"id": "y", "title": "T", "cohort": {"size": 12, "notes": ["a"]}},
+    {"id": "z", "title": "T", "custom": {"nested": [1, 2]}},
+]
+
+
+def mutate(obj) -> bool:
+    """Edit the first nested container found in place; False if there is none."""
+    for v in (obj.values() if isinstance(obj, dict) else obj):
+        if isinstance(v, dict):
+            v["__edited__"] = 999
+            return True
+        if isinstance(v, list):
+            v.append(999)
+            return True
+    return False
+
+
+def leaks(ev: dict) -> bool:
+    fresh = copy.deepcopy(ev)
+    try:
+        event_schema.validate_cached(ev)
+    except event_schema.InvalidEvent:
+        return False
+    if not mutate(ev):
+        return False
+    return vars(event_schema.validate_cached(fresh)) != vars(event_schema.validate(fresh))
+
+
+def main() -> int:
+    argparse.ArgumentParser(description=__doc__.strip().splitlines()[0]).parse_args()
+    events = copy.deepcopy(CASES)
+    data = ROOT / "data.yaml"
+    if data.exists():
+        import yaml
+        events += (yaml.safe_load(data.read_text(encoding="utf-8")) or {}).get("events") or []
+    event_schema.clear_validate_cache()
+    bad = [str(ev.get("id")) for ev in events if leaks(ev)]
+    if bad:
+        print(f"FAIL: cached model follows in-place edits of the first dict: {', '.join(bad)}")
+        return 1
+    print(f"{len(events)} events: cached models own their nested data: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())